@@ -0,0 +1,30 @@
+"""
+Parse cache benchmark: a field receiving a small set of repeated values,
+parsed with and without `Coerce.cached`.
+
+Usage:
+    python -m benchmarks.bench_cache [values]
+"""
+import sys
+import time
+
+from booze import Coerce
+
+
+def main(n: int = 500_000) -> None:
+    statuses = ['ACTIVE', 'INACTIVE', 'PENDING', 'BLOCKED', 'DELETED']
+    values = [statuses[i % len(statuses)] for i in range(n)]
+    plain = Coerce('status').string().lowercase().length(3, 10)
+    cached = Coerce('status').string().lowercase().length(3, 10).cached(maxsize=64)
+
+    for name, coercer in (('plain', plain), ('cached', cached)):
+        parse = coercer.parse
+        start = time.perf_counter()
+        for value in values:
+            parse(value)
+        print(f'{name}: {n / (time.perf_counter() - start):,.0f} values/s')
+    print(cached.parse_cache.info())
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,41 @@
+"""
+Columnar validation benchmark: row-wise `Base.parse_many` against
+`Base.validate_columns`, with the active backend (NumPy if installed,
+the `array` module otherwise).
+
+Usage:
+    python -m benchmarks.bench_columns [rows]
+"""
+import sys
+import time
+
+from booze import Base, Coerce, columnar
+
+
+class Sample(Base):
+    value = Coerce('value').float().min(0).max(1000)
+    count = Coerce('count').integer().min(0).max(1_000_000)
+    label = Coerce('label').string().length(1, 20)
+
+
+def main(rows: int = 200_000) -> None:
+    columns = {
+        'value': [i % 1500 + 0.5 for i in range(rows)],
+        'count': list(range(rows)),
+        'label': [f'label-{i % 50}' for i in range(rows)],
+    }
+    records = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    backend = 'numpy' if columnar.numpy is not None else 'array'
+
+    start = time.perf_counter()
+    Sample.parse_many(records, errors=[])
+    print(f'parse_many: {rows / (time.perf_counter() - start):,.0f} rows/s')
+
+    start = time.perf_counter()
+    Sample.validate_columns(columns)
+    print(f'validate_columns ({backend}): '
+          f'{rows / (time.perf_counter() - start):,.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,34 @@
+"""
+Construction throughput benchmark for Base subclasses.
+
+Usage:
+    python -m benchmarks.bench_construction [iterations]
+
+Set BOOZE_NO_CODEGEN=1 to measure the interpreted constructor.
+"""
+import sys
+import timeit
+
+from booze import Base, Coerce
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 30)
+    age = Coerce('age').integer().min(0).max(130)
+    email = Coerce('email').string().email()
+    active = Coerce('active').boolean()
+
+
+def build():
+    return Person(name='John Doe', age=30, email='john@example.com', active=True)
+
+
+def main(iterations: int = 100_000) -> None:
+    build()
+    elapsed = min(timeit.repeat(build, number=iterations, repeat=3))
+    print(f'{Person.__name__}: {iterations / elapsed:,.0f} objects/s '
+          f'({elapsed / iterations * 1e6:.2f} us/object)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,63 @@
+"""
+CSV ingestion benchmark: `csv.DictReader` rows parsed with `Base.parse_many`,
+against `Base.iter_parse_csv`, which resolves the header once per file.
+
+Usage:
+    python -m benchmarks.bench_csv [records]
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from booze import Base, Coerce
+
+
+class Event(Base):
+    user = Coerce('usuario').string().length(1, 30)
+    amount = Coerce('valor').float().min(0).max(10_000)
+    count = Coerce('quantidade').integer()
+
+
+def write_file(path: str, n: int) -> None:
+    with open(path, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['usuario', 'valor', 'quantidade', 'comentario'])
+        for i in range(n):
+            amount = -1 if i % 100 == 0 else i % 5000 + 0.5
+            writer.writerow([f'user-{i % 100}', amount, i, 'ok'])
+
+
+def dict_reader(path):
+    with open(path, newline='') as file:
+        records = [
+            {'user': row['usuario'], 'amount': row['valor'], 'count': row['quantidade']}
+            for row in csv.DictReader(file)
+        ]
+    return len(Event.parse_many(records, errors=[]))
+
+
+def stream(path):
+    return sum(1 for _ in Event.iter_parse_csv(path, on_error=lambda *_: None))
+
+
+def main(n: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.csv')
+        write_file(path, n)
+        for fn in (dict_reader, stream):
+            start = time.perf_counter()
+            fn(path)
+            elapsed = time.perf_counter() - start
+            # Memory is measured in a second run, tracemalloc slows allocations down.
+            tracemalloc.start()
+            fn(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'{fn.__name__}: {n / elapsed:,.0f} records/s, peak {peak / 1024:,.0f} KiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
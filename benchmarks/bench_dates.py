@@ -0,0 +1,47 @@
+"""
+Date parsing benchmark over every format of `booze.consts.date_formats`:
+the DateParser engine against trying `strptime` with each format in turn.
+
+Usage:
+    python -m benchmarks.bench_dates [values_per_format]
+"""
+import datetime
+import sys
+import time
+
+from booze.consts import date_formats
+from booze.dates import DateParser
+
+
+def strptime_loop(text: str):
+    for fmt in date_formats.values():
+        try:
+            return datetime.datetime.strptime(text, fmt).date()
+        except ValueError:
+            pass
+    return None
+
+
+def main(n: int = 2000) -> None:
+    dates = [datetime.date(1990, 1, 1) + datetime.timedelta(days=i * 7) for i in range(n)]
+    parser = DateParser()
+    totals = [0.0, 0.0]
+    print(f'{"format":<12} {"strptime/s":>12} {"engine/s":>12} {"speedup":>8}')
+    for key, fmt in date_formats.items():
+        texts = [date.strftime(fmt) for date in dates]
+        timings = []
+        for parse in (strptime_loop, parser.parse):
+            start = time.perf_counter()
+            for text in texts:
+                parse(text)
+            timings.append(time.perf_counter() - start)
+        totals = [total + timing for total, timing in zip(totals, timings)]
+        print(f'{key:<12} {n / timings[0]:>12,.0f} {n / timings[1]:>12,.0f} '
+              f'{timings[0] / timings[1]:>7.1f}x')
+    count = n * len(date_formats)
+    print(f'{"all":<12} {count / totals[0]:>12,.0f} {count / totals[1]:>12,.0f} '
+          f'{totals[0] / totals[1]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
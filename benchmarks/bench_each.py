@@ -0,0 +1,44 @@
+"""
+Element-wise list validation benchmark: a list of 100k numbers, as text (as
+read from a CSV or a form), checked with `each(Coerce().float().min(0))`,
+against parsing every element with `Coerce.parse` in a list comprehension,
+and the memory kept by each storage.
+
+Usage:
+    python -m benchmarks.bench_each [elements]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from booze import Coerce
+
+
+def measure(label: str, function, values: list) -> None:
+    start = time.perf_counter()
+    function(values)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    result = function(values)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    print(f'{label:<26} {len(values) / elapsed:>12,.0f} elements/s {size / 2 ** 20:>8.2f} MiB')
+
+
+def main(n: int = 100_000) -> None:
+    random.seed(0)
+    values = [f'{random.uniform(0, 1000):.3f}' for _ in range(n)]
+    element = Coerce().float().min(0).max(1000)
+    measure('[element.parse(v) ...]', lambda values: [element.parse(v) for v in values], values)
+    for storage in (None, 'array', 'numpy'):
+        try:
+            coercer = Coerce().list().each(element, storage=storage)
+        except ImportError:
+            continue
+        measure(f'each(storage={storage!r})', coercer.parse, values)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
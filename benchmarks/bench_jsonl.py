@@ -0,0 +1,61 @@
+"""
+JSON Lines ingestion benchmark: reading a file into a list and parsing it with
+`Base.parse_many`, against streaming it with `Base.iter_parse_jsonl`.
+
+Usage:
+    python -m benchmarks.bench_jsonl [records]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from booze import Base, Coerce, IngestStats
+
+
+class Event(Base):
+    user = Coerce('user').string().length(1, 30)
+    amount = Coerce('amount').float().min(0).max(10_000)
+    count = Coerce('count').integer()
+
+
+def write_file(path: str, n: int) -> None:
+    with open(path, 'w') as file:
+        for i in range(n):
+            amount = -1 if i % 100 == 0 else i % 5000 + 0.5
+            file.write(json.dumps({'user': f'user-{i % 100}', 'amount': amount, 'count': i}) + '\n')
+
+
+def load_all(path):
+    with open(path) as file:
+        records = [json.loads(line) for line in file]
+    return len(Event.parse_many(records, errors=[]))
+
+
+def stream(path):
+    stats = IngestStats()
+    for _ in Event.iter_parse_jsonl(path, on_error=lambda *_: None, stats=stats):
+        pass
+    return stats.valid
+
+
+def main(n: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.jsonl')
+        write_file(path, n)
+        for fn in (load_all, stream):
+            start = time.perf_counter()
+            fn(path)
+            elapsed = time.perf_counter() - start
+            # Memory is measured in a second run, tracemalloc slows allocations down.
+            tracemalloc.start()
+            fn(path)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f'{fn.__name__}: {n / elapsed:,.0f} records/s, peak {peak / 1024:,.0f} KiB')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
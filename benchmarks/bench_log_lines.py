@@ -0,0 +1,51 @@
+"""
+Log-line timestamp benchmark: a click-stream style log where thousands of
+consecutive lines share the same date and differ in time of day, parsed with
+and without the DateTimeParser date-prefix cache.
+
+Usage:
+    python -m benchmarks.bench_log_lines [lines]
+"""
+import datetime
+import random
+import sys
+import time
+
+from booze.dates import DateTimeParser
+
+PATHS = ['/', '/cart', '/checkout', '/search?q=boots', '/product/1842']
+
+
+def log_lines(n: int, date_format: str) -> list:
+    random.seed(0)
+    moment = datetime.datetime(2023, 7, 23, 0, 0, 0)
+    lines = []
+    for i in range(n):
+        moment += datetime.timedelta(seconds=random.randint(0, 40))
+        lines.append(
+            f'{moment.strftime(date_format)} {moment:%H:%M:%S} INFO '
+            f'user={random.randint(1, 10_000)} GET {random.choice(PATHS)} 200'
+        )
+    return lines
+
+
+def measure(parser: DateTimeParser, lines: list) -> float:
+    start = time.perf_counter()
+    for line in lines:
+        # The timestamp is the first two fields of the line.
+        parser.parse(line[:line.index(' ', line.index(' ') + 1)])
+    return time.perf_counter() - start
+
+
+def main(n: int = 200_000) -> None:
+    print(f'{"date format":<12} {"no cache/s":>12} {"cache/s":>12} {"speedup":>8}')
+    for date_format in ('%d.%m.%Y', '%m/%d/%Y', '%b/%d/%Y'):
+        lines = log_lines(n, date_format)
+        uncached = measure(DateTimeParser(prefix_cache=0), lines)
+        cached = measure(DateTimeParser(), lines)
+        print(f'{date_format:<12} {n / uncached:>12,.0f} {n / cached:>12,.0f} '
+              f'{uncached / cached:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""
+Membership validation benchmark: checking SKUs against 20,000 allowed values
+with `one_of` (a frozenset) against a `custom` check on the list, and
+required tags in shuffled 500-tag lists with `contains_all` / `contains_any` against
+chained `contains` calls.
+
+Usage:
+    python -m benchmarks.bench_membership [values]
+"""
+import random
+import sys
+import time
+
+from booze import Coerce
+
+
+def measure(label: str, coercer, values: list) -> None:
+    start = time.perf_counter()
+    for value in values:
+        coercer.try_parse(value)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<36} {len(values) / elapsed:>12,.0f} values/s')
+
+
+def main(n: int = 20_000) -> None:
+    random.seed(0)
+    skus = [f'SKU-{number:05d}' for number in range(20_000)]
+    values = [f'SKU-{random.randint(0, 24_999):05d}' for _ in range(n)]
+    measure('custom(value in list)', Coerce().custom(lambda value: value in skus), values)
+    measure('one_of(list)', Coerce().one_of(skus), values)
+    measure('one_of(list, case_sensitive=False)',
+            Coerce().one_of(skus, case_sensitive=False), values)
+
+    tags = [f'tag{number}' for number in range(500)]
+    lists = [random.sample(tags, 500) for _ in range(max(n // 20, 1))]
+    required = ['tag1', 'tag42', 'tag100', 'tag250', 'tag499']
+    chained = Coerce()
+    for tag in required:
+        chained.contains(tag)
+    measure('contains() x5', chained, lists)
+    measure('contains_all(5 tags)', Coerce().contains_all(required), lists)
+    measure('contains_any(5 tags)', Coerce().contains_any(required), lists)
+    many = tags[::25]
+    chained = Coerce()
+    for tag in many:
+        chained.contains(tag)
+    measure('contains() x20', chained, lists)
+    measure('contains_all(20 tags)', Coerce().contains_all(many), lists)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
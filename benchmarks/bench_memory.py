@@ -0,0 +1,44 @@
+"""
+Bytes per instance of a Base subclass, with and without `slots=True`,
+measured with tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_memory [instances]
+"""
+import sys
+import tracemalloc
+
+from booze import Base, Coerce
+
+
+class Reading(Base):
+    sensor = Coerce('sensor').string()
+    value = Coerce('value').float()
+    count = Coerce('count').integer()
+
+
+class SlottedReading(Base, slots=True):
+    sensor = Coerce('sensor').string()
+    value = Coerce('value').float()
+    count = Coerce('count').integer()
+
+
+def measure(model: type, instances: int) -> float:
+    # The field values are shared, so only the instances themselves are counted.
+    sensor, value, count = 'sensor-1', 1.5, 10
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [model(sensor=sensor, value=value, count=count) for _ in range(instances)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / instances
+
+
+def main(instances: int = 100_000) -> None:
+    for model in (Reading, SlottedReading):
+        print(f'{model.__name__}: {measure(model, instances):.1f} bytes/instance')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
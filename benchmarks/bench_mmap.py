@@ -0,0 +1,55 @@
+"""
+Memory-mapped parallel validation benchmark: `Base.iter_parse_jsonl` in one
+process against `Base.validate_jsonl_parallel` with 1, 2, 4... workers.
+
+Usage:
+    python -m benchmarks.bench_mmap [records] [chunk_bytes]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+from booze import Base, Coerce, IngestStats
+
+
+class Event(Base):
+    user = Coerce('user').string().length(1, 30)
+    email = Coerce('email').string().email()
+    amount = Coerce('amount').float().min(0).max(10_000)
+    count = Coerce('count').integer()
+
+
+def write_file(path: str, n: int) -> None:
+    with open(path, 'w') as file:
+        for i in range(n):
+            amount = -1 if i % 100 == 0 else i % 5000 + 0.5
+            file.write(json.dumps({'user': f'user-{i % 100}', 'email': f'user{i % 100}@example.com',
+                                   'amount': amount, 'count': i}) + '\n')
+
+
+def main(n: int = 400_000, chunk_bytes: int = 4 * 2**20) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'events.jsonl')
+        write_file(path, n)
+        print(f'{os.path.getsize(path) / 2**20:.0f} MiB, {os.cpu_count()} CPUs')
+
+        start = time.perf_counter()
+        for _ in Event.iter_parse_jsonl(path, on_error=lambda *_: None):
+            pass
+        print(f'streaming: {n / (time.perf_counter() - start):,.0f} records/s')
+
+        workers = 1
+        while workers <= max(os.cpu_count(), 2):
+            stats = IngestStats()
+            for _ in Event.validate_jsonl_parallel(path, workers, chunk_bytes,
+                                                   on_error=lambda *_: None, stats=stats):
+                pass
+            print(f'workers={workers}: {stats.records_per_second:,.0f} records/s '
+                  f'({stats.invalid} rejected)')
+            workers *= 2
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
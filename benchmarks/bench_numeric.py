@@ -0,0 +1,41 @@
+"""
+Numeric validation benchmark: a `min().max()` chain over typical inputs
+(ints, floats, digit strings, Decimals and non-numeric strings).
+
+Usage:
+    python -m benchmarks.bench_numeric [values]
+"""
+import sys
+import time
+from decimal import Decimal
+
+from booze import Coerce
+from booze.helpers import to_number
+
+
+def main(n: int = 200_000) -> None:
+    samples = {
+        'int': [i % 100 for i in range(n)],
+        'float': [i % 100 / 3 for i in range(n)],
+        'digit string': [str(i % 100) for i in range(n)],
+        'Decimal': [Decimal(i % 100) for i in range(n)],
+        'non-numeric': ['n/a'] * n,
+    }
+    chain = Coerce().min(-1).max(1000).validations
+    print(f'{"input":<14} {"to_number/s":>14} {"min().max()/s":>14}')
+    for label, values in samples.items():
+        start = time.perf_counter()
+        for value in values:
+            to_number(value)
+        classify = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for value in values:
+            for validation in chain:
+                validation(value, None)
+        validate = time.perf_counter() - start
+        print(f'{label:<14} {n / classify:>14,.0f} {n / validate:>14,.0f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
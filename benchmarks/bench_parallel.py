@@ -0,0 +1,45 @@
+"""
+Scaling benchmark for `Base.parse_many(..., workers=N)`, compared with
+in-process parsing.
+
+Usage:
+    python -m benchmarks.bench_parallel [records] [chunksize]
+"""
+import os
+import sys
+import time
+
+from booze import Base, Coerce
+
+
+class Event(Base):
+    user = Coerce('user').string().length(1, 30)
+    email = Coerce('email').string().email()
+    amount = Coerce('amount').float().min(0).max(10_000)
+    count = Coerce('count').integer().min(-1)
+
+
+def make_records(n: int) -> list:
+    return [
+        {'user': f'user-{i % 100}', 'email': f'user{i % 100}@example.com',
+         'amount': str(i % 5000 + 0.5), 'count': str(i)}
+        for i in range(n)
+    ]
+
+
+def run(records: list, workers, chunksize: int) -> float:
+    start = time.perf_counter()
+    Event.parse_many(records, errors=[], workers=workers, chunksize=chunksize)
+    return len(records) / (time.perf_counter() - start)
+
+
+def main(n: int = 400_000, chunksize: int = 5000) -> None:
+    records = make_records(n)
+    print(f'{os.cpu_count()} CPUs, {n:,} records, chunksize {chunksize:,}')
+    print(f'in-process: {run(records, None, chunksize):,.0f} records/s')
+    for workers in (1, 2, 4, 8):
+        print(f'workers={workers}: {run(records, workers, chunksize):,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
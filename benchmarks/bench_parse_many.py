@@ -0,0 +1,51 @@
+"""
+Bulk construction benchmark: a per-record constructor loop against
+`Base.parse_many`.
+
+Usage:
+    python -m benchmarks.bench_parse_many [records]
+"""
+import sys
+import time
+
+from booze import Base, Coerce, ParsingError
+
+
+class Event(Base):
+    user = Coerce('user').string().length(1, 30)
+    amount = Coerce('amount').float().min(0).max(10_000)
+    count = Coerce('count').integer()
+
+
+def make_records(n: int) -> list:
+    return [
+        {'user': f'user-{i % 100}', 'amount': i % 5000 + 0.5, 'count': i}
+        for i in range(n)
+    ]
+
+
+def loop(records):
+    objects, errors = [], []
+    for index, record in enumerate(records):
+        try:
+            objects.append(Event(**record))
+        except ParsingError as error:
+            errors.append((index, error))
+    return objects
+
+
+def bulk(records):
+    return Event.parse_many(records, errors=[])
+
+
+def main(n: int = 200_000) -> None:
+    records = make_records(n)
+    for fn in (loop, bulk):
+        start = time.perf_counter()
+        fn(records)
+        elapsed = time.perf_counter() - start
+        print(f'{fn.__name__}: {n / elapsed:,.0f} records/s')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,72 @@
+"""
+Timestamp-heavy records benchmark: building event records whose timestamps
+are ISO-8601 strings, against parsing the same timestamps with `strptime`,
+and timestamps with UTC offsets normalized to UTC.
+
+Usage:
+    python -m benchmarks.bench_timestamps [records]
+"""
+import datetime
+import sys
+import time
+
+from booze import Base, Coerce
+from booze.dates import DateTimeParser
+
+
+class Event(Base):
+    id = Coerce().integer()
+    created_at = Coerce().datetime()
+    updated_at = Coerce().datetime()
+    day = Coerce().date()
+
+
+def measure(label: str, function, records: list, count: int) -> None:
+    start = time.perf_counter()
+    for record in records:
+        function(record)
+    elapsed = time.perf_counter() - start
+    print(f'{label:<34} {count / elapsed:>12,.0f} timestamps/s')
+
+
+def main(n: int = 50_000) -> None:
+    start = datetime.datetime(2023, 1, 1)
+    records = []
+    for i in range(n):
+        moment = start + datetime.timedelta(seconds=i * 37)
+        records.append({
+            'id': i,
+            'created_at': moment.isoformat(sep=' '),
+            'updated_at': moment.isoformat(),
+            'day': moment.date().isoformat(),
+        })
+    count = n * 3
+    parser = DateTimeParser()
+
+    def with_strptime(record):
+        datetime.datetime.strptime(record['created_at'], '%Y-%m-%d %H:%M:%S')
+        datetime.datetime.strptime(record['updated_at'], '%Y-%m-%dT%H:%M:%S')
+        datetime.datetime.strptime(record['day'], '%Y-%m-%d').date()
+
+    def with_parser(record):
+        parser.parse(record['created_at'])
+        parser.parse(record['updated_at'])
+        parser.parse(record['day'])
+
+    measure('strptime (format known upfront)', with_strptime, records, count)
+    measure('DateTimeParser', with_parser, records, count)
+    measure('Event(**record)', lambda record: Event(**record), records, count)
+
+    offsets = ['+03:00', '-0500', 'Z', '+05:30']
+    stamped = [
+        record['updated_at'] + offsets[i % len(offsets)] for i, record in enumerate(records)
+    ]
+    utc = DateTimeParser(tz='UTC')
+    measure('strptime %z + astimezone', lambda text: datetime.datetime.strptime(
+        text.replace('Z', '+0000'), '%Y-%m-%dT%H:%M:%S%z').astimezone(datetime.timezone.utc),
+        stamped, n)
+    measure('DateTimeParser(tz=UTC)', utc.parse, stamped, n)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
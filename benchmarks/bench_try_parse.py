@@ -0,0 +1,64 @@
+"""
+Garbage-heavy input benchmark: building records where a share of them is
+invalid, with the raising constructor (`try`/`except ParsingError`) against
+`Base.try_create`, which builds no exception for a rejected record.
+
+Usage:
+    python -m benchmarks.bench_try_parse [records] [invalid_share]
+"""
+import random
+import sys
+import time
+
+from booze import Base, Coerce, ParsingError
+
+
+class Event(Base):
+    user = Coerce().string().length(3, 20)
+    amount = Coerce().float().min(0).max(10_000)
+    quantity = Coerce().integer().min(0)
+
+
+def records(n: int, invalid_share: float) -> list:
+    random.seed(0)
+    rows = []
+    for i in range(n):
+        row = {'user': f'user{i % 1000}', 'amount': i % 500 + 0.5, 'quantity': i % 7 + 1}
+        if random.random() < invalid_share:
+            row[random.choice(list(row))] = random.choice(['', 'n/a', -1, None])
+        rows.append(row)
+    return rows
+
+
+def with_exceptions(rows: list) -> int:
+    valid = 0
+    for row in rows:
+        try:
+            Event(**row)
+            valid += 1
+        except ParsingError:
+            pass
+    return valid
+
+
+def with_results(rows: list) -> int:
+    valid = 0
+    for row in rows:
+        if Event.try_create(**row):
+            valid += 1
+    return valid
+
+
+def main(n: int = 100_000, invalid_share: float = 0.3) -> None:
+    rows = records(n, float(invalid_share))
+    for label, function in (('Event(**row) + except', with_exceptions),
+                            ('Event.try_create(**row)', with_results)):
+        start = time.perf_counter()
+        valid = function(rows)
+        elapsed = time.perf_counter() - start
+        print(f'{label:<26} {n / elapsed:>12,.0f} records/s  ({valid:,} valid)')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+         float(sys.argv[2]) if len(sys.argv) > 2 else 0.3)
@@ -1,3 +1,5 @@
 from booze.coercer import Coerce
 from booze.base import Base
-from booze.errors import ParsingError
+from booze.errors import ParsingError, ParsingErrors
+from booze.result import ParseResult
+from booze.ingest import IngestStats
@@ -1,8 +1,62 @@
-import inspect
-from booze.errors import ParsingError
+import asyncio
+import os
+from types import MemberDescriptorType
+from booze.coercer import Coerce
+from booze.errors import ParsingError, ParsingErrors
+from booze.result import ParseResult
+from booze.schema import Schema
+from typing import Callable, Iterable, Iterator, Mapping, Optional, Sequence
+from booze.columnar import validate_columns
+from booze.parallel import parse_parallel
+from booze import ingest
+from booze.nested import collect
+from booze.codegen import can_generate, generate_constructors, generate_try_create
 
 
-class Base:
+# Debug switch: set BOOZE_NO_CODEGEN=1 to build every model with the interpreted
+# constructor instead of the generated one.
+CODEGEN = not os.environ.get('BOOZE_NO_CODEGEN')
+
+_MISSING = object()
+
+
+class BaseMeta(type):
+    """
+    Metaclass of Base. It implements the `slots` class option: when a model is
+    declared with `slots=True`, its Coerce fields are moved out of the class
+    namespace into `__booze_fields__` and replaced by `__slots__`, so instances
+    store their values in slots instead of a per-instance `__dict__`.
+
+    Examples:
+        >>> class Point(Base, slots=True):
+        >>>     x = Coerce().float()
+        >>>     y = Coerce().float()
+        >>> Point(x=1.0, y=2.0).__dict__ -> AttributeError
+    """
+
+    def __new__(mcls, name, bases, namespace, slots: bool = False, **kwargs):
+        if slots:
+            fields = {
+                field: coercer for field, coercer in namespace.items()
+                if not field.startswith('_') and isinstance(coercer, Coerce)
+            }
+            namespace = {
+                key: value for key, value in namespace.items()
+                if key not in fields
+            }
+            namespace['__booze_fields__'] = fields
+            namespace['__slots__'] = tuple(
+                field for field in fields
+                if not any(
+                    isinstance(getattr(base, field, None), MemberDescriptorType)
+                    for base in bases
+                )
+            )
+
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class Base(metaclass=BaseMeta):
     """
     Eng: The Base class is a metaprogramming-based class that allows automatic parsing and validation of keyword arguments
     passed during object creation. It provides a convenient way to create objects with pre-defined validation rules
@@ -63,6 +117,8 @@ class Base:
 
     """
 
+    __slots__ = ()
+
     def __new__(cls, **kwargs):
         """
         Creates a new instance of the class with the given keyword arguments, and automatically parses and validates them
@@ -80,46 +136,7 @@ class Base:
         Examples:
             >>> "See class-level examples for usage."
         """
-        parsers = {}
-        for field, Coercer in cls.__dict__.items():
-            if not str(field).startswith('_'):
-                if Coercer.name is None:
-                    Coercer.name = field
-                
-                parsers[field] = Coercer
-
-        def repr(self):
-            """
-            Return a string representation of the object.
-
-            Returns:
-                str: A string representation of the object in the format '<Class(attr1=value1, attr2=value2, ...)>'
-            """
-            string = '<'
-            string += type(self).__name__
-            string += '(' + ', '.join([
-                f"{key}='{item}'" if isinstance(item, str) else f"{key}={item}"
-                for key, item in self.__dict__.items()
-            ])
-            string += ')>'
-            return string
-
-        def to_dict(self):
-            """
-            Convert the object to a dictionary containing its attributes.
-
-            Returns:
-                dict: A dictionary containing the object's attributes and their values.
-            """
-            return {
-                key: getattr(self, key) for key in parsers
-                if not inspect.ismethod(getattr(self, key))
-            }
-
-        cls.__repr__ = repr
-        cls.__str__ = repr
-        cls.to_dict = to_dict
-
+        parsers = cls.__booze_schema__.parsers
         obj = object.__new__(cls)
         for key, value in kwargs.items():
             try:
@@ -133,3 +150,444 @@ class Base:
             obj.__setattr__(key, parsed)
 
         return obj
+
+    def __init_subclass__(cls, codegen: bool = None, **kwargs):
+        """
+        Compile the Coerce fields of the new subclass into a Schema, once, so that
+        `__new__` does not have to inspect the class on every instantiation.
+
+        Unless disabled, a constructor specialized for the schema is generated and
+        installed as the `__new__` of the subclass.
+
+        Args:
+            codegen (bool, optional): Whether to generate a specialized constructor.
+                Defaults to the module-level `CODEGEN` switch.
+
+        Examples:
+            >>> class Person(Base, codegen=False):  # interpreted constructor
+            >>>     name = Coerce().string()
+        """
+        super().__init_subclass__(**kwargs)
+        cls.__booze_codegen_option__ = codegen
+        cls.__booze_compile__()
+
+    @classmethod
+    def __booze_compile__(cls) -> None:
+        """
+        Compile the schema and constructors of the class. Called on class creation,
+        and again whenever a validator is added to one of its Coerce fields, so
+        generated constructors never run an outdated validator chain.
+        """
+        cls.__booze_schema__ = schema = Schema.compile(cls)
+
+        codegen = cls.__booze_codegen_option__
+        if codegen is None:
+            codegen = CODEGEN
+        cls.__booze_codegen__ = codegen = codegen and can_generate(schema)
+        if codegen:
+            new, create = generate_constructors(schema)
+            cls.__new__ = staticmethod(new)
+            cls.__booze_create__ = staticmethod(create)
+            cls.__booze_try_create__ = staticmethod(generate_try_create(schema))
+        else:
+            cls.__new__ = Base.__dict__['__new__']
+            cls.__booze_create__ = Base.__dict__['__booze_create__']
+            cls.__booze_try_create__ = Base.__dict__['__booze_try_create__']
+
+    @staticmethod
+    def __booze_create__(cls, kwargs: Mapping) -> 'Base':
+        """
+        Create an instance of `cls` from a mapping of field values. This is the
+        entry point of the bulk APIs; subclasses with a generated constructor
+        replace it with a version that reads the mapping directly.
+        """
+        return cls.__new__(cls, **kwargs)
+
+    @classmethod
+    def try_create(cls, **kwargs) -> ParseResult:
+        """
+        Create an instance like the constructor, but return the outcome instead of
+        raising: fields are checked with `Coerce.try_parse`, so an invalid record
+        builds no exception, and its ParsingError is only created when the
+        result's `error` is read.
+
+        Args:
+            **kwargs (dict): Keyword arguments representing the attributes of the object.
+
+        Returns:
+            ParseResult: `ok` and the instance as `value`, or the `error` of the first invalid field.
+
+        Examples:
+            >>> result = Person.try_create(name='John', age='abc')
+            >>> if result:
+            >>>     person = result.value
+            >>> else:
+            >>>     print(result.error.dict())
+        """
+        return cls.__booze_try_create__(cls, kwargs)
+
+    @staticmethod
+    def __booze_try_create__(cls, kwargs: Mapping) -> ParseResult:
+        """
+        The interpreted implementation of `try_create`; subclasses with a
+        generated constructor replace it with a generated version.
+        """
+        parsers = cls.__booze_schema__.parsers
+        obj = object.__new__(cls)
+        for key, value in kwargs.items():
+            parser = parsers.get(key)
+            if parser is None:
+                return ParseResult(False, error=ParsingError(
+                    'Erro na atribuição do valor. '
+                    'Você lembrou de cadastrar um Coercer para ela?'))
+
+            result = parser.try_parse(value)
+            if not result.ok:
+                return result
+            obj.__setattr__(key, result.value)
+
+        return ParseResult(True, obj)
+
+    @classmethod
+    def validate_all(cls, **kwargs) -> 'Base':
+        """
+        Create an instance like the constructor, but validate every field before
+        failing, so that all the errors of the object are reported at once. Fields
+        of nested models (`Coerce.model`, `Coerce.list_of`) are validated too, and
+        reported with their full path, such as 'address.zip' or 'items[1].quantity'.
+
+        Args:
+            **kwargs (dict): Keyword arguments representing the attributes of the object.
+
+        Returns:
+            Base: An instance of the class with the parsed and validated attributes.
+
+        Raises:
+            ParsingErrors: If any field is invalid or not registered, with one
+                FieldError per such field.
+
+        Examples:
+            >>> try:
+            >>>     Person.validate_all(name='Jo', age=15)
+            >>> except ParsingErrors as errors:
+            >>>     errors.dict()['Errors'] -> [
+            >>>         {'Field': 'name', 'ValidationFunction': 'Length', 'Error': ...},
+            >>>         {'Field': 'age', 'ValidationFunction': 'Min', 'Error': ...},
+            >>>     ]
+        """
+        errors = []
+        obj = collect(cls, kwargs, errors)
+        if errors:
+            raise ParsingErrors(errors)
+        return obj
+
+    @classmethod
+    def parse_many(
+            cls,
+            records: Iterable[Mapping],
+            lazy: bool = False,
+            errors: Optional[list] = None,
+            workers: Optional[int] = None,
+            chunksize: int = 1000
+        ):
+        """
+        Parse and validate many records, each a mapping of field values, into
+        instances of the class.
+
+        The constructor and error handling are resolved once for the whole batch
+        instead of once per record.
+
+        Args:
+            records (Iterable[Mapping]): The records to parse.
+            lazy (bool): If True, return a generator that parses records as it is
+                consumed, instead of a list.
+            errors (Optional[list]): If None, the first invalid record raises its
+                ParsingError. Otherwise invalid records are skipped and an
+                `(index, ParsingError)` tuple is appended to this list for each one.
+            workers (Optional[int]): If given, validate the records in this many
+                worker processes, `chunksize` records at a time. The class must be
+                defined at module level so the workers can import it, and the
+                records must be picklable. See `booze.parallel.parse_parallel`.
+            chunksize (int): The number of records sent to a worker at a time.
+
+        Returns:
+            list | Iterator: The valid instances, in input order.
+
+        Raises:
+            ParsingError: If a record is invalid and `errors` is None.
+
+        Examples:
+            >>> errors = []
+            >>> people = Person.parse_many(rows, errors=errors)
+            >>> for index, error in errors:
+            >>>     print(index, error.dict())
+        """
+        if workers is not None:
+            parsed = parse_parallel(cls, records, workers, chunksize, errors)
+            return parsed if lazy else list(parsed)
+
+        create = cls.__booze_create__
+        if errors is None:
+            if lazy:
+                return (create(cls, record) for record in records)
+            return [create(cls, record) for record in records]
+
+        parsed = cls._parse_collecting(create, records, errors.append)
+        return parsed if lazy else list(parsed)
+
+    @classmethod
+    async def parse_async(cls, data: Mapping, concurrency: Optional[int] = None) -> 'Base':
+        """
+        Create an instance from a mapping of field values, awaiting the async
+        validators registered with `Coerce.custom`.
+
+        Fields with async validators are checked concurrently, at most `concurrency`
+        at a time; the other fields are parsed synchronously in the meantime. Models
+        without async validators are built with the regular constructor.
+
+        Args:
+            data (Mapping): The field values.
+            concurrency (Optional[int]): The maximum number of fields validated at the
+                same time. Defaults to no limit.
+
+        Returns:
+            Base: An instance of the class with the parsed and validated attributes.
+
+        Raises:
+            ParsingError: If an attribute is not registered with a Coercer, or if the parsing/validation fails.
+
+        Examples:
+            >>> user = await User.parse_async({'username': 'john'}, concurrency=4)
+        """
+        schema = cls.__booze_schema__
+        if not schema.async_fields:
+            return cls.__booze_create__(cls, data)
+
+        if not schema.keys.issuperset(data):
+            raise ParsingError('Erro na atribuição do valor. '
+                               'Você lembrou de cadastrar um Coercer para ela?')
+
+        semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+        async def parse(coercer, value):
+            if semaphore is None:
+                return await coercer.parse_async(value)
+            async with semaphore:
+                return await coercer.parse_async(value)
+
+        parsed = {}
+        tasks = {}
+        try:
+            for key, value in data.items():
+                coercer = schema.parsers[key]
+                if key in schema.async_fields:
+                    tasks[key] = asyncio.ensure_future(parse(coercer, value))
+                else:
+                    parsed[key] = coercer.parse(value)
+            if tasks:
+                for key, result in zip(tasks, await asyncio.gather(*tasks.values())):
+                    parsed[key] = result
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            raise
+
+        obj = object.__new__(cls)
+        for key in data:
+            obj.__setattr__(key, parsed[key])
+
+        return obj
+
+    @classmethod
+    def validate_columns(cls, columns: Mapping[str, Sequence]):
+        """
+        Validate data in column form, one sequence of values per field, without
+        building any instance. Numeric and length checks run a whole column at a
+        time; see `booze.columnar.validate_columns` for the details.
+
+        Args:
+            columns (Mapping[str, Sequence]): The columns, keyed by field name, as
+                lists, `array.array` or NumPy arrays.
+
+        Returns:
+            tuple: `(mask, failures)`: a boolean per row that is True when the row is
+                valid, and a dict mapping each field to the row indices that failed it.
+
+        Examples:
+            >>> mask, failures = Person.validate_columns({
+            >>>     'name': ['John', 'Jo', 'Mary'],
+            >>>     'age': [30, 40, 15],
+            >>> })
+            >>> list(mask) -> [True, False, False]
+            >>> failures -> {'name': [1], 'age': [2]}
+        """
+        return validate_columns(cls.__booze_schema__, columns)
+
+    @classmethod
+    def iter_parse_jsonl(
+            cls,
+            file: 'ingest.PathOrFile',
+            on_error: Optional[Callable[[int, ParsingError], None]] = None,
+            rejects: Optional['ingest.PathOrFile'] = None,
+            stats: Optional['ingest.IngestStats'] = None
+        ) -> Iterator['Base']:
+        """
+        Stream a JSON Lines file, one line at a time, yielding an instance for
+        each valid line. Memory use does not grow with the file size. See
+        `booze.ingest.iter_parse_jsonl` for the details.
+
+        Args:
+            file (Union[str, os.PathLike, IO]): A path, or a binary or text file object.
+            on_error (Optional[Callable[[int, ParsingError], None]]): Called with the
+                line number and the error of each rejected line.
+            rejects (Optional[Union[str, os.PathLike, IO]]): Where the rejected lines
+                are written, unchanged.
+            stats (Optional[IngestStats]): Counters updated while reading, including
+                the throughput in records per second.
+
+        Returns:
+            Iterator[Base]: The valid instances, in file order.
+
+        Raises:
+            ParsingError: If a line is rejected and neither `on_error` nor `rejects` is given.
+
+        Examples:
+            >>> stats = IngestStats()
+            >>> for person in Person.iter_parse_jsonl('people.jsonl', rejects='rejects.jsonl', stats=stats):
+            >>>     ...
+            >>> stats.records_per_second
+        """
+        return ingest.iter_parse_jsonl(cls, file, on_error, rejects, stats)
+
+    @classmethod
+    def iter_parse_csv(
+            cls,
+            file: 'ingest.PathOrFile',
+            chunk_size: int = 1000,
+            on_error: Optional[Callable[[int, ParsingError], None]] = None,
+            rejects: Optional['ingest.PathOrFile'] = None,
+            stats: Optional['ingest.IngestStats'] = None,
+            **fmtparams
+        ) -> Iterator['Base']:
+        """
+        Stream a CSV file with a header row, `chunk_size` rows at a time, yielding
+        an instance for each valid row. Columns are matched to fields by
+        `Coerce.name` once per file, and every value reaches the validators as a
+        string. See `booze.ingest.iter_parse_csv` for the details.
+
+        Args:
+            file (Union[str, os.PathLike, IO]): A path, or a text file object.
+            chunk_size (int): The number of rows read at a time.
+            on_error (Optional[Callable[[int, ParsingError], None]]): Called with the
+                row number and the error of each rejected row.
+            rejects (Optional[Union[str, os.PathLike, IO]]): Where the rejected rows
+                are written, below the header.
+            stats (Optional[IngestStats]): Counters updated while reading, including
+                the throughput in records per second.
+            **fmtparams: Formatting parameters for `csv.reader`, such as `delimiter`.
+
+        Returns:
+            Iterator[Base]: The valid instances, in file order.
+
+        Raises:
+            ParsingError: If a row is rejected and neither `on_error` nor `rejects` is given.
+            ValueError: If two columns of the header map to the same field.
+
+        Examples:
+            >>> class Person(Base):
+            >>>     name = Coerce('nome').string()
+            >>>     age = Coerce('idade').integer()
+            >>> for person in Person.iter_parse_csv('pessoas.csv', chunk_size=5000):
+            >>>     ...
+        """
+        return ingest.iter_parse_csv(cls, file, chunk_size, on_error, rejects, stats, **fmtparams)
+
+    @classmethod
+    def validate_jsonl_parallel(
+            cls,
+            path: str,
+            workers: Optional[int] = None,
+            chunk_bytes: int = 8 * 2**20,
+            on_error: Optional[Callable[[int, ParsingError], None]] = None,
+            rejects: Optional['ingest.PathOrFile'] = None,
+            stats: Optional['ingest.IngestStats'] = None
+        ) -> Iterator['ingest.ChunkReport']:
+        """
+        Validate a JSON Lines file with worker processes, without building it in
+        memory: the file is memory-mapped, split into byte ranges on line
+        boundaries, and each worker validates its ranges from its own mapping.
+        See `booze.ingest.validate_jsonl_parallel` for the details.
+
+        The class must be defined at module level so the workers can import it.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the file.
+            workers (Optional[int]): The number of worker processes; defaults to the
+                number of CPUs.
+            chunk_bytes (int): The approximate size of a range.
+            on_error (Optional[Callable[[int, ParsingError], None]]): Called with the
+                line number and the error of each rejected line.
+            rejects (Optional[Union[str, os.PathLike, IO]]): Where the rejected lines
+                are written, unchanged and in file order.
+            stats (Optional[IngestStats]): Totals updated as the ranges complete.
+
+        Returns:
+            Iterator[ChunkReport]: The valid and invalid counts of each range, in file order.
+
+        Examples:
+            >>> for report in Event.validate_jsonl_parallel('events.jsonl', workers=8, rejects='rejects.jsonl'):
+            >>>     print(report.first_line, report.valid, report.invalid)
+        """
+        return ingest.validate_jsonl_parallel(cls, path, workers, chunk_bytes, on_error, rejects, stats)
+
+    @classmethod
+    def _parse_collecting(cls, create, records, on_error):
+        for index, record in enumerate(records):
+            try:
+                obj = create(cls, record)
+            except ParsingError as error:
+                on_error((index, error))
+                continue
+            yield obj
+
+    def _items(self):
+        """
+        Yield the (field, value) pairs of the fields that were set on the object,
+        in declaration order. Works for both `__dict__` and `__slots__` instances.
+        """
+        for key in self.__booze_schema__.fields:
+            item = getattr(self, key, _MISSING)
+            # Unset fields either raise (slots) or fall back to the class Coerce.
+            if item is _MISSING or isinstance(item, Coerce):
+                continue
+            yield key, item
+
+    def __repr__(self):
+        """
+        Return a string representation of the object.
+
+        Returns:
+            str: A string representation of the object in the format '<Class(attr1=value1, attr2=value2, ...)>'
+        """
+        string = '<'
+        string += type(self).__name__
+        string += '(' + ', '.join([
+            f"{key}='{item}'" if isinstance(item, str) else f"{key}={item}"
+            for key, item in self._items()
+        ])
+        string += ')>'
+        return string
+
+    __str__ = __repr__
+
+    def to_dict(self):
+        """
+        Convert the object to a dictionary containing its attributes.
+
+        Returns:
+            dict: A dictionary containing the object's attributes and their values.
+        """
+        return dict(self._items())
+
+
+Base.__booze_schema__ = Schema()
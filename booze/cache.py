@@ -0,0 +1,126 @@
+import array
+import copy
+import threading
+from collections import OrderedDict, namedtuple
+from contextlib import suppress
+from typing import Callable
+from booze.errors import ParsingError
+
+# Results that callers can change in place; every caller gets its own copy.
+MUTABLE_RESULTS = (list, dict, set, bytearray, array.array)
+with suppress(ImportError):
+    import numpy
+    MUTABLE_RESULTS += (numpy.ndarray,)
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class ParseCache:
+    """
+    A bounded, thread-safe LRU cache of parse results, keyed on the raw value.
+
+    Both outcomes are cached: the coerced value of a valid input, and the
+    ParsingError of an invalid one, which is raised again (as a fresh copy) on
+    every hit. Keys include the type of the value, so `1`, `1.0` and `True` are
+    cached separately. Values that are not hashable bypass the cache.
+
+    Mutable results (lists, dicts, sets, arrays, such as those of `each()`) are
+    cached too, but every caller, including the first, gets a shallow copy, so
+    changing one does not change later hits. Their elements are shared.
+
+    Args:
+        maxsize (int): The maximum number of cached values. When full, the least
+            recently used entry is evicted.
+
+    Example:
+        >>> coercer = Coerce().string().lowercase().cached(maxsize=256)
+        >>> coercer.parse('BR')
+        >>> coercer.parse_cache.info()
+        CacheInfo(hits=0, misses=1, evictions=0, maxsize=256, currsize=1)
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError('The cache size must be at least 1.')
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def parse(self, value: any, parse: Callable[[any], any]) -> any:
+        """
+        Return the cached result for `value`, or compute it with `parse` and cache it.
+
+        Args:
+            value (Any): The raw value.
+            parse (Callable): The uncached parse function.
+
+        Returns:
+            Any: The coerced value.
+
+        Raises:
+            ParsingError: If the value is invalid.
+        """
+        key = (type(value), value)
+        try:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+        except TypeError:
+            return parse(value)
+
+        if entry is not None:
+            ok, result = entry
+            if ok:
+                return copy.copy(result) if isinstance(result, MUTABLE_RESULTS) else result
+            raise copy.copy(result)
+
+        try:
+            result = parse(value)
+        except ParsingError as error:
+            # A copy without traceback, so the cache keeps no frames alive.
+            self._store(key, (False, copy.copy(error)))
+            raise
+        self._store(key, (True, result))
+        return copy.copy(result) if isinstance(result, MUTABLE_RESULTS) else result
+
+    def _store(self, key: tuple, entry: tuple) -> None:
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __getstate__(self) -> dict:
+        # Coerce objects travel with the ParsingErrors of worker processes; the
+        # lock cannot be pickled and the entries are not worth sending, so an
+        # unpickled cache starts empty.
+        return {'maxsize': self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state['maxsize'])
+
+    def info(self) -> CacheInfo:
+        """
+        Return the hit/miss statistics of the cache.
+
+        Returns:
+            CacheInfo: hits, misses, evictions, maxsize and currsize.
+        """
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._entries))
+
+    def clear(self) -> None:
+        """
+        Remove every entry and reset the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,220 @@
+import keyword
+from typing import Callable, Tuple
+from booze.errors import ParsingError
+from booze.result import ParseResult
+from booze.schema import Schema
+from booze.validators import ParseContext
+from booze.optimizer import optimize
+
+
+def _unknown_field(raising: bool = True) -> ParseResult:
+    error = ParsingError('Erro na atribuição do valor. '
+                         'Você lembrou de cadastrar um Coercer para ela?')
+    if raising:
+        raise error
+    return ParseResult(False, error=error)
+
+
+def can_generate(schema: Schema) -> bool:
+    """
+    Check whether a specialized constructor can be generated for the schema.
+
+    Field names end up as attribute names in generated source, so every field
+    must be a plain Python identifier, and not a keyword such as `class`.
+
+    Args:
+        schema (Schema): The compiled schema of the class.
+
+    Returns:
+        bool: True if `generate_constructors` accepts the schema, False otherwise.
+    """
+    return all(field.isidentifier() and not keyword.iskeyword(field) for field in schema.fields)
+
+
+def generate_constructors(
+        schema: Schema, optimize_chains: bool = True
+    ) -> Tuple[Callable, Callable]:
+    """
+    Generate, via `exec`, straight-line constructors specialized for a schema.
+
+    Two functions share the same generated body: `__new__(cls, **kwargs)`, to be
+    installed on the class, and `__create__(cls, kwargs)`, which takes the mapping
+    directly and is used by the bulk APIs to avoid unpacking every record.
+
+    For every field the generated constructor checks whether the keyword was
+    given, then calls each validator of its Coerce in order and stores the coerced
+    value on the object. The resulting code is equivalent to looping over the
+    kwargs and calling `Coerce.parse`, without the per-field loop and dispatch,
+    except that fields are checked in schema (declaration) order rather than
+    kwargs order: when several fields are invalid, the first one reported may
+    differ from the interpreted constructor.
+
+    A single ParseContext is created per call and reused for every field, so the
+    generated constructor is as thread-safe as `Coerce.parse`.
+
+    Fields with a `Coerce.cached` result cache call `Coerce.parse` instead, so
+    the cache is consulted.
+
+    Unless `optimize_chains` is False, each chain is first rewritten by
+    `booze.optimizer.optimize` (fused range and length checks, cheap checks
+    first); values it rejects are parsed again with the original chain, so
+    results and errors are the same as without optimization.
+
+    The validator chains are captured when the function is generated; adding a
+    validator to a Coerce afterwards makes `Base` generate its constructors again.
+
+    Args:
+        schema (Schema): The compiled schema of the class.
+        optimize_chains (bool): Whether to optimize the validator chains.
+
+    Returns:
+        tuple[Callable, Callable]: The `__new__` and `__create__` functions.
+
+    Example:
+        For `name = Coerce().string().length(3, 10)` the generated body reads:
+
+            if 'name' in kwargs:
+                value = kwargs['name']
+                context.value = context.first_value = value
+                if _v0_0(value, context) == False:
+                    _c0._raise_error(_v0_0, value)
+                if _v0_1(value, context) == False:
+                    _c0._raise_error(_v0_1, value)
+                obj.name = context.value
+    """
+    namespace = _namespace(schema)
+    body = _body(schema, namespace, optimize_chains, raising=True)
+
+    # The names are bound as arguments of an outer function so the generated
+    # constructor reads them as closure cells instead of global lookups.
+    source = '\n'.join([
+        f'def __create_fn__({", ".join(namespace)}):',
+        '  def __new__(cls, **kwargs):',
+        *['  ' + line for line in body],
+        '  def __create__(cls, kwargs):',
+        *['  ' + line for line in body],
+        '  return __new__, __create__',
+    ])
+    scope: dict = {}
+    exec(source, {}, scope)
+    new, create = scope['__create_fn__'](**namespace)
+    new.__booze_source__ = create.__booze_source__ = source
+    return new, create
+
+
+def generate_try_create(schema: Schema, optimize_chains: bool = True) -> Callable:
+    """
+    Generate, via `exec`, the non-raising counterpart of the constructors of
+    `generate_constructors`: `__try_create__(cls, kwargs)` returns a ParseResult
+    holding the instance, or the first rejection, without raising or catching a
+    ParsingError. Rejections by an optimized chain are checked again with
+    `Coerce.try_parse` on the original chain.
+
+    Args:
+        schema (Schema): The compiled schema of the class.
+        optimize_chains (bool): Whether to optimize the validator chains.
+
+    Returns:
+        Callable: The `__try_create__` function.
+    """
+    namespace = _namespace(schema)
+    namespace['_result'] = ParseResult
+    namespace['_parsing_error'] = ParsingError
+    body = _body(schema, namespace, optimize_chains, raising=False)
+    # Validators of nested models raise the errors of the nested fields.
+    source = '\n'.join([
+        f'def __create_fn__({", ".join(namespace)}):',
+        '  def __try_create__(cls, kwargs):',
+        '    try:',
+        *['    ' + line for line in body],
+        '    except _parsing_error as error:',
+        '      return _result(False, error=error)',
+        '  return __try_create__',
+    ])
+    scope: dict = {}
+    exec(source, {}, scope)
+    try_create = scope['__create_fn__'](**namespace)
+    try_create.__booze_source__ = source
+    return try_create
+
+
+def _namespace(schema: Schema) -> dict:
+    return {
+        '_object_new': object.__new__,
+        '_context': ParseContext,
+        '_keys': schema.keys,
+        '_unknown_field': _unknown_field,
+    }
+
+
+def _body(schema: Schema, namespace: dict, optimize_chains: bool, raising: bool) -> list:
+    # With raising=False, every statement that would raise a ParsingError
+    # returns a failed ParseResult instead, and the object is returned wrapped
+    # in a successful one.
+    body = [
+        '    obj = _object_new(cls)',
+        '    context = _context()',
+        '    if not _keys.issuperset(kwargs):',
+        '        _unknown_field()' if raising else '        return _unknown_field(False)',
+    ]
+    for i, (field, coercer) in enumerate(zip(schema.fields, schema.coercers)):
+        c = f'_c{i}'
+        namespace[c] = coercer
+        if coercer.parse_cache is not None:
+            # Cached fields go through Coerce.parse, which owns the cache.
+            body.append(f'    if {field!r} in kwargs:')
+            if raising:
+                body.append(f'        obj.{field} = {c}.parse(kwargs[{field!r}])')
+            else:
+                body += _try_parse(field, c, f'kwargs[{field!r}]', '        ')
+            continue
+        body += [
+            f'    if {field!r} in kwargs:',
+            f'        value = kwargs[{field!r}]',
+            '        context.value = context.first_value = value',
+        ]
+        optimized = optimize(coercer) if optimize_chains else None
+        if optimized is not None:
+            # The optimized chain only decides acceptance; any rejection or error
+            # reruns the original chain through Coerce.parse for the exact error.
+            checks = []
+            for j, validation in enumerate(optimized):
+                v = f'_v{i}_{j}'
+                namespace[v] = validation
+                checks.append(f'{v}(value, context) == False')
+            body += [
+                '        try:',
+                f'            rejected = {" or ".join(checks)}',
+                '        except Exception:',
+                '            rejected = True',
+            ]
+            if raising:
+                body.append(f'        obj.{field} = {c}.parse(value) if rejected else context.value')
+            else:
+                body += [
+                    '        if rejected:',
+                    *_try_parse(field, c, 'value', '            '),
+                    '        else:',
+                    f'            obj.{field} = context.value',
+                ]
+            continue
+        for j, validation in enumerate(coercer.validations):
+            v = f'_v{i}_{j}'
+            namespace[v] = validation
+            body += [
+                f'        if {v}(value, context) == False:',
+                f'            {c}._raise_error({v}, value)' if raising
+                else f'            return _result(False, None, {c}, {v}, value)',
+            ]
+        body.append(f'        obj.{field} = context.value')
+    body.append('    return obj' if raising else '    return _result(True, obj)')
+    return body
+
+
+def _try_parse(field: str, c: str, value: str, indent: str) -> list:
+    return [
+        f'{indent}result = {c}.try_parse({value})',
+        f'{indent}if not result.ok:',
+        f'{indent}    return result',
+        f'{indent}obj.{field} = result.value',
+    ]
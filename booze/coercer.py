@@ -3,6 +3,12 @@ from booze.errors import *
 import re
 from booze import validators
 import uuid
+import inspect
+import os
+import datetime
+from typing import Callable, Iterable, Union
+from booze.cache import ParseCache
+from booze.result import ParseResult
 
 
 class Coerce:
@@ -11,11 +17,13 @@ class Coerce:
     Call `parse(value)` after setting the validation rules to parse the value. If the value
     passes all validations, the parsed value is returned; otherwise, a ParsingError is raised.
 
+    A Coerce holds no per-call state: the value being parsed lives in a ParseContext
+    created by each `parse` call, so one instance can be shared between threads.
+
     Attributes:
         name (str): A unique name for the Coerce instance (default is a UUID4 string).
-        value (Any): The current value being parsed and validated.
-        first_value (Any): The initial value provided before parsing and validation.
         validations (list[Validator]): A list to store validation rules.
+        parse_cache (Optional[ParseCache]): The result cache enabled by `cached`, if any.
 
     Example:
         # Create a Coerce instance and set validation rules
@@ -29,19 +37,14 @@ class Coerce:
     def __init__(self, name:str=None, message:Optional[str]=None) -> None:
         from booze.validators import Validator
         self.name = name
-        self.value = None
-        self.first_value = None
+        self.parse_cache: Optional[ParseCache] = None
         self.message = message
         self.validations: list[Validator] = []
 
     def __repr__(self):
-        if self.value:
-            return f"Coerce(name='{self.name}', value={self.value})"
-        return f"Coerce(name='{self.name})"
+        return f"Coerce(name='{self.name}')"
 
     def __str__(self):
-        if self.value:
-            return f"Coerce({self.name}={self.value})"
         return f"Coerce({self.name})"
 
     def integer(self, message: Optional[str]=None) -> 'Coerce':
@@ -54,7 +57,7 @@ class Coerce:
         validator = validators.Integer(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def date(self, message: Optional[str]=None) -> 'Coerce':
@@ -67,26 +70,35 @@ class Coerce:
         validator = validators.Date(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
-    def datetime(self, message: Optional[str]=None) -> 'Coerce':
+    def datetime(
+            self,
+            message: Optional[str]=None,
+            tz: Optional[Union[str, datetime.tzinfo]]=None
+        ) -> 'Coerce':
         """
-        Parse and validate the given value based on the registered validation rules.
+        Add a DateTime validator to the Coerce instance.
 
         Args:
-            value (Any): The value to be parsed and validated.
+            message (Optional[str]): The error message.
+            tz (Optional[Union[str, datetime.tzinfo]]): A timezone ('UTC', an IANA name such as
+                'America/Sao_Paulo', or a tzinfo). If given, UTC offsets ('Z', '+03:00', '-0500')
+                are parsed and every value is converted to this timezone; values without offset
+                are taken to be in it already.
 
         Returns:
-            Any: The parsed and validated value.
+            Coerce: The updated Coerce instance.
 
-        Raises:
-            ParsingError: If the value fails validation according to any registered validator.
+        Example:
+            >>> Coerce().datetime(tz='UTC').parse('2023-07-23T12:34:56+03:00')
+            datetime.datetime(2023, 7, 23, 9, 34, 56, tzinfo=datetime.timezone.utc)
         """
-        validator = validators.DateTime(coercer=self)
+        validator = validators.DateTime(coercer=self, tz=tz)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def strict(self, message: Optional[str]=None) -> 'Coerce':
@@ -99,7 +111,7 @@ class Coerce:
         validator = validators.Strict(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def format_date(self, format_string, message: Optional[str]=None) -> 'Coerce':
@@ -115,7 +127,7 @@ class Coerce:
         validator = validators.FormatDate( coercer=self, format_string=format_string)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def float(self, message: Optional[str]=None) -> 'Coerce':
@@ -128,7 +140,7 @@ class Coerce:
         validator = validators.Float(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def boolean(self, message: Optional[str]=None) -> 'Coerce':
@@ -141,7 +153,7 @@ class Coerce:
         validator = validators.Boolean(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def string(self, message: Optional[str]=None) -> 'Coerce':
@@ -154,7 +166,7 @@ class Coerce:
         validator = validators.String(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def list(self, message: Optional[str]=None) -> 'Coerce':
@@ -167,7 +179,7 @@ class Coerce:
         validator = validators.List(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def dictionary(
@@ -192,7 +204,7 @@ class Coerce:
         )
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def required_keys(
@@ -211,7 +223,7 @@ class Coerce:
         validator = validators.RequiredKeys(coercer=self, required_keys=required_keys)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def dict(
@@ -237,7 +249,7 @@ class Coerce:
         )
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def numeric(self, message: Optional[str]=None) -> 'Coerce':
@@ -250,7 +262,7 @@ class Coerce:
         validator = validators.Numeric(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def min(self, minimum: int, message: Optional[str]=None) -> 'Coerce':
@@ -266,7 +278,7 @@ class Coerce:
         validator = validators.Min(coercer=self, value=minimum)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def max(self, maximum: int, message: Optional[str]=None) -> 'Coerce':
@@ -282,7 +294,7 @@ class Coerce:
         validator = validators.Max(coercer=self, value=maximum)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def min_length(self, min: int, message: Optional[str]=None) -> 'Coerce':
@@ -298,7 +310,7 @@ class Coerce:
         validator = validators.MinLength(coercer=self, length_min=min)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def max_length(self, maximum: int, message: Optional[str]=None) -> 'Coerce':
@@ -314,7 +326,7 @@ class Coerce:
         validator = validators.MaxLength(coercer=self, length_max=maximum)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def length(self, *args, message:Optional[str]=None) -> 'Coerce':
@@ -346,7 +358,7 @@ class Coerce:
         )
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
 
     def url(self, message:Optional[str]=None): ...
@@ -374,7 +386,80 @@ class Coerce:
         validator = validators.Contains(coercer=self, value=element)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
+        return self
+
+    def contains_all(self, elements: Iterable, message:Optional[str]=None) -> 'Coerce':
+        """
+        Add a ContainsAll validator to the Coerce instance. Unlike a chain of
+        `contains` calls, the value is turned into a set once for all the elements.
+
+        Args:
+            elements (Iterable): The elements that the value must all contain. A
+                string is a single element; in a string value, elements are
+                matched as substrings.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Example:
+            >>> Coerce().list().contains_all(['python', 'backend']).parse(tags)
+        """
+        validator = validators.ContainsAll(coercer=self, elements=elements)
+        if message:
+            validator.message = message
+        self._add(validator)
+        return self
+
+    def contains_any(self, elements: Iterable, message:Optional[str]=None) -> 'Coerce':
+        """
+        Add a ContainsAny validator to the Coerce instance.
+
+        Args:
+            elements (Iterable): The elements that the value must contain at least one of,
+                with the same string rules as `contains_all`.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+        """
+        validator = validators.ContainsAny(coercer=self, elements=elements)
+        if message:
+            validator.message = message
+        self._add(validator)
+        return self
+
+    def one_of(
+            self,
+            values: Iterable = (),
+            case_sensitive: bool = True,
+            file: Optional[Union[str, os.PathLike]] = None,
+            message: Optional[str]=None
+        ) -> 'Coerce':
+        """
+        Add a OneOf validator to the Coerce instance: the value must be one of the
+        allowed values. They are frozen into a set once, so large lists of allowed
+        values (SKUs, region codes) cost a single hash lookup per value.
+
+        Args:
+            values (Iterable): The allowed values.
+            case_sensitive (bool): If False, strings are compared casefolded.
+            file (Optional[Union[str, os.PathLike]]): A text file with more allowed values,
+                one per line; blank lines and lines starting with '#' are skipped.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Example:
+            >>> Coerce().string().one_of(['BR', 'PT', 'AO'], case_sensitive=False).parse('br')
+            'br'
+            >>> Coerce().string().one_of(file='skus.txt')
+        """
+        if file is not None:
+            values = [*values, *validators.OneOf.load(file)]
+        validator = validators.OneOf(coercer=self, values=values, case_sensitive=case_sensitive)
+        if message:
+            validator.message = message
+        self._add(validator)
         return self
 
     def email(self, message:Optional[str]=None) -> 'Coerce':
@@ -387,7 +472,7 @@ class Coerce:
         validator = validators.Email(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
         return self
     
     def lowercase(self, message:Optional[str]=None) -> 'Coerce':
@@ -400,9 +485,157 @@ class Coerce:
         validator = validators.Lowercase(coercer=self)
         if message:
             validator.message = message
-        self.validations.append(validator)
+        self._add(validator)
+        return self
+
+    def each(
+            self,
+            element: 'Coerce',
+            storage: Optional[str]=None,
+            message: Optional[str]=None
+        ) -> 'Coerce':
+        """
+        Add an Each validator to the Coerce instance: every element of the value is
+        parsed with the `element` Coerce, in a tight loop, and the value is coerced to
+        the list of parsed elements.
+
+        For `integer()` and `float()` element chains, `storage='array'` or
+        `storage='numpy'` stores the elements in an `array.array` or a NumPy array of
+        64-bit numbers instead of a list, which takes several times less memory for
+        large vectors.
+
+        Args:
+            element (Coerce): The Coerce validating each element.
+            storage (Optional[str]): None for a list, 'array' or 'numpy'.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Raises:
+            ValueError: If `storage` is set for an element chain without `integer()` or `float()`.
+
+        Example:
+            >>> Coerce().list().each(Coerce().float().min(0), storage='array').parse([1, 2.5])
+            array('d', [1.0, 2.5])
+        """
+        validator = validators.Each(coercer=self, element=element, storage=storage)
+        if message:
+            validator.message = message
+        self._add(validator)
         return self
 
+    def model(self, model: type, message: Optional[str]=None) -> 'Coerce':
+        """
+        Add a Model validator to the Coerce instance: the value, a mapping of field
+        values, is built into an instance of another Base subclass. Instances of that
+        model are kept as they are, without being validated again.
+
+        Nested models are built with an explicit work stack (see `booze.nested`), so
+        deeply nested payloads do not cost deep recursion.
+
+        Args:
+            model (type): The Base subclass.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Example:
+            >>> class Person(Base):
+            >>>     address = Coerce().model(Address)
+            >>> Person(address={'street': 'Main St', 'zip': '12345'}).address.zip
+        """
+        validator = validators.Model(coercer=self, model=model)
+        if message:
+            validator.message = message
+        self._add(validator)
+        return self
+
+    def list_of(self, model: type, message: Optional[str]=None) -> 'Coerce':
+        """
+        Add a ListOf validator to the Coerce instance: the value must be a list whose
+        items, mappings of field values or instances of the model, are built into
+        instances of another Base subclass, like with `model`.
+
+        Args:
+            model (type): The Base subclass.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Example:
+            >>> class Order(Base):
+            >>>     items = Coerce().list_of(Item)
+        """
+        validator = validators.ListOf(coercer=self, model=model)
+        if message:
+            validator.message = message
+        self._add(validator)
+        return self
+
+    def custom(self, function: Callable, message: Optional[str]=None) -> 'Coerce':
+        """
+        Add a user-defined validation function to the Coerce instance. The function
+        receives the value and returns True if it is valid. `async def` functions, and
+        objects with an `async def __call__`, are accepted too; a Coerce with async
+        validators must be parsed with `parse_async`.
+
+        Args:
+            function (Callable): The validation function, sync or async.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+
+        Example:
+            >>> async def is_unique(username):
+            >>>     return not await store.exists(username)
+            >>> coercer = Coerce().string().custom(is_unique)
+            >>> await coercer.parse_async('john')
+        """
+        if validators.is_async_callable(function):
+            validator = validators.AsyncCustom(coercer=self, function=function)
+        else:
+            validator = validators.Custom(coercer=self, function=function)
+        if message:
+            validator.message = message
+        self._add(validator)
+        return self
+
+    def cached(self, maxsize: int = 1024) -> 'Coerce':
+        """
+        Memoize the results of `parse` in a bounded LRU cache keyed on the raw value,
+        for fields that receive the same values over and over. Failures are cached
+        too. Unhashable values bypass the cache, and mutable results such as lists
+        are returned as shallow copies. Statistics are available through
+        `parse_cache.info()`.
+
+        Args:
+            maxsize (int): The maximum number of cached values.
+
+        Returns:
+            Coerce: The updated Coerce instance.
+        """
+        self.parse_cache = ParseCache(maxsize)
+        self._recompile_models()
+        return self
+
+    def _add(self, validator: 'Validator') -> None:
+        self.validations.append(validator)
+        self._recompile_models()
+
+    def _recompile_models(self) -> None:
+        # Models compiled before this change captured the old chain in their
+        # schema and generated constructors; rebuild them so it is not ignored.
+        from booze.schema import compiled_models
+        for model in list(compiled_models.get(self, ())):
+            model.__booze_compile__()
+
+    @property
+    def is_async(self) -> bool:
+        """
+        Whether any of the registered validators is async.
+        """
+        return any(validation.is_async for validation in self.validations)
+
     def parse(self, value: any, message:Optional[str]=None) -> 'Coerce':
         """
         Parse and validate the given value based on the registered validation rules.
@@ -416,25 +649,114 @@ class Coerce:
         Raises:
             ParsingError: If the value fails validation according to any registered validator.
         """
-        self.value = value
-        self.first_value = value
+        if self.parse_cache is not None:
+            return self.parse_cache.parse(value, self._parse)
+        return self._parse(value)
+
+    def _parse(self, value: any) -> any:
+        context = validators.ParseContext(value)
         for validation in self.validations:
-            result = validation(value)
-            self.value = validation.coercer.value
-            if result == False:
-                msg = f'Error in validating data for value {value}'
-                if self.message:
-                    msg = self.message
-                    
-                try:
-                    if validation.message:
-                        msg = validation.message
-                except:
-                    pass
+            if validation(value, context) == False:
+                self._raise_error(validation, value)
                 
-                raise ParsingError(
-                    msg, type(validation).__name__,
-                    self
-                )
-                
-        return self.value
+        return context.value
+
+    def try_parse(self, value: any) -> ParseResult:
+        """
+        Parse and validate the given value like `parse`, but return the outcome instead
+        of raising. A rejection builds no exception; the ParsingError is only created
+        when the result's `error` is read.
+
+        Args:
+            value (Any): The value to be parsed and validated.
+
+        Returns:
+            ParseResult: `ok` and the parsed `value`, or the `error`.
+
+        Example:
+            >>> result = Coerce().integer().try_parse('abc')
+            >>> if not result:
+            >>>     print(result.error.dict())
+        """
+        if self.parse_cache is not None:
+            try:
+                return ParseResult(True, self.parse_cache.parse(value, self._parse))
+            except ParsingError as error:
+                return ParseResult(False, error=error)
+
+        context = validators.ParseContext(value)
+        try:
+            for validation in self.validations:
+                if validation(value, context) == False:
+                    return ParseResult(False, None, self, validation, value)
+        except ParsingError as error:
+            # Raised by the fields of nested models.
+            return ParseResult(False, error=error)
+
+        return ParseResult(True, context.value)
+
+    async def parse_async(self, value: any) -> any:
+        """
+        Parse and validate the given value, awaiting async validators. Validators run
+        in chain order; synchronous ones are called directly.
+
+        Args:
+            value (Any): The value to be parsed and validated.
+
+        Returns:
+            Any: The parsed and validated value.
+
+        Raises:
+            ParsingError: If the value fails validation according to any registered validator.
+        """
+        context = validators.ParseContext(value)
+        for validation in self.validations:
+            if validation.is_async:
+                result = await validation.acall(value, context)
+            else:
+                result = validation(value, context)
+            if result == False:
+                self._raise_error(validation, value)
+
+        return context.value
+
+    def _raise_error(self, validation: 'Validator', value: any) -> None:
+        """
+        Raise the ParsingError for a value rejected by one of the registered validators.
+
+        Args:
+            validation (Validator): The validator that rejected the value.
+            value (Any): The rejected value.
+
+        Raises:
+            ParsingError: Always.
+        """
+        raise self._error(validation, value)
+
+    def _error(self, validation: 'Validator', value: any) -> ParsingError:
+        """
+        Build the ParsingError for a value rejected by one of the registered validators.
+
+        Args:
+            validation (Validator): The validator that rejected the value.
+            value (Any): The rejected value.
+
+        Returns:
+            ParsingError: The error, with the validator's message, or the Coerce's, or a default one
+                rendered from the value when first read.
+        """
+        # Without a custom message, ParsingError renders its template lazily.
+        msg = None
+        if self.message:
+            msg = self.message
+            
+        try:
+            if validation.message:
+                msg = validation.message
+        except:
+            pass
+        
+        return ParsingError(
+            msg, type(validation).__name__,
+            self, value
+        )
@@ -0,0 +1,261 @@
+import math
+import operator
+from array import array
+from contextlib import suppress
+from typing import Any, Mapping, Optional, Sequence
+from booze import validators
+from booze.errors import ParsingError
+from booze.schema import Schema
+
+numpy = None
+with suppress(ImportError):
+    import numpy
+
+
+class _Column:
+    """
+    A column of values being validated, with its numeric and length views built
+    lazily and at most once, whichever backend is in use.
+    """
+
+    __slots__ = ('values', 'size', '_numbers', '_lengths')
+
+    _UNSET = object()
+
+    def __init__(self, values: Sequence) -> None:
+        self.values = values
+        self.size = len(values)
+        self._numbers = self._UNSET
+        self._lengths = self._UNSET
+
+    def numbers(self):
+        """
+        Return the column as a numeric vector, or None if it holds non-numeric values.
+        """
+        if self._numbers is self._UNSET:
+            self._numbers = _numbers(self.values)
+        return self._numbers
+
+    def lengths(self):
+        """
+        Return the lengths of the column values as a vector, or None if a value has no length.
+        """
+        if self._lengths is self._UNSET:
+            self._lengths = _lengths(self.values, self.size)
+        return self._lengths
+
+
+def _numbers(values):
+    if numpy is not None:
+        vector = numpy.asarray(values)
+        if vector.ndim == 1 and vector.dtype.kind in 'biuf':
+            return vector
+        return None
+
+    if isinstance(values, array) and values.typecode not in 'uw':
+        return values
+    typecode = 'q'
+    for value in values:
+        kind = type(value)
+        if kind is float:
+            typecode = 'd'
+        elif kind is not int and kind is not bool:
+            return None
+    try:
+        return array(typecode, values)
+    except OverflowError:
+        pass
+    try:
+        return array('d', values)
+    except OverflowError:
+        # Integers beyond the float range: the values are checked one by one.
+        return None
+
+
+def _lengths(values, size: int):
+    try:
+        if numpy is not None:
+            return numpy.fromiter(map(len, values), dtype=numpy.intp, count=size)
+        return array('q', map(len, values))
+    except TypeError:
+        return None
+
+
+def _full(size: int, flag: bool):
+    if numpy is not None:
+        return numpy.full(size, flag, dtype=bool)
+    return array('b', [flag]) * size
+
+
+def _mask(vector, predicate, ufunc=None):
+    # `ufunc` is the vectorized form of `predicate`, used when NumPy is available.
+    if numpy is not None:
+        return ufunc(vector)
+    return array('b', map(predicate, vector))
+
+
+def _and(left, right):
+    if numpy is not None:
+        return left & right
+    return array('b', map(operator.and_, left, right))
+
+
+def _failures(mask) -> list[int]:
+    if numpy is not None:
+        return numpy.flatnonzero(~mask).tolist()
+    return [index for index, flag in enumerate(mask) if not flag]
+
+
+def _is_finite(vector):
+    if numpy is not None and vector.dtype.kind in 'biu':
+        return numpy.ones(len(vector), dtype=bool)
+    return _mask(vector, math.isfinite, lambda v: numpy.isfinite(v))
+
+
+def _min(validation: 'validators.Min', column: _Column):
+    vector = column.numbers()
+    if vector is None:
+        return None
+    minimum = validation.bound
+    if minimum is None:
+        return _full(column.size, False)
+    return _mask(vector, lambda v: minimum < v, lambda v: v > minimum)
+
+
+def _max(validation: 'validators.Max', column: _Column):
+    vector = column.numbers()
+    if vector is None:
+        return None
+    maximum = validation.bound
+    if maximum is None:
+        return _full(column.size, False)
+    # Written as `not (v > max)` so NaN passes, like the scalar validator.
+    return _mask(vector, lambda v: not v > maximum, lambda v: ~(v > maximum))
+
+
+def _integer(validation: 'validators.Integer', column: _Column):
+    vector = column.numbers()
+    if vector is None:
+        return None
+    return _is_finite(vector)
+
+
+def _numeric(validation: 'validators.Validator', column: _Column):
+    if column.numbers() is None:
+        return None
+    return _full(column.size, True)
+
+
+def _length(validation: 'validators.Length', column: _Column):
+    lengths = column.lengths()
+    if lengths is None:
+        return None
+    low, high = validation.length_min, validation.length_max
+    return _mask(lengths, lambda n: low <= n <= high, lambda n: (n >= low) & (n <= high))
+
+
+def _min_length(validation: 'validators.MinLength', column: _Column):
+    lengths = column.lengths()
+    if lengths is None:
+        return None
+    low = validation.length_min
+    return _mask(lengths, lambda n: low <= n, lambda n: n >= low)
+
+
+def _max_length(validation: 'validators.MaxLength', column: _Column):
+    lengths = column.lengths()
+    if lengths is None:
+        return None
+    high = validation.length_max
+    return _mask(lengths, lambda n: n <= high, lambda n: n <= high)
+
+
+def _string(validation: 'validators.String', column: _Column):
+    flags = [isinstance(value, str) for value in column.values]
+    if numpy is not None:
+        return numpy.array(flags, dtype=bool)
+    return array('b', flags)
+
+
+KERNELS = {
+    validators.Integer: _integer,
+    validators.Float: _numeric,
+    validators.Numeric: _numeric,
+    validators.Min: _min,
+    validators.Max: _max,
+    validators.Length: _length,
+    validators.MinLength: _min_length,
+    validators.MaxLength: _max_length,
+    validators.String: _string,
+}
+
+
+def _validate_column(coercer, column: _Column):
+    mask = _full(column.size, True)
+    for validation in coercer.validations:
+        kernel = KERNELS.get(type(validation))
+        result = kernel(validation, column) if kernel is not None else None
+        if result is None:
+            return _parse_column(coercer, column)
+        mask = _and(mask, result)
+    return mask
+
+
+def _parse_column(coercer, column: _Column):
+    flags = []
+    for value in column.values:
+        try:
+            coercer.parse(value)
+            flags.append(True)
+        except ParsingError:
+            flags.append(False)
+    if numpy is not None:
+        return numpy.array(flags, dtype=bool)
+    return array('b', flags)
+
+
+def validate_columns(schema: Schema, columns: Mapping[str, Sequence[Any]]):
+    """
+    Validate data given in column form, one sequence of values per field,
+    against the Coerce chains of a schema.
+
+    Chains made only of numeric and length checks (`integer`, `float`, `numeric`,
+    `min`, `max`, `length`, `min_length`, `max_length`, `string`) are evaluated a
+    whole column at a time, with NumPy when it is installed and the `array` module
+    otherwise. Any other chain, or a column whose values do not fit the check, is
+    validated value by value with `Coerce.parse`. Values are only validated: the
+    coerced values are not returned.
+
+    Args:
+        schema (Schema): The compiled schema of the class.
+        columns (Mapping[str, Sequence]): The columns, keyed by field name. Lists,
+            `array.array` and NumPy arrays are accepted.
+
+    Returns:
+        tuple: `(mask, failures)`, where `mask` holds one boolean per row (a NumPy
+            bool array, or an `array('b')` without NumPy) that is True when every
+            field of the row is valid, and `failures` maps each validated field to
+            the list of row indices that failed it.
+
+    Raises:
+        ParsingError: If a column is not registered with a Coercer.
+        ValueError: If the columns have different lengths.
+    """
+    sizes = {len(values) for values in columns.values()}
+    if len(sizes) > 1:
+        raise ValueError('All columns must have the same length.')
+    size = sizes.pop() if sizes else 0
+
+    mask = _full(size, True)
+    failures: dict[str, list[int]] = {}
+    for field, values in columns.items():
+        try:
+            coercer = schema.parsers[field]
+        except KeyError:
+            raise ParsingError('Erro na atribuição do valor. '
+                               'Você lembrou de cadastrar um Coercer para ela?')
+        column_mask = _validate_column(coercer, _Column(values))
+        failures[field] = _failures(column_mask)
+        mask = _and(mask, column_mask)
+
+    return mask, failures
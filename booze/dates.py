@@ -0,0 +1,569 @@
+import datetime
+import itertools
+import re
+import string
+from contextlib import suppress
+from typing import Mapping, Optional, Union
+from booze.consts import date_formats
+
+
+# Maps every ASCII digit to '9' and every ASCII letter to 'a', so that
+# '07/23/2023'.translate(SHAPE) == '99/99/9999'.
+SHAPE = str.maketrans({
+    **{digit: '9' for digit in string.digits},
+    **{letter: 'a' for letter in string.ascii_letters},
+})
+
+MONTHS = {
+    name: number for number, name in enumerate(
+        ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
+         'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1
+    )
+}
+
+# The widths each directive may take, widest first, and the shape character of
+# its text. Like strptime, %d and %m take one or two digits.
+DIRECTIVES = {
+    'Y': ((4,), '9'),
+    'y': ((2,), '9'),
+    'm': ((2, 1), '9'),
+    'd': ((2, 1), '9'),
+    'b': ((3,), 'a'),
+}
+
+
+# HH:MM[:SS[.ffffff]] with an optional AM/PM suffix.
+TIME = re.compile(
+    r'(\d{1,2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6}))?)?(?:\s*([AaPp])[Mm])?'
+)
+
+# Timezones of the UTC offsets seen so far, keyed on their text ('+03:00',
+# '-0500', 'Z'), so that repeated offsets share one tzinfo object.
+OFFSETS = {'Z': datetime.timezone.utc}
+
+# The layouts of `isoformat()`: 'YYYY-MM-DD', and 'YYYY-MM-DDTHH:MM:SS' ('T' or
+# a space) with no fraction, milliseconds or microseconds, and nothing after.
+# `fromisoformat` parses these the same way on every supported Python version.
+CANONICAL_ISO = re.compile(
+    r'\d{4}-\d\d-\d\d(?:[T ]\d\d:\d\d:\d\d(?:\.\d{3}(?:\d{3})?)?)?', re.ASCII
+)
+
+
+class DatePattern:
+    """
+    One date format compiled for one input shape: since the shape fixes the
+    position of every field, parsing is a matter of slicing and `int`.
+
+    Attributes:
+        key (str): The name of the format in `date_formats`, e.g. 'MM/DD/YYYY'.
+        format (str): The strptime format, e.g. '%m/%d/%Y'.
+        shape (str): The shape of the inputs it parses, e.g. '99/99/9999'.
+    """
+
+    __slots__ = ('key', 'format', 'shape', 'year', 'month', 'day', 'short_year', 'month_name')
+
+    def __init__(self, key: str, format: str, shape: str, slices: dict) -> None:
+        self.key = key
+        self.format = format
+        self.shape = shape
+        self.short_year = 'y' in slices
+        self.month_name = 'b' in slices
+        self.year = slices['y' if self.short_year else 'Y']
+        self.month = slices['b' if self.month_name else 'm']
+        self.day = slices['d']
+
+    def __repr__(self) -> str:
+        return f"DatePattern({self.key!r}, shape={self.shape!r})"
+
+    def parse(self, text: str) -> Optional[datetime.date]:
+        """
+        Parse a string of this pattern's shape.
+
+        Returns:
+            Optional[datetime.date]: The date, or None if the fields do not form a valid date.
+        """
+        year = int(text[self.year])
+        if self.short_year:
+            # Same pivot as strptime: 69-99 -> 1969-1999, 00-68 -> 2000-2068.
+            year += 1900 if year >= 69 else 2000
+        if self.month_name:
+            month = MONTHS.get(text[self.month].lower())
+            if month is None:
+                return None
+        else:
+            month = int(text[self.month])
+        try:
+            return datetime.date(year, month, int(text[self.day]))
+        except ValueError:
+            return None
+
+
+def _tokenize(format: str) -> list:
+    tokens = []
+    index = 0
+    while index < len(format):
+        if format[index] == '%':
+            directive = format[index + 1:index + 2]
+            if directive not in DIRECTIVES:
+                raise ValueError(f'Unsupported directive %{directive} in date format {format!r}.')
+            tokens.append(('%', directive))
+            index += 2
+        else:
+            tokens.append(('', format[index]))
+            index += 1
+    return tokens
+
+
+def compile_format(key: str, format: str) -> list[DatePattern]:
+    """
+    Compile a strptime date format into one DatePattern per input shape it accepts.
+
+    Supported directives are %Y, %y, %m, %d and %b (English month abbreviations,
+    case-insensitive); every other character is matched literally.
+
+    Args:
+        key (str): The name of the format.
+        format (str): The strptime format.
+
+    Returns:
+        list[DatePattern]: The compiled patterns.
+
+    Raises:
+        ValueError: If the format uses another directive, or lacks a year, month or day.
+    """
+    tokens = _tokenize(format)
+    directives = [value for kind, value in tokens if kind == '%']
+    if (sorted(set(directives)) != sorted(directives)
+            or len({'Y', 'y'} & set(directives)) != 1
+            or len({'m', 'b'} & set(directives)) != 1
+            or 'd' not in directives):
+        raise ValueError(f'Date format {format!r} needs exactly one year, month and day.')
+
+    # When a shape admits several width combinations (e.g. '9999999' for
+    # '%d%m%Y'), they are tried widest first, as strptime's backtracking does.
+    choices = [DIRECTIVES[value][0] if kind == '%' else (None,) for kind, value in tokens]
+
+    patterns = []
+    for widths in itertools.product(*choices):
+        shape = []
+        slices = {}
+        offset = 0
+        for (kind, value), width in zip(tokens, widths):
+            if kind != '%':
+                shape.append(value.translate(SHAPE))
+                offset += 1
+                continue
+            shape.append(DIRECTIVES[value][1] * width)
+            slices[value] = slice(offset, offset + width)
+            offset += width
+        patterns.append(DatePattern(key, format, ''.join(shape), slices))
+    return patterns
+
+
+class DateParser:
+    """
+    A date parsing engine precompiled from a set of strptime formats, by default
+    `booze.consts.date_formats`.
+
+    Instead of trying `strptime` with every format, the parser classifies the
+    input by its shape (digit runs, letters and separators, see `SHAPE`) and
+    only tries the formats compiled for that shape, in the order of the formats
+    mapping. The parser keeps no state between calls: an ambiguous date (such as
+    '05-06-2023', 'DD-MM-YYYY' against 'MM-DD-YYYY') always resolves to the first
+    matching format, whatever was parsed before, and a parser can be shared
+    between threads.
+
+    Compiled tables are shared between parsers built from the same formats.
+
+    Args:
+        formats (Mapping[str, str]): Format names mapped to strptime formats.
+
+    Example:
+        >>> parser = DateParser()
+        >>> parser.parse('Jul-23-2023')
+        datetime.date(2023, 7, 23)
+    """
+
+    _tables: dict = {}
+
+    def __init__(self, formats: Mapping[str, str] = date_formats) -> None:
+        self.patterns = self.compile(formats)
+
+    @classmethod
+    def compile(cls, formats: Mapping[str, str]) -> dict:
+        """
+        Compile the formats into a table mapping input shapes to their patterns.
+
+        Returns:
+            dict[str, tuple[DatePattern, ...]]: The patterns of each shape, in format order.
+        """
+        cache_key = tuple(formats.items())
+        table = cls._tables.get(cache_key)
+        if table is None:
+            table = {}
+            for key, format in formats.items():
+                for pattern in compile_format(key, format):
+                    table.setdefault(pattern.shape, []).append(pattern)
+            table = {shape: tuple(patterns) for shape, patterns in table.items()}
+            cls._tables[cache_key] = table
+        return table
+
+    def parse(self, text: str) -> Optional[datetime.date]:
+        """
+        Parse a date string in any of the compiled formats.
+
+        Args:
+            text (str): The string to parse.
+
+        Returns:
+            Optional[datetime.date]: The date, or None if no format matches.
+        """
+        for pattern in self.patterns.get(text.translate(SHAPE), ()):
+            result = pattern.parse(text)
+            if result is not None:
+                return result
+        return None
+
+
+def _iso_date(text: str, end: int) -> Optional[datetime.date]:
+    # 'YYYY-MM-DD' when end is 10, 'YYYYMMDD' when it is 8.
+    if end == 10:
+        if text[7:8] != '-':
+            return None
+        digits = text[:4] + text[5:7] + text[8:10]
+    else:
+        digits = text[:8]
+    if len(digits) != 8 or not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        return datetime.date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    except ValueError:
+        return None
+
+
+def _iso_time(text: str) -> Optional[tuple]:
+    # HH[:MM[:SS[.f+]]] or HH[MM[SS[.f+]]]; returns (hour, minute, second, microsecond).
+    fraction = 0
+    for separator in '.,':
+        index = text.find(separator)
+        if index != -1:
+            digits = text[index + 1:]
+            if not digits or not (digits.isascii() and digits.isdigit()):
+                return None
+            # Digits beyond microseconds are truncated, not rounded.
+            fraction = int(digits[:6].ljust(6, '0'))
+            text = text[:index]
+            if len(text) not in (6, 8):
+                # A fraction needs seconds.
+                return None
+            break
+    if text[2:3] == ':':
+        if len(text) not in (5, 8) or (len(text) == 8 and text[5] != ':'):
+            return None
+        text = text[:2] + text[3:5] + text[6:]
+    if len(text) not in (2, 4, 6) or not (text.isascii() and text.isdigit()):
+        return None
+    return int(text[:2]), int(text[2:4] or 0), int(text[4:6] or 0), fraction
+
+
+def parse_iso_date(text: str) -> Optional[datetime.date]:
+    """
+    Parse an ISO-8601 calendar date in extended form ('YYYY-MM-DD').
+
+    Returns:
+        Optional[datetime.date]: The date, or None if the text is not an ISO date.
+    """
+    if len(text) != 10 or not CANONICAL_ISO.fullmatch(text):
+        return None
+    # Every supported Python version parses this layout the same way.
+    try:
+        return datetime.date.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def parse_iso_datetime(text: str) -> Optional[datetime.datetime]:
+    """
+    Parse an ISO-8601 date or datetime, with the same results on every supported
+    Python version (`fromisoformat` accepts more forms from Python 3.11 on).
+
+    Accepted forms are a date, 'YYYY-MM-DD' (or 'YYYYMMDD' when a time follows),
+    optionally followed by 'T', 't' or a space and a time, 'HH', 'HH:MM',
+    'HH:MM:SS' or their basic forms 'HHMM' and 'HHMMSS'. Seconds may carry a
+    fraction after '.' or ',', truncated to microseconds. The time may end with
+    a UTC offset, 'Z', '+HH', '+HHMM' or '+HH:MM' (see `parse_offset`).
+
+    Returns:
+        Optional[datetime.datetime]: The datetime, or None if the text is not ISO-8601.
+
+    Example:
+        >>> parse_iso_datetime('20230723T123456.5Z')
+        datetime.datetime(2023, 7, 23, 12, 34, 56, 500000, tzinfo=datetime.timezone.utc)
+    """
+    if CANONICAL_ISO.fullmatch(text):
+        # The layouts of `isoformat()`, which `fromisoformat` parses the same way
+        # on every supported Python version, and much faster.
+        try:
+            return datetime.datetime.fromisoformat(text)
+        except ValueError:
+            return None
+
+    if text[4:5] == '-':
+        end = 10
+    elif text[8:9] in ('T', 't'):
+        end = 8
+    else:
+        return None
+    date = _iso_date(text, end)
+    if date is None:
+        return None
+    if len(text) == end:
+        return datetime.datetime(date.year, date.month, date.day)
+    if text[end] not in 'Tt ':
+        return None
+
+    time_text, tz = text[end + 1:], None
+    for index, char in enumerate(time_text):
+        if char in '+-Z':
+            tz = parse_offset(time_text[index:])
+            if tz is None:
+                return None
+            time_text = time_text[:index]
+            break
+    time = _iso_time(time_text)
+    if time is None:
+        return None
+    try:
+        return datetime.datetime(date.year, date.month, date.day, *time, tz)
+    except ValueError:
+        return None
+
+
+def parse_time(text: str) -> Optional[datetime.time]:
+    """
+    Parse a time of day: 'HH:MM', 'HH:MM:SS' or 'HH:MM:SS.ffffff', in 24-hour form
+    or in 12-hour form followed by AM or PM.
+
+    Returns:
+        Optional[datetime.time]: The time, or None if the text is not a valid time.
+    """
+    match = TIME.fullmatch(text)
+    if match is None:
+        return None
+    hour, minute, second, fraction, meridian = match.groups()
+    hour = int(hour)
+    if meridian is not None:
+        if not 1 <= hour <= 12:
+            return None
+        hour = hour % 12 + (12 if meridian in 'Pp' else 0)
+    try:
+        return datetime.time(
+            hour, int(minute), int(second or 0),
+            int(fraction.ljust(6, '0')) if fraction else 0,
+        )
+    except ValueError:
+        return None
+
+
+def parse_offset(text: str) -> Optional[datetime.timezone]:
+    """
+    Parse a UTC offset: 'Z', '+HH', '+HHMM' or '+HH:MM' (or with '-'). The
+    timezone objects are cached in `OFFSETS`, so repeated offsets return the
+    same object.
+
+    Returns:
+        Optional[datetime.timezone]: The timezone, or None if the text is not a valid offset.
+    """
+    tz = OFFSETS.get(text)
+    if tz is not None:
+        return tz
+    if len(text) == 6 and text[3] == ':':
+        digits = text[1:3] + text[4:]
+    elif len(text) in (3, 5):
+        digits = text[1:]
+    else:
+        return None
+    if text[0] not in '+-' or not digits.isdigit():
+        return None
+    hours, minutes = int(digits[:2]), int(digits[2:] or 0)
+    if hours > 23 or minutes > 59:
+        return None
+    offset = datetime.timedelta(hours=hours, minutes=minutes)
+    if not offset:
+        tz = datetime.timezone.utc
+    else:
+        tz = datetime.timezone(-offset if text[0] == '-' else offset)
+    OFFSETS[text] = tz
+    return tz
+
+
+def split_offset(text: str) -> tuple:
+    """
+    Split a trailing UTC offset ('Z', '+03:00', '-0500', '+03') off a datetime
+    string. Only a suffix following a time of day counts as an offset, so
+    '2023-07-23' keeps its '-23'.
+
+    Returns:
+        tuple: `(text, tzinfo)`: the text without its offset and the offset's timezone,
+            or the text unchanged and None if it has no valid offset.
+    """
+    if text[-1:] == 'Z':
+        suffix = 'Z'
+    else:
+        for size in (6, 5, 3):
+            if text[-size:1 - size] in ('+', '-'):
+                suffix = text[-size:]
+                break
+        else:
+            return text, None
+
+    head = text[:-len(suffix)].rstrip()
+    if ':' not in head:
+        return text, None
+    tz = parse_offset(suffix)
+    if tz is None:
+        return text, None
+    return head, tz
+
+
+def resolve_timezone(tz: Union[str, datetime.tzinfo]) -> datetime.tzinfo:
+    """
+    Return the tzinfo for a timezone name ('UTC' or an IANA name such as
+    'America/Sao_Paulo', looked up with `zoneinfo`) or tzinfo object.
+
+    Raises:
+        ValueError: If the name is not a known timezone.
+    """
+    if isinstance(tz, datetime.tzinfo):
+        return tz
+    if tz.upper() in ('UTC', 'Z'):
+        return datetime.timezone.utc
+    import zoneinfo
+    try:
+        return zoneinfo.ZoneInfo(tz)
+    except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f'Unknown timezone {tz!r}.') from None
+
+
+class DateTimeParser:
+    """
+    A datetime parsing engine. ISO-8601 strings go straight to
+    `parse_iso_datetime`; anything else is split at the first space into a
+    date, parsed by a DateParser, and an optional time of day, parsed by
+    `parse_time`. A date without time is taken at midnight.
+
+    The dates parsed last are kept in a small bounded cache keyed on their text
+    (the part before the first space), so that in a feed of timestamps sharing
+    a few dates only the time of day is parsed for most values. ISO-8601
+    strings do not use it: their fixed layout parses faster than a lookup plus
+    a separate time parse.
+
+    With a target timezone `tz`, a trailing UTC offset ('Z', '+03:00',
+    '-0500') is split off and looked up in the `OFFSETS` cache, and every result
+    is converted to `tz`. Values without offset are taken to be in `tz` already.
+
+    Args:
+        formats (Mapping[str, str]): Format names mapped to strptime date formats.
+        tz (Optional[Union[str, datetime.tzinfo]]): The timezone to normalize to, if any.
+        prefix_cache (int): The number of distinct dates to cache; 0 disables the cache.
+
+    Example:
+        >>> parser = DateTimeParser()
+        >>> parser.parse('2023-07-23T12:34:56')
+        datetime.datetime(2023, 7, 23, 12, 34, 56)
+        >>> parser.parse('Jul/23/2023 12:34 PM')
+        datetime.datetime(2023, 7, 23, 12, 34)
+        >>> DateTimeParser(tz='UTC').parse('2023-07-23 12:34:56-0300')
+        datetime.datetime(2023, 7, 23, 15, 34, 56, tzinfo=datetime.timezone.utc)
+    """
+
+    def __init__(
+            self,
+            formats: Mapping[str, str] = date_formats,
+            tz: Optional[Union[str, datetime.tzinfo]] = None,
+            prefix_cache: int = 64
+        ) -> None:
+        self.dates = DateParser(formats)
+        self.tz = None if tz is None else resolve_timezone(tz)
+        self.prefix_cache = prefix_cache
+        self.prefixes: dict = {}
+
+    def parse(self, text: str) -> Optional[datetime.datetime]:
+        """
+        Parse a datetime string.
+
+        Args:
+            text (str): The string to parse.
+
+        Returns:
+            Optional[datetime.datetime]: The datetime, or None if the text cannot be parsed.
+        """
+        if self.tz is None:
+            return self._parse(text)
+
+        text, offset = split_offset(text)
+        result = self._parse(text)
+        if result is None:
+            return None
+        return self.localize(result, offset)
+
+    def localize(
+            self,
+            value: datetime.datetime,
+            offset: Optional[datetime.tzinfo] = None
+        ) -> datetime.datetime:
+        """
+        Convert a datetime to the target timezone. A naive datetime is taken to
+        be at `offset`, or in the target timezone if no offset is given.
+
+        Returns:
+            datetime.datetime: The datetime in the target timezone.
+        """
+        if value.tzinfo is None:
+            # The constructor is several times faster than `replace(tzinfo=...)`.
+            value = datetime.datetime(
+                value.year, value.month, value.day, value.hour, value.minute,
+                value.second, value.microsecond, offset or self.tz,
+            )
+        if value.tzinfo is self.tz:
+            return value
+        return value.astimezone(self.tz)
+
+    def _parse(self, text: str) -> Optional[datetime.datetime]:
+        result = parse_iso_datetime(text)
+        if result is not None:
+            return result
+
+        date_text, _, time_text = text.partition(' ')
+        date = self.prefixes.get(date_text)
+        if date is None:
+            date = self.dates.parse(date_text)
+            if date is None:
+                return None
+            if self.prefix_cache:
+                self._remember(date_text, date)
+
+        if not time_text:
+            return datetime.datetime(date.year, date.month, date.day)
+        if (len(time_text) == 8 and time_text[2] == time_text[5] == ':'
+                and (time_text[:2] + time_text[3:5] + time_text[6:]).isdigit()):
+            # Fast path for the common 'HH:MM:SS'.
+            try:
+                return datetime.datetime(
+                    date.year, date.month, date.day,
+                    int(time_text[:2]), int(time_text[3:5]), int(time_text[6:]),
+                )
+            except ValueError:
+                return None
+        time = parse_time(time_text)
+        if time is None:
+            return None
+        return datetime.datetime.combine(date, time)
+
+    def _remember(self, date_text: str, date: datetime.date) -> None:
+        prefixes = self.prefixes
+        if len(prefixes) >= self.prefix_cache:
+            # Evict the oldest date; feeds mostly move forward in time.
+            with suppress(StopIteration, KeyError, RuntimeError):
+                del prefixes[next(iter(prefixes))]
+        prefixes[date_text] = date
@@ -1,3 +1,4 @@
+import reprlib
 from typing import Optional
 from contextlib import suppress
 from typing import Union
@@ -10,14 +11,17 @@ class ParsingError(Exception):
     fails to pass validation by a specific validator.
 
     Args:
-        message (str): The error message describing the reason for the parsing error.
+        message (Optional[str]): The error message describing the reason for the parsing error. If None,
+            it is rendered from `template` and `value` the first time it is read.
         validation_func (str, optional): The name of the validation function that raised the error. Default is 'Initializing'.
         coercer (Optional[Coerce], optional): The Coerce object associated with the parsing error. Default is None.
+        value (Any, optional): The rejected value. Default is None.
 
     Attributes:
         message (str): The error message describing the reason for the parsing error.
         validation_func (str): The name of the validation function that raised the error.
         coercer (Optional[Coerce]): The Coerce object associated with the parsing error.
+        value (Any): The rejected value.
 
     Methods:
         dict(): Returns a dictionary representation of the ParsingError.
@@ -30,16 +34,71 @@ class ParsingError(Exception):
 
     """
 
+    # The message of errors created without one, rendered on first access.
+    template = 'Error in validating data for value {value}'
+    # The maximum length of the value as shown in the rendered message.
+    max_value_length = 80
+
     def __init__(
-            self, msg: str,
+            self, msg: Optional[str] = None,
             validation_func: str = 'Initializing',
-            coercer: Optional['Coerce'] = None
+            coercer: Optional['Coerce'] = None,
+            value: any = None
         ):
-        str_msg = str(msg)
-        super().__init__(str_msg)
-        self.msg = msg
+        # The message is rendered lazily, so no argument goes to Exception.
+        super().__init__()
+        self._msg = msg
         self.validation_func = validation_func
         self.coercer = coercer
+        self.value = value
+
+    @property
+    def msg(self) -> str:
+        """
+        The error message. Without an explicit one, `template` is rendered with the
+        rejected value, shortened to `max_value_length` characters, on first access.
+        """
+        if self._msg is None:
+            self._msg = self.template.format(value=self._short_value())
+        return self._msg
+
+    @msg.setter
+    def msg(self, msg: str) -> None:
+        self._msg = msg
+
+    @property
+    def args(self) -> tuple:
+        return (self.msg,)
+
+    def _short_value(self) -> str:
+        limit = self.max_value_length
+        value = self.value
+        if isinstance(value, str):
+            text = value[:limit + 1]
+        else:
+            # reprlib only looks at the first items of large containers.
+            short = reprlib.Repr()
+            short.maxstring = short.maxother = short.maxlong = limit
+            text = short.repr(value)
+        if len(text) > limit:
+            text = text[:max(limit - 3, 0)] + '...'
+        return text
+
+    def __reduce__(self):
+        # Exceptions pickle only their args by default; keep every attribute so
+        # errors raised in worker processes arrive intact. The message is
+        # rendered so the value itself is not pickled.
+        return type(self), (self.msg, self.validation_func, self.coercer)
+
+    def __copy__(self) -> 'ParsingError':
+        # Unlike pickling, a copy keeps the value and leaves the message unrendered;
+        # ParseCache copies every failure it stores and raises.
+        error = type(self).__new__(type(self))
+        error.__dict__.update(self.__dict__)
+        return error
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.msg!r})'
 
     def dict(self) -> dict:
         """
@@ -69,3 +128,126 @@ class ParsingError(Exception):
             str: A string containing the error message, validation function name, and Coerce object.
         """
         return f"ParsingError: {self.msg}, ValidationFunction: {self.validation_func}, Coercer: {self.coercer}"
+
+
+
+class FieldError:
+    """
+    One entry of a ParsingErrors: the path of an invalid field and why it was
+    rejected. It only references the failed parse result, so the error message
+    is rendered when it is first read.
+
+    Attributes:
+        path (tuple): The path of the field, e.g. `('age',)`.
+    """
+
+    __slots__ = ('path', '_result')
+
+    def __init__(self, path: tuple, result: 'ParseResult') -> None:
+        self.path = path
+        self._result = result
+
+    def __repr__(self) -> str:
+        return f'FieldError({self.field!r}, {self.validator!r})'
+
+    @property
+    def field(self) -> str:
+        """
+        The path as a string, such as 'address.zip' or 'items[0]'.
+        """
+        return ''.join(
+            f'[{key}]' if isinstance(key, int) else f'.{key}' if index else str(key)
+            for index, key in enumerate(self.path)
+        )
+
+    @property
+    def validator(self) -> str:
+        """
+        The name of the validator that rejected the value.
+        """
+        return self._result.validator
+
+    @property
+    def error(self) -> ParsingError:
+        """
+        The ParsingError of the field.
+        """
+        return self._result.error
+
+    @property
+    def message(self) -> str:
+        """
+        The error message.
+        """
+        return self._result.error.msg
+
+    def dict(self) -> dict:
+        """
+        Returns a dictionary representation of the entry.
+
+        Returns:
+            dict: The field path, validation function name and error message.
+        """
+        return {
+            'Field': self.field,
+            'ValidationFunction': self.validator,
+            'Error': self.message,
+        }
+
+
+class ParsingErrors(ParsingError):
+    """
+    A ParsingError aggregating the errors of every invalid field of an object,
+    raised by `Base.validate_all`. Since it is a ParsingError, code catching
+    ParsingError handles it too.
+
+    Args:
+        errors (list[FieldError]): One entry per invalid field.
+
+    Attributes:
+        errors (list[FieldError]): One entry per invalid field.
+
+    Example:
+        >>> try:
+        >>>     Person.validate_all(name='Jo', age=15)
+        >>> except ParsingErrors as errors:
+        >>>     for error in errors:
+        >>>         print(error.field, error.validator, error.message)
+    """
+
+    def __init__(self, errors: list) -> None:
+        super().__init__(f'{len(errors)} invalid field(s)', 'Multiple')
+        self.errors = errors
+
+    def __reduce__(self):
+        return type(self), (self.errors,)
+
+    def __iter__(self):
+        return iter(self.errors)
+
+    def __len__(self) -> int:
+        return len(self.errors)
+
+    def dict(self) -> dict:
+        """
+        Returns a dictionary representation of the ParsingErrors.
+
+        Returns:
+            dict: The summary message and the dictionary of every entry.
+        """
+        return {
+            'Error': self.msg,
+            'Errors': [error.dict() for error in self.errors],
+        }
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the ParsingErrors.
+
+        Returns:
+            str: The summary message followed by the field, validator and message of every entry.
+        """
+        details = '; '.join(
+            f'{error.field} ({error.validator}): {error.message}' for error in self.errors
+        )
+        return f"ParsingErrors: {self.msg}: {details}"
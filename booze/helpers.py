@@ -1,15 +1,59 @@
-def check_numeric(value):
-    test = []
+from decimal import Decimal
+from typing import Optional, Union
+
+
+# The alphabetic strings `float` accepts.
+SPECIAL_FLOATS = frozenset({'inf', 'infinity', 'nan'})
+
+
+def to_number(value: any) -> Optional[Union[int, float]]:
+    """
+    Classify a value as numeric and return it as a number, without raising.
+
+    A value is numeric if `float(value)` or `int(value)` accepts it. Numbers
+    are returned as they are; Decimals as floats; strings of digits, with an
+    optional sign and decimal point, are converted directly. Only the other
+    values (exponents, 'inf', bytes, objects with `__float__`...) go through
+    `float` and `int` inside a try block.
+
+    Args:
+        value (Any): The value to classify.
+
+    Returns:
+        Optional[Union[int, float]]: The number, or None if the value is not numeric.
+
+    Example:
+        >>> to_number('42'), to_number('-1.5'), to_number('abc')
+        (42, -1.5, None)
+    """
+    kind = type(value)
+    if kind is int or kind is float or kind is bool:
+        return value
+
+    if kind is str:
+        # Python refuses to convert int strings of more than 4300 digits.
+        if value.isdecimal() and len(value) <= 4300:
+            return int(value)
+        if value.isalpha():
+            return float(value) if value.lower() in SPECIAL_FLOATS else None
+        digits = value[1:] if value[:1] in ('-', '+') else value
+        if digits.replace('.', '', 1).isdecimal():
+            return float(value) if '.' in digits or len(digits) > 4300 else int(value)
+    elif kind is Decimal:
+        return None if value.is_snan() else float(value)
+
     try:
-        float(value)
-        test.append(True)
-    except:
-        test.append(False)
-        
+        return float(value)
+    except (TypeError, ValueError, OverflowError):
+        pass
     try:
-        int(value)
-        test.append(True)
-    except:
-        test.append(False)
-        
-    return any(test)
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def check_numeric(value: any) -> bool:
+    """
+    Return whether `float(value)` or `int(value)` accepts the value.
+    """
+    return to_number(value) is not None
@@ -0,0 +1,516 @@
+import csv
+import io
+import json
+import mmap
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from typing import Callable, IO, Iterator, Optional, Union
+from booze.errors import ParsingError
+from booze import validators
+
+PathOrFile = Union[str, os.PathLike, IO]
+
+# The spellings of booleans in CSV files, lowercased. `Coerce.boolean` only
+# accepts 'True' and 'False' among strings, so the cells of boolean fields are
+# mapped to bools first.
+CSV_BOOLEANS = {'true': True, 'false': False, '1': True, '0': False}
+
+# The characters `errors='surrogateescape'` decodes invalid UTF-8 bytes to.
+SURROGATES = re.compile('[\udc80-\udcff]')
+
+
+class IngestStats:
+    """
+    Counters of a file ingestion, updated while the records are read, so they
+    can be inspected during and after the iteration.
+
+    Attributes:
+        records (int): The number of records read (blank lines excluded).
+        valid (int): The number of valid records.
+        invalid (int): The number of rejected records.
+        elapsed (float): The seconds spent so far.
+
+    Example:
+        >>> stats = IngestStats()
+        >>> for person in Person.iter_parse_jsonl('people.jsonl', rejects='rejects.jsonl', stats=stats):
+        >>>     ...
+        >>> print(f'{stats.records_per_second:,.0f} records/s, {stats.invalid} rejected')
+    """
+
+    __slots__ = ('records', 'valid', 'invalid', 'elapsed', '_started')
+
+    def __init__(self) -> None:
+        self.records = 0
+        self.valid = 0
+        self.invalid = 0
+        self.elapsed = 0.0
+        self._started = None
+
+    def __repr__(self) -> str:
+        return (f'IngestStats(records={self.records}, valid={self.valid}, '
+                f'invalid={self.invalid}, records_per_second={self.records_per_second:,.0f})')
+
+    @property
+    def records_per_second(self) -> float:
+        """
+        The throughput so far, in records per second.
+        """
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def _start(self) -> None:
+        self._started = time.perf_counter()
+
+    def _tick(self) -> None:
+        self.elapsed = time.perf_counter() - self._started
+
+
+def _open(
+        source: PathOrFile, mode: str, stack: ExitStack,
+        newline: Optional[str] = None, errors: Optional[str] = None
+    ) -> IO:
+    if isinstance(source, (str, os.PathLike)):
+        encoding = None if 'b' in mode else 'utf-8'
+        return stack.enter_context(
+            open(source, mode, encoding=encoding, errors=errors, newline=newline)
+        )
+    return source
+
+
+def _reject_writer(rejects: Optional[PathOrFile], stack: ExitStack) -> Optional[Callable]:
+    if rejects is None:
+        return None
+    # Lines are written back unchanged, converted to the mode of the file.
+    file = _open(rejects, 'wb', stack)
+    text = isinstance(file, io.TextIOBase)
+
+    def write(line):
+        if isinstance(line, bytes) and text:
+            line = line.decode('utf-8', 'replace')
+        elif isinstance(line, str) and not text:
+            line = line.encode('utf-8')
+        file.write(line)
+        if not line.endswith(b'\n' if isinstance(line, bytes) else '\n'):
+            file.write(b'\n' if isinstance(line, bytes) else '\n')
+
+    return write
+
+
+def iter_parse_jsonl(
+        model: type,
+        source: PathOrFile,
+        on_error: Optional[Callable[[int, ParsingError], None]] = None,
+        rejects: Optional[PathOrFile] = None,
+        stats: Optional[IngestStats] = None,
+        first_line: int = 1
+    ) -> Iterator:
+    """
+    Read a JSON Lines file one line at a time, yielding an instance of `model`
+    for each valid line. Only one line is held in memory at a time, so files of
+    any size are processed in bounded memory. Blank lines are skipped.
+
+    A line that is not a JSON object, or whose record fails validation, is
+    rejected: `on_error` is called with its line number (1-based) and its
+    ParsingError, and the raw line is written to `rejects`. Without `on_error`
+    nor `rejects`, the first rejected line raises its ParsingError.
+
+    Args:
+        model (type): The Base subclass to build.
+        source (Union[str, os.PathLike, IO]): A path, or a binary or text file object.
+        on_error (Optional[Callable[[int, ParsingError], None]]): Called for each rejected line.
+        rejects (Optional[Union[str, os.PathLike, IO]]): A path or file object the
+            rejected lines are written to, unchanged.
+        stats (Optional[IngestStats]): Counters updated while reading, including the
+            throughput in records per second.
+        first_line (int): The number of the first line, when `source` is a part of a file.
+
+    Returns:
+        Iterator: The valid instances, in file order.
+
+    Raises:
+        ParsingError: If a line is rejected and neither `on_error` nor `rejects` is given.
+    """
+    stats = stats if stats is not None else IngestStats()
+    collect = on_error is not None or rejects is not None
+    create = model.__booze_create__
+
+    with ExitStack() as stack:
+        # Paths are read as bytes and decoded line by line, so an invalid byte
+        # only rejects its own line.
+        lines = _open(source, 'rb', stack)
+        write_reject = _reject_writer(rejects, stack)
+        stats._start()
+        for number, line in enumerate(lines, start=first_line):
+            if not line.strip():
+                continue
+            stats.records += 1
+            try:
+                # `json.loads` decodes bytes itself, but detecting their encoding
+                # first makes it noticeably slower than decoding up front.
+                record = json.loads(line.decode('utf-8') if type(line) is bytes else line)
+            except (ValueError, RecursionError) as error:
+                # UnicodeDecodeError is a ValueError; RecursionError comes from
+                # arrays or objects nested too deeply.
+                failure = ParsingError(f'Invalid JSON on line {number}: {error}', 'JSON')
+                record = None
+            else:
+                failure = None
+                if not isinstance(record, dict):
+                    failure = ParsingError(f'Line {number} is not a JSON object', 'JSON')
+
+            if failure is None:
+                if not collect:
+                    obj = create(model, record)
+                else:
+                    try:
+                        obj = create(model, record)
+                    except ParsingError as error:
+                        failure = error
+                if failure is None:
+                    stats.valid += 1
+                    stats._tick()
+                    yield obj
+                    continue
+            elif not collect:
+                raise failure
+
+            stats.invalid += 1
+            if on_error is not None:
+                on_error(number, failure)
+            if write_reject is not None:
+                write_reject(line)
+        stats._tick()
+
+
+class ChunkReport:
+    """
+    The outcome of validating one byte range of a file in a worker process.
+
+    Attributes:
+        start (int): The offset of the first byte of the chunk.
+        end (int): The offset right after its last byte.
+        first_line (int): The number of its first line (1-based).
+        lines (int): The number of lines in the chunk.
+        valid (int): The number of valid records.
+        invalid (int): The number of rejected records.
+    """
+
+    __slots__ = ('start', 'end', 'first_line', 'lines', 'valid', 'invalid')
+
+    def __init__(self, start: int, end: int, first_line: int, lines: int, valid: int, invalid: int):
+        self.start = start
+        self.end = end
+        self.first_line = first_line
+        self.lines = lines
+        self.valid = valid
+        self.invalid = invalid
+
+    def __repr__(self) -> str:
+        return (f'ChunkReport(lines={self.first_line}-{self.first_line + self.lines - 1}, '
+                f'valid={self.valid}, invalid={self.invalid})')
+
+
+def line_index(file: mmap.mmap, chunk_bytes: int) -> Iterator[tuple]:
+    """
+    Split a memory-mapped file into byte ranges of about `chunk_bytes` that end
+    on a line boundary, numbering the first line of each one.
+
+    Args:
+        file (mmap.mmap): The mapped file.
+        chunk_bytes (int): The minimum size of a range; it is extended to the end
+            of the line it stops in.
+
+    Returns:
+        Iterator[tuple[int, int, int]]: `(start, end, first_line)` for each range, in order.
+    """
+    if chunk_bytes < 1:
+        raise ValueError('chunk_bytes must be at least 1')
+    size = len(file)
+    start, line = 0, 1
+    while start < size:
+        newline = file.find(b'\n', start + chunk_bytes - 1)
+        end = size if newline == -1 else newline + 1
+        yield start, end, line
+        # Counting copies the range, but only one range at a time.
+        line += file[start:end].count(b'\n')
+        start = end
+
+
+def validate_range(model: type, path: str, start: int, end: int, first_line: int) -> tuple:
+    """
+    Validate the JSON Lines in a byte range of a file, in a worker process. The
+    worker maps the file itself, so only the path and offsets are pickled.
+
+    Args:
+        model (type): The Base subclass, pickled by reference.
+        path (str): The path of the file.
+        start (int): The offset of the first byte of the range.
+        end (int): The offset right after its last byte.
+        first_line (int): The number of the first line of the range.
+
+    Returns:
+        tuple: `(report, rejects)`, a ChunkReport and `(line number, raw line,
+            ParsingError)` tuples for the rejected lines.
+    """
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        data = mapped[start:end]
+    lines = data.split(b'\n')
+    if not lines[-1]:
+        lines.pop()
+
+    stats, errors = IngestStats(), []
+    on_error = lambda number, error: errors.append((number, lines[number - first_line], error))
+    for _ in iter_parse_jsonl(model, lines, on_error, stats=stats, first_line=first_line):
+        pass
+    return ChunkReport(start, end, first_line, len(lines), stats.valid, stats.invalid), errors
+
+
+def validate_jsonl_parallel(
+        model: type,
+        path: Union[str, os.PathLike],
+        workers: Optional[int] = None,
+        chunk_bytes: int = 8 * 2**20,
+        on_error: Optional[Callable[[int, ParsingError], None]] = None,
+        rejects: Optional[PathOrFile] = None,
+        stats: Optional[IngestStats] = None
+    ) -> Iterator[ChunkReport]:
+    """
+    Validate a JSON Lines file with a pool of worker processes, yielding a
+    ChunkReport per byte range, in file order. Records are validated and
+    discarded; nothing but offsets, counts and rejects crosses the process
+    boundary, so files larger than memory are handled.
+
+    The file is memory-mapped and split into ranges of about `chunk_bytes` ending
+    on line boundaries (see `line_index`). Each worker maps the file again,
+    decodes and validates its range. At most two ranges per worker are in
+    flight at once. Rejected lines are passed to `on_error` with their line
+    number and written to `rejects` in file order, as in `iter_parse_jsonl`.
+
+    The model is pickled by reference, so it must be defined at module level.
+
+    Args:
+        model (type): The Base subclass to validate against.
+        path (Union[str, os.PathLike]): The path of the file.
+        workers (Optional[int]): The number of worker processes; defaults to the
+            number of CPUs.
+        chunk_bytes (int): The approximate size of a range.
+        on_error (Optional[Callable[[int, ParsingError], None]]): Called for each rejected line.
+        rejects (Optional[Union[str, os.PathLike, IO]]): A path or file object the
+            rejected lines are written to, unchanged.
+        stats (Optional[IngestStats]): Totals updated as the chunks complete.
+
+    Returns:
+        Iterator[ChunkReport]: The report of each range.
+
+    Example:
+        >>> stats = IngestStats()
+        >>> for report in validate_jsonl_parallel(Event, 'events.jsonl', rejects='rejects.jsonl', stats=stats):
+        >>>     print(report)
+        >>> stats.records_per_second
+    """
+    path = os.fspath(path)
+    workers = workers or os.cpu_count() or 1
+    stats = stats if stats is not None else IngestStats()
+    if os.path.getsize(path) == 0:
+        return
+
+    with ExitStack() as stack:
+        file = stack.enter_context(open(path, 'rb'))
+        mapped = stack.enter_context(mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ))
+        write_reject = _reject_writer(rejects, stack)
+        executor = stack.enter_context(ProcessPoolExecutor(workers))
+
+        def drain(future):
+            report, errors = future.result()
+            for number, line, error in errors:
+                if on_error is not None:
+                    on_error(number, error)
+                if write_reject is not None:
+                    write_reject(line)
+            stats.records += report.valid + report.invalid
+            stats.valid += report.valid
+            stats.invalid += report.invalid
+            stats._tick()
+            return report
+
+        stats._start()
+        pending = deque()
+        try:
+            for start, end, first_line in line_index(mapped, chunk_bytes):
+                pending.append(executor.submit(validate_range, model, path, start, end, first_line))
+                if len(pending) >= workers * 2:
+                    yield drain(pending.popleft())
+            while pending:
+                yield drain(pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def resolve_columns(schema: 'Schema', header: list) -> list:
+    """
+    Map the columns of a CSV header onto the fields of a schema. A column
+    matches the field whose `Coerce.name` it equals, or else the field of the
+    same name; columns matching no field are ignored.
+
+    Args:
+        schema (Schema): The schema of the model.
+        header (list[str]): The column names.
+
+    Returns:
+        list[tuple[int, str]]: The `(column index, field)` pairs.
+
+    Raises:
+        ValueError: If two columns match the same field.
+
+    Example:
+        >>> class Person(Base):
+        >>>     age = Coerce('idade').integer()
+        >>> resolve_columns(Person.__booze_schema__, ['nome', 'idade'])
+        [(1, 'age')]
+    """
+    aliases = {field: field for field in schema.fields}
+    aliases.update((coercer.name, field) for field, coercer in schema.parsers.items())
+
+    columns, seen = [], {}
+    for index, column in enumerate(header):
+        field = aliases.get(column)
+        if field is None:
+            continue
+        if field in seen:
+            raise ValueError(f'Columns {header[seen[field]]!r} and {column!r} '
+                             f'both map to the field {field!r}')
+        seen[field] = index
+        columns.append((index, field))
+    return columns
+
+
+def iter_parse_csv(
+        model: type,
+        source: PathOrFile,
+        chunk_size: int = 1000,
+        on_error: Optional[Callable[[int, ParsingError], None]] = None,
+        rejects: Optional[PathOrFile] = None,
+        stats: Optional[IngestStats] = None,
+        **fmtparams
+    ) -> Iterator:
+    """
+    Read a CSV file with a header row, `chunk_size` rows at a time, yielding an
+    instance of `model` for each valid row. At most one chunk is held in memory
+    at a time, so files of any size are processed in constant memory.
+
+    The header is resolved to fields once per file (see `resolve_columns`), and
+    each row becomes a record of the strings in its matched columns; the field
+    validators coerce them (`integer()`, `float()`, `format_date()`...). In the
+    columns of `boolean()` fields, the spellings of `CSV_BOOLEANS` ('true',
+    'false', '1', '0', in any case) are turned into bools first; other values
+    are left to the validator. Blank rows are skipped.
+
+    A row with a different number of cells than the header, or failing
+    validation, is rejected: `on_error` is called with its row number (1-based,
+    not counting the header) and its ParsingError, and the row is written to
+    `rejects` below a copy of the header. Without `on_error` nor `rejects`, the
+    first rejected row raises its ParsingError. Files given by path are decoded
+    as UTF-8; rows with invalid bytes are rejected too, and written to a
+    `rejects` path with their original bytes.
+
+    Args:
+        model (type): The Base subclass to build.
+        source (Union[str, os.PathLike, IO]): A path, or a text file object opened
+            with `newline=''`.
+        chunk_size (int): The number of rows read at a time.
+        on_error (Optional[Callable[[int, ParsingError], None]]): Called for each rejected row.
+        rejects (Optional[Union[str, os.PathLike, IO]]): A path or text file object the
+            rejected rows are written to.
+        stats (Optional[IngestStats]): Counters updated while reading, including the
+            throughput in records per second.
+        **fmtparams: Formatting parameters passed to `csv.reader` and `csv.writer`,
+            such as `delimiter`.
+
+    Returns:
+        Iterator: The valid instances, in file order.
+
+    Raises:
+        ParsingError: If a row is rejected and neither `on_error` nor `rejects` is given.
+        ValueError: If two columns of the header map to the same field.
+    """
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    stats = stats if stats is not None else IngestStats()
+    collect = on_error is not None or rejects is not None
+    create = model.__booze_create__
+
+    with ExitStack() as stack:
+        # Invalid bytes are decoded to surrogates, so they reject their row
+        # instead of ending the file.
+        file = _open(source, 'r', stack, newline='', errors='surrogateescape')
+        undecodable = SURROGATES.search if file is not source else None
+        reader = csv.reader(file, **fmtparams)
+        header = next(reader, None)
+        if header is None:
+            return
+        columns = resolve_columns(model.__booze_schema__, header)
+        indices = [index for index, _ in columns]
+        fields = [field for _, field in columns]
+        schema = model.__booze_schema__
+        booleans = [field for field in fields if any(
+            type(validation) is validators.Boolean for validation in schema.parsers[field].validations
+        )]
+        width = len(header)
+
+        writer = None
+        if rejects is not None:
+            writer = csv.writer(
+                _open(rejects, 'w', stack, newline='', errors='surrogateescape'), **fmtparams
+            )
+            writer.writerow(header)
+
+        stats._start()
+        number = 0
+        while True:
+            chunk = list(islice(reader, chunk_size))
+            if not chunk:
+                break
+            for row in chunk:
+                number += 1
+                if not row:
+                    continue
+                stats.records += 1
+                if len(row) != width:
+                    failure = ParsingError(f'Row {number} has {len(row)} cells, '
+                                           f'expected {width}', 'CSV')
+                    if not collect:
+                        raise failure
+                elif undecodable is not None and undecodable(''.join(row)):
+                    failure = ParsingError(f'Row {number} is not valid UTF-8', 'CSV')
+                    if not collect:
+                        raise failure
+                else:
+                    record = dict(zip(fields, [row[index] for index in indices]))
+                    for field in booleans:
+                        cell = record[field]
+                        record[field] = CSV_BOOLEANS.get(cell.lower(), cell)
+                    failure = None
+                    if not collect:
+                        obj = create(model, record)
+                    else:
+                        try:
+                            obj = create(model, record)
+                        except ParsingError as error:
+                            failure = error
+                    if failure is None:
+                        stats.valid += 1
+                        stats._tick()
+                        yield obj
+                        continue
+
+                stats.invalid += 1
+                if on_error is not None:
+                    on_error(number, failure)
+                if writer is not None:
+                    writer.writerow(row)
+        stats._tick()
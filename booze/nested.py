@@ -0,0 +1,196 @@
+from typing import Callable, Iterator, Mapping, Optional
+from booze.errors import FieldError, ParsingError
+from booze.result import ParseResult
+from booze import validators
+
+
+def build(model: type, data: Mapping) -> 'Base':
+    """
+    Build an instance of a Base subclass whose fields may themselves be models
+    (`Coerce.model`, `Coerce.list_of`), however deeply nested.
+
+    Nested objects are built depth-first with an explicit work stack instead
+    of recursive constructor calls, so deep payloads do not grow the Python
+    call stack. Models without nested fields are built with their regular
+    (generated) constructor. Values that already are instances of the target
+    model are used as they are, without being validated again.
+
+    Args:
+        model (type): The Base subclass to build.
+        data (Mapping): The field values.
+
+    Returns:
+        Base: The instance.
+
+    Raises:
+        ParsingError: If a value, at any depth, fails validation.
+    """
+    result = []
+    _run(_object_frame(model, data, result.append))
+    return result[0]
+
+
+def build_list(model: type, items: list, coercer: 'Coerce', validation: 'Validator') -> list:
+    """
+    Build a list of instances of a Base subclass, like `build` for each item.
+
+    Args:
+        model (type): The Base subclass to build.
+        items (list): The items, each a mapping of field values or an instance of the model.
+        coercer (Coerce): The Coerce reporting items that are neither.
+        validation (Validator): The validator reported for such items.
+
+    Returns:
+        list: The instances.
+
+    Raises:
+        ParsingError: If an item, at any depth, fails validation.
+    """
+    result = []
+    _run(_list_frame(model, items, coercer, validation, result.append))
+    return result[0]
+
+
+def collect(model: type, data: Mapping, errors: list) -> Optional['Base']:
+    """
+    Build an instance like `build`, but validate every field, at every depth,
+    before failing: each rejected value is appended to `errors` as a FieldError
+    whose path leads to it from the top-level object, such as
+    `('address', 'zip')` or `('items', 1, 'quantity')`. Used by `Base.validate_all`.
+
+    Args:
+        model (type): The Base subclass to build.
+        data (Mapping): The field values.
+        errors (list[FieldError]): The list the errors are appended to.
+
+    Returns:
+        Optional[Base]: The instance, or None if any value was rejected.
+    """
+    result = []
+    _run(_collect_object_frame(model, data, (), errors, result.append))
+    return result[0]
+
+
+def _run(frame: Iterator) -> None:
+    # Each frame is a generator that yields the frames of its nested values
+    # and is resumed once they are built.
+    stack = [frame]
+    while stack:
+        child = next(stack[-1], None)
+        if child is None:
+            stack.pop()
+        else:
+            stack.append(child)
+
+
+def _object_frame(model: type, data: Mapping, done: Callable) -> Iterator:
+    schema = model.__booze_schema__
+    if not schema.nested_fields:
+        done(model.__booze_create__(model, data))
+        return
+
+    if not schema.keys.issuperset(data):
+        raise ParsingError('Erro na atribuição do valor. '
+                           'Você lembrou de cadastrar um Coercer para ela?')
+
+    obj = object.__new__(model)
+    for key, value in data.items():
+        coercer = schema.parsers[key]
+        nested = schema.nested_fields.get(key)
+        if nested is None:
+            obj.__setattr__(key, coercer.parse(value))
+            continue
+
+        context = validators.ParseContext(value)
+        for validation in coercer.validations:
+            if validation is not nested and validation(value, context) == False:
+                coercer._raise_error(validation, value)
+
+        setter = lambda result, key=key: obj.__setattr__(key, result)
+        if not nested.many:
+            if isinstance(value, nested.model):
+                obj.__setattr__(key, value)
+            elif isinstance(value, Mapping):
+                yield _object_frame(nested.model, value, setter)
+            else:
+                coercer._raise_error(nested, value)
+        elif isinstance(value, list):
+            yield _list_frame(nested.model, value, coercer, nested, setter)
+        else:
+            coercer._raise_error(nested, value)
+
+    done(obj)
+
+
+def _list_frame(model: type, items: list, coercer, nested, done: Callable) -> Iterator:
+    result = []
+    append = result.append
+    for item in items:
+        if isinstance(item, model):
+            append(item)
+        elif isinstance(item, Mapping):
+            yield _object_frame(model, item, append)
+        else:
+            coercer._raise_error(nested, item)
+    done(result)
+
+
+def _rejected(errors: list, path: tuple, coercer, validation, value) -> None:
+    errors.append(FieldError(path, ParseResult(False, None, coercer, validation, value)))
+
+
+def _collect_object_frame(model: type, data: Mapping, path: tuple, errors: list, done: Callable) -> Iterator:
+    schema = model.__booze_schema__
+    count = len(errors)
+    obj = object.__new__(model)
+    for key, value in data.items():
+        coercer = schema.parsers.get(key)
+        if coercer is None:
+            errors.append(FieldError(path + (key,), ParseResult(False, error=ParsingError(
+                'Erro na atribuição do valor. '
+                'Você lembrou de cadastrar um Coercer para ela?'))))
+            continue
+        nested = schema.nested_fields.get(key)
+        if nested is None:
+            result = coercer.try_parse(value)
+            if result.ok:
+                obj.__setattr__(key, result.value)
+            else:
+                errors.append(FieldError(path + (key,), result))
+            continue
+
+        context = validators.ParseContext(value)
+        rejected = next((validation for validation in coercer.validations
+                         if validation is not nested and validation(value, context) == False), None)
+        if rejected is not None:
+            _rejected(errors, path + (key,), coercer, rejected, value)
+            continue
+
+        setter = lambda result, key=key: obj.__setattr__(key, result)
+        if not nested.many:
+            if isinstance(value, nested.model):
+                obj.__setattr__(key, value)
+            elif isinstance(value, Mapping):
+                yield _collect_object_frame(nested.model, value, path + (key,), errors, setter)
+            else:
+                _rejected(errors, path + (key,), coercer, nested, value)
+        elif isinstance(value, list):
+            yield _collect_list_frame(nested.model, value, path + (key,), errors, coercer, nested, setter)
+        else:
+            _rejected(errors, path + (key,), coercer, nested, value)
+
+    done(obj if len(errors) == count else None)
+
+
+def _collect_list_frame(model: type, items: list, path: tuple, errors: list, coercer, nested,
+                        done: Callable) -> Iterator:
+    result = []
+    append = result.append
+    for index, item in enumerate(items):
+        if isinstance(item, model):
+            append(item)
+        elif isinstance(item, Mapping):
+            yield _collect_object_frame(model, item, path + (index,), errors, append)
+        else:
+            _rejected(errors, path + (index,), coercer, nested, item)
+    done(result)
@@ -0,0 +1,196 @@
+from typing import Optional
+from booze import validators
+from booze.helpers import to_number
+from booze.validators import ParseContext, Validator
+
+
+# Validators that only look at the raw value: they neither read nor write the
+# ParseContext, so they can run in any order without changing the result.
+CHEAP_CHECKS = (
+    validators.List,
+    validators.Dictionary,
+    validators.RequiredKeys,
+    validators.Length,
+    validators.MinLength,
+    validators.MaxLength,
+    validators.Min,
+    validators.Max,
+    validators.OneOf,
+)
+EXPENSIVE_CHECKS = (
+    validators.Contains,
+    validators.ContainsAll,
+    validators.ContainsAny,
+    validators.Numeric,
+    validators.Email,
+)
+# Validators that coerce the value or compare against the coerced value; they
+# keep their relative order.
+CONTEXT_VALIDATORS = (
+    validators.Integer,
+    validators.Float,
+    validators.String,
+    validators.Boolean,
+    validators.Strict,
+    validators.Lowercase,
+    validators.FormatDate,
+    validators.Date,
+    validators.DateTime,
+    validators.Each,
+)
+# Coercers whose result only depends on the raw value and their arguments, so a
+# repetition right after an identical one is a no-op.
+IDEMPOTENT_COERCERS = (
+    validators.Integer,
+    validators.Float,
+    validators.String,
+    validators.Lowercase,
+)
+
+
+class Range(Validator):
+    """
+    A Validator class fusing Min and Max validators into a single numeric range
+    check, classifying the value as a number once.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        lower (Optional[float]): The exclusive lower bound, as in Min.
+        upper (Optional[float]): The inclusive upper bound, as in Max.
+
+    Returns:
+        bool (bool): True if the value is within the range, False otherwise.
+    """
+
+    def __init__(self, coercer: 'Coerce', lower: Optional[float], upper: Optional[float]):
+        self.coercer = coercer
+        self.lower = lower
+        self.upper = upper
+
+    def __call__(self, value: any, context: ParseContext) -> bool:
+        number = to_number(value)
+        if number is None:
+            return False
+        if self.lower is not None and not self.lower < number:
+            return False
+        if self.upper is not None and number > self.upper:
+            return False
+        return True
+
+
+class LengthRange(Validator):
+    """
+    A Validator class fusing Length, MinLength and MaxLength validators into a
+    single length check, calling `len` once.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        length_min (int): The minimum length allowed.
+        length_max (Optional[int]): The maximum length allowed, if any.
+
+    Returns:
+        bool (bool): True if the length of the value is within the range, False otherwise.
+    """
+
+    def __init__(self, coercer: 'Coerce', length_min: int, length_max: Optional[int]):
+        self.coercer = coercer
+        self.length_min = length_min
+        self.length_max = length_max
+
+    def __call__(self, value: any, context: ParseContext) -> bool:
+        length = len(value)
+        if length < self.length_min:
+            return False
+        return self.length_max is None or length <= self.length_max
+
+
+def _fuse_range(coercer, checks: list) -> list:
+    mins = [check for check in checks if type(check) is validators.Min]
+    maxes = [check for check in checks if type(check) is validators.Max]
+    if not mins and not maxes:
+        return checks
+    if any(check.bound is None for check in mins + maxes):
+        # A bound that is not a number makes the original validators always fail.
+        return checks
+    lower = max(check.bound for check in mins) if mins else None
+    upper = min(check.bound for check in maxes) if maxes else None
+
+    rest = [check for check in checks if type(check) not in (validators.Min, validators.Max)]
+    return rest + [Range(coercer, lower, upper)]
+
+
+def _fuse_length(coercer, checks: list) -> list:
+    length_types = (validators.Length, validators.MinLength, validators.MaxLength)
+    lengths = [check for check in checks if type(check) in length_types]
+    if len(lengths) < 2:
+        return checks
+
+    lows = [check.length_min for check in lengths if hasattr(check, 'length_min')]
+    highs = [check.length_max for check in lengths if hasattr(check, 'length_max')]
+    fused = LengthRange(
+        coercer,
+        max(lows) if lows else 0,
+        min(highs) if highs else None,
+    )
+    index = checks.index(lengths[0])
+    rest = [check for check in checks if type(check) not in length_types]
+    return rest[:index] + [fused] + rest[index:]
+
+
+def optimize(coercer: 'Coerce') -> Optional[list]:
+    """
+    Build an optimized, equivalent validator chain for a Coerce.
+
+    Every validator receives the raw value, and only the coercing validators
+    and the ones reading the coerced value (Strict, Boolean) depend on their
+    position. The optimizer therefore:
+
+    - fuses every Min and Max into one Range check, and Length, MinLength and
+      MaxLength into one LengthRange check;
+    - drops a coercer repeated right after an identical one, and `numeric()`
+      when `integer()` or `float()` already guarantees it;
+    - runs cheap checks (type and length checks, ranges) first and expensive
+      ones (membership, regexes) last, keeping the coercing validators
+      in their relative order in between.
+
+    The optimized chain accepts exactly the values the original accepts and
+    produces the same coerced value. It may reject a value with a different
+    validator, or raise where the original would have rejected it first; callers
+    must rerun the original chain (`Coerce.parse`) on any rejection or exception
+    to report the original error.
+
+    Chains with validators the optimizer does not know (such as `custom`) are
+    left alone.
+
+    Args:
+        coercer (Coerce): The Coerce to optimize.
+
+    Returns:
+        Optional[list[Validator]]: The optimized chain, or None if it would be
+            identical to the original one.
+    """
+    known = CHEAP_CHECKS + EXPENSIVE_CHECKS + CONTEXT_VALIDATORS
+    chain = coercer.validations
+    if any(type(validation) not in known for validation in chain):
+        return None
+
+    cheap, expensive, context = [], [], []
+    for validation in chain:
+        if type(validation) in CHEAP_CHECKS:
+            cheap.append(validation)
+        elif type(validation) in EXPENSIVE_CHECKS:
+            expensive.append(validation)
+        elif (context and type(validation) in IDEMPOTENT_COERCERS
+                and type(context[-1]) is type(validation)):
+            continue
+        else:
+            context.append(validation)
+
+    if any(type(v) in (validators.Integer, validators.Float) for v in context):
+        expensive = [v for v in expensive if type(v) is not validators.Numeric]
+
+    cheap = _fuse_length(coercer, _fuse_range(coercer, cheap))
+    optimized = cheap + context + expensive
+    if optimized == chain:
+        return None
+    return optimized
@@ -0,0 +1,100 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Mapping, Optional
+
+
+def chunked(records: Iterable, size: int) -> Iterator[list]:
+    """
+    Split an iterable into lists of at most `size` items, consuming it lazily.
+
+    Args:
+        records (Iterable): The items to split.
+        size (int): The maximum length of each chunk.
+
+    Returns:
+        Iterator[list]: The chunks, in order.
+    """
+    if size < 1:
+        raise ValueError('The chunk size must be at least 1.')
+    iterator = iter(records)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def parse_chunk(model: type, offset: int, chunk: list, collect: bool) -> tuple:
+    """
+    Parse one chunk of records in a worker process.
+
+    Args:
+        model (type): The Base subclass, pickled by reference.
+        offset (int): The index of the first record of the chunk in the whole input.
+        chunk (list): The records of the chunk.
+        collect (bool): Whether to collect errors instead of raising the first one.
+
+    Returns:
+        tuple: `(objects, errors)`, where errors holds `(index, ParsingError)` tuples
+            indexed in the whole input.
+    """
+    create = model.__booze_create__
+    if not collect:
+        return [create(model, record) for record in chunk], []
+
+    errors = []
+    objects = list(model._parse_collecting(create, chunk, errors.append))
+    return objects, [(offset + index, error) for index, error in errors]
+
+
+def parse_parallel(
+        model: type,
+        records: Iterable[Mapping],
+        workers: int,
+        chunksize: int = 1000,
+        errors: Optional[list] = None
+    ) -> Iterator:
+    """
+    Parse records with a pool of worker processes, yielding the instances in
+    input order.
+
+    Records are sent to the workers in chunks of `chunksize`, and at most two
+    chunks per worker are in flight at once, so the input is consumed lazily.
+    The model is pickled by reference, so it must be defined at module level,
+    and records, instances and errors must be picklable.
+
+    Args:
+        model (type): The Base subclass to build.
+        records (Iterable[Mapping]): The records to parse.
+        workers (int): The number of worker processes.
+        chunksize (int): The number of records sent to a worker at a time.
+        errors (Optional[list]): If None, the first invalid record raises its
+            ParsingError. Otherwise `(index, ParsingError)` tuples are appended to it.
+
+    Returns:
+        Iterator: The valid instances, in input order.
+
+    Raises:
+        ParsingError: If a record is invalid and `errors` is None.
+    """
+    collect = errors is not None
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        try:
+            offset = 0
+            for chunk in chunked(records, chunksize):
+                pending.append(executor.submit(parse_chunk, model, offset, chunk, collect))
+                offset += len(chunk)
+                if len(pending) >= workers * 2:
+                    yield from _drain(pending.popleft(), errors)
+
+            while pending:
+                yield from _drain(pending.popleft(), errors)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _drain(future, errors: Optional[list]) -> list:
+    objects, chunk_errors = future.result()
+    if chunk_errors:
+        errors.extend(chunk_errors)
+    return objects
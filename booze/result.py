@@ -0,0 +1,83 @@
+from typing import Optional
+from booze.errors import ParsingError
+
+
+class ParseResult:
+    """
+    The outcome of a non-raising parse (`Coerce.try_parse`, `Base.try_create`):
+    either the parsed value, or the reason it was rejected.
+
+    A rejection only keeps references to the Coerce, the validator and the raw
+    value; the ParsingError, with its message, is built the first time `error`
+    is read. No exception is raised or caught on the way.
+
+    Attributes:
+        ok (bool): Whether the value was accepted. The result is also truthy when it was.
+        value (Any): The parsed value, or None if it was rejected.
+
+    Example:
+        >>> result = Coerce().integer().min(0).try_parse('-5')
+        >>> result.ok
+        False
+        >>> result.error.validation_func
+        'Min'
+    """
+
+    __slots__ = ('ok', 'value', '_error', '_coercer', '_validation', '_raw')
+
+    def __init__(
+            self,
+            ok: bool,
+            value: any = None,
+            coercer: Optional['Coerce'] = None,
+            validation: Optional['Validator'] = None,
+            raw: any = None,
+            error: Optional[ParsingError] = None
+        ) -> None:
+        self.ok = ok
+        self.value = value
+        self._coercer = coercer
+        self._validation = validation
+        self._raw = raw
+        self._error = error
+
+    def __bool__(self) -> bool:
+        return self.ok
+
+    def __repr__(self) -> str:
+        if self.ok:
+            return f'ParseResult(ok=True, value={self.value!r})'
+        return f'ParseResult(ok=False, error={self.error!r})'
+
+    @property
+    def error(self) -> Optional[ParsingError]:
+        """
+        The ParsingError of a rejected value, built on first access; None if the value was accepted.
+        """
+        if self._error is None and not self.ok:
+            self._error = self._coercer._error(self._validation, self._raw)
+            self._coercer = self._validation = self._raw = None
+        return self._error
+
+    @property
+    def validator(self) -> Optional[str]:
+        """
+        The name of the validator that rejected the value, without building the
+        error; None if the value was accepted.
+        """
+        if self.ok:
+            return None
+        if self._error is not None:
+            return self._error.validation_func
+        return type(self._validation).__name__
+
+    def unwrap(self) -> any:
+        """
+        Return the parsed value, or raise the ParsingError if it was rejected.
+
+        Raises:
+            ParsingError: If the value was rejected.
+        """
+        if self.ok:
+            return self.value
+        raise self.error
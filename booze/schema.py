@@ -0,0 +1,89 @@
+import weakref
+from typing import Iterable
+from booze.coercer import Coerce
+
+
+# The classes compiled with each Coerce, so they can be compiled again when a
+# validator is added to it afterwards.
+compiled_models = weakref.WeakKeyDictionary()
+
+
+class Schema:
+    """
+    A compiled description of the Coerce fields declared on a Base subclass.
+
+    The schema is built once, when the class is created, and then shared by every
+    instantiation of that class, so object construction never has to walk the class
+    namespace again.
+
+    Args:
+        fields (Iterable[tuple[str, Coerce]]): Ordered (field, Coerce) pairs.
+
+    Attributes:
+        fields (tuple[str, ...]): The field names, in declaration order.
+        coercers (tuple[Coerce, ...]): The Coerce instances, aligned with `fields`.
+        parsers (dict[str, Coerce]): A mapping of field name to its Coerce instance.
+        keys (frozenset[str]): The set of keyword arguments accepted by the class.
+        async_fields (frozenset[str]): The fields whose Coerce has async validators.
+        nested_fields (dict[str, Validator]): The fields whose Coerce builds nested models,
+            mapped to the validator that does (`Coerce.model`, `Coerce.list_of`).
+
+    Example:
+        >>> class Person(Base):
+        >>>     name = Coerce().string()
+        >>>     age = Coerce().integer()
+        >>> Person.__booze_schema__.fields
+        ('name', 'age')
+    """
+
+    __slots__ = ('fields', 'coercers', 'parsers', 'keys', 'async_fields', 'nested_fields')
+
+    def __init__(self, fields: Iterable[tuple[str, Coerce]] = ()) -> None:
+        self.parsers: dict[str, Coerce] = dict(fields)
+        self.fields = tuple(self.parsers)
+        self.coercers = tuple(self.parsers.values())
+        self.keys = frozenset(self.parsers)
+        self.async_fields = frozenset(
+            field for field, coercer in self.parsers.items() if coercer.is_async
+        )
+        self.nested_fields = {}
+        for field, coercer in self.parsers.items():
+            nested = [validation for validation in coercer.validations if validation.nested]
+            if nested:
+                self.nested_fields[field] = nested[0]
+
+    def __repr__(self) -> str:
+        return f"Schema(fields={self.fields})"
+
+    @classmethod
+    def compile(cls, model: type) -> 'Schema':
+        """
+        Build the schema of a Base subclass from its namespace and the namespaces
+        of its parents, so fields declared on a parent class are inherited.
+
+        Coerce instances without a name receive the attribute name they were
+        assigned to. Fields of classes declared with `slots=True` are read from
+        `__booze_fields__`, where the metaclass keeps them.
+
+        Args:
+            model (type): The class being compiled.
+
+        Returns:
+            Schema: The compiled schema.
+        """
+        fields: dict[str, Coerce] = {}
+        for klass in reversed(model.__mro__):
+            namespace = {**vars(klass), **vars(klass).get('__booze_fields__', {})}
+            for field, coercer in namespace.items():
+                if field.startswith('_'):
+                    continue
+                if not isinstance(coercer, Coerce):
+                    fields.pop(field, None)
+                    continue
+                if coercer.name is None:
+                    coercer.name = field
+                fields[field] = coercer
+
+        for coercer in fields.values():
+            compiled_models.setdefault(coercer, weakref.WeakSet()).add(model)
+        return cls(fields.items())
@@ -0,0 +1,77 @@
+from booze import Coerce, ParsingError
+import asyncio
+import pytest
+
+
+TAKEN = {'admin', 'root'}
+
+
+async def is_available(username):
+    await asyncio.sleep(0)
+    return username not in TAKEN
+
+
+def test_custom_validator():
+    coerce = Coerce().integer().custom(lambda value: int(value) % 2 == 0)
+
+    assert coerce.parse('42') == 42
+    with pytest.raises(ParsingError):
+        coerce.parse(3)
+
+
+def test_custom_validator_message():
+    coerce = Coerce('even').custom(lambda value: value % 2 == 0, message='Must be even')
+
+    with pytest.raises(ParsingError) as info:
+        coerce.parse(3)
+    assert info.value.msg == 'Must be even'
+    assert info.value.validation_func == 'Custom'
+
+
+def test_parse_async():
+    coerce = Coerce().string().lowercase().custom(is_available)
+    assert coerce.is_async
+
+    assert asyncio.run(coerce.parse_async('John')) == 'john'
+    with pytest.raises(ParsingError):
+        asyncio.run(coerce.parse_async('admin'))
+    with pytest.raises(ParsingError):
+        asyncio.run(coerce.parse_async(42))
+
+
+def test_parse_async_sync_chain():
+    coerce = Coerce().integer().min(0)
+    assert not coerce.is_async
+    assert asyncio.run(coerce.parse_async('10')) == 10
+
+
+def test_sync_parse_rejects_async_validators():
+    coerce = Coerce().string().custom(is_available)
+
+    with pytest.raises(TypeError):
+        coerce.parse('john')
+
+
+class Availability:
+    async def __call__(self, username):
+        await asyncio.sleep(0)
+        return username not in TAKEN
+
+
+def test_async_callable_object():
+    coerce = Coerce().string().custom(Availability())
+
+    assert coerce.is_async
+    assert asyncio.run(coerce.parse_async('john')) == 'john'
+    with pytest.raises(ParsingError):
+        asyncio.run(coerce.parse_async('admin'))
+    with pytest.raises(TypeError):
+        coerce.parse('john')
+
+
+def test_custom_returning_awaitable_is_refused(recwarn):
+    coerce = Coerce().string().custom(lambda value: is_available(value))
+
+    with pytest.raises(TypeError, match='parse_async'):
+        coerce.parse('admin')
+    assert not [w for w in recwarn if 'never awaited' in str(w.message)]
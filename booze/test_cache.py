@@ -0,0 +1,120 @@
+from booze import Coerce, Base, ParsingError
+from booze.cache import ParseCache, CacheInfo
+import pytest
+
+
+def test_cached_hits_and_misses():
+    coerce = Coerce('country').string().lowercase().length(2, 2).cached(maxsize=8)
+
+    assert coerce.parse('BR') == 'br'
+    assert coerce.parse('BR') == 'br'
+    assert coerce.parse('US') == 'us'
+    assert coerce.parse_cache.info() == CacheInfo(
+        hits=1, misses=2, evictions=0, maxsize=8, currsize=2
+    )
+
+
+def test_cached_failures():
+    coerce = Coerce('age').integer().min(18).cached()
+
+    for _ in range(3):
+        with pytest.raises(ParsingError) as info:
+            coerce.parse('10')
+        assert info.value.validation_func == 'Min'
+        assert info.value.coercer is coerce
+
+    assert coerce.parse_cache.info().hits == 2
+    assert coerce.parse_cache.info().misses == 1
+
+
+def test_cached_failures_keep_value():
+    big = 'x' * 100_000
+    coerce = Coerce('name').string().length(1, 10).cached()
+
+    for _ in range(2):
+        with pytest.raises(ParsingError) as info:
+            coerce.parse(big)
+        assert info.value.value is big
+        assert info.value._msg is None
+
+    assert coerce.parse_cache.info().hits == 1
+    assert info.value.msg.endswith('x...')
+
+
+def test_cached_mutable_results_are_copied():
+    coerce = Coerce('ages').each(Coerce().integer()).cached()
+
+    first = coerce.parse(('1', '2'))
+    first.append(3)
+    second = coerce.parse(('1', '2'))
+    assert second == [1, 2]
+    second.clear()
+    assert coerce.parse(('1', '2')) == [1, 2]
+    assert coerce.parse_cache.info().hits == 2
+
+
+def test_cached_lru_eviction():
+    coerce = Coerce().integer().cached(maxsize=2)
+    coerce.parse(1)
+    coerce.parse(2)
+    coerce.parse(1)
+    coerce.parse(3)
+
+    info = coerce.parse_cache.info()
+    assert info.evictions == 1
+    assert info.currsize == 2
+
+    coerce.parse(1)
+    assert coerce.parse_cache.info().hits == 2
+    coerce.parse(2)
+    assert coerce.parse_cache.info().misses == 4
+
+
+def test_cached_keys_include_type():
+    coerce = Coerce().string().cached()
+    with pytest.raises(ParsingError):
+        coerce.parse(1)
+    assert coerce.parse('1') == '1'
+    assert coerce.parse_cache.info().currsize == 2
+
+
+def test_cached_unhashable_bypass():
+    coerce = Coerce().list().min_length(1).cached()
+    assert coerce.parse([1, 2]) == [1, 2]
+    assert coerce.parse([1, 2]) == [1, 2]
+    assert coerce.parse_cache.info() == CacheInfo(0, 0, 0, 1024, 0)
+
+
+def test_cache_clear():
+    coerce = Coerce().integer().cached()
+    coerce.parse('1')
+    coerce.parse('1')
+    coerce.parse_cache.clear()
+    assert coerce.parse_cache.info() == CacheInfo(0, 0, 0, 1024, 0)
+
+
+def test_cache_invalid_size():
+    with pytest.raises(ValueError):
+        ParseCache(0)
+
+
+@pytest.mark.parametrize('codegen', [True, False])
+def test_cached_model_field(codegen):
+    class Event(Base, codegen=codegen):
+        status = Coerce('status').string().lowercase().cached()
+        count = Coerce('count').integer()
+
+    for count in range(5):
+        assert Event(status='OK', count=count).to_dict() == {'status': 'ok', 'count': count}
+
+    info = Event.__booze_schema__.parsers['status'].parse_cache.info()
+    assert (info.hits, info.misses) == (4, 1)
+
+
+def test_cache_pickles_empty():
+    import pickle
+    coerce = Coerce('age').integer().cached(maxsize=4)
+    coerce.parse('1')
+    copy = pickle.loads(pickle.dumps(coerce))
+    assert copy.parse_cache.info() == CacheInfo(hits=0, misses=0, evictions=0, maxsize=4, currsize=0)
+    assert copy.parse('2') == 2
@@ -0,0 +1,244 @@
+from booze import Coerce, ParsingError
+from booze.consts import date_formats
+from booze.dates import (
+    DateParser, DateTimeParser, compile_format, parse_iso_date, parse_iso_datetime,
+    parse_offset, parse_time, split_offset, SHAPE,
+)
+import datetime
+import pytest
+
+
+DATES = [
+    datetime.date(1970, 1, 1) + datetime.timedelta(days=days)
+    for days in range(0, 36000, 97)
+]
+
+
+@pytest.mark.parametrize('key', date_formats)
+def test_parser_matches_strptime(key):
+    fmt = date_formats[key]
+    parser = DateParser({key: fmt})
+    for date in DATES:
+        text = date.strftime(fmt)
+        assert parser.parse(text) == datetime.datetime.strptime(text, fmt).date()
+        assert parser.parse(text.upper()) == datetime.datetime.strptime(text.upper(), fmt).date()
+
+
+def test_parser_unpadded_fields():
+    parser = DateParser({'MM/DD/YYYY': '%m/%d/%Y'})
+    assert parser.parse('7/3/2023') == datetime.date(2023, 7, 3)
+    assert parser.parse('07/3/2023') == datetime.date(2023, 7, 3)
+
+
+def test_parser_shapes():
+    assert '07/23/2023'.translate(SHAPE) == '99/99/9999'
+    assert 'Jul-23-2023'.translate(SHAPE) == 'aaa-99-9999'
+    assert [p.shape for p in compile_format('YYYYMMDD', '%Y%m%d')] == [
+        '99999999', '9999999', '9999999', '999999',
+    ]
+
+
+@pytest.mark.parametrize('text', ['', 'not_a_date', '2023-13-13', '2023-02-30', '99/99/9999', 'Foo-01-2023'])
+def test_parser_rejects(text):
+    assert DateParser().parse(text) is None
+
+
+def test_parser_tries_formats_in_order():
+    parser = DateParser()
+    assert parser.parse('05-06-2023') == datetime.date(2023, 6, 5)
+
+
+def test_parser_ambiguous_dates_do_not_depend_on_history():
+    parser = DateParser()
+    assert parser.parse('05-06-2023') == datetime.date(2023, 6, 5)
+    # Only 'MM-DD-YYYY' accepts this one.
+    assert parser.parse('01-13-2023') == datetime.date(2023, 1, 13)
+    assert parser.parse('05-06-2023') == datetime.date(2023, 6, 5)
+
+
+def test_compile_format_errors():
+    with pytest.raises(ValueError):
+        compile_format('time', '%H:%M')
+    with pytest.raises(ValueError):
+        compile_format('no-day', '%Y-%m')
+
+
+def test_date_and_datetime_validators():
+    expected = datetime.datetime(2023, 7, 23)
+    for coerce, result in ((Coerce().date(), expected.date()), (Coerce().datetime(), expected)):
+        for key, fmt in date_formats.items():
+            parsed = coerce.parse(expected.strftime(fmt))
+            # Compact formats ('MMYYYYDD') are ambiguous with the ones before them.
+            assert type(parsed) is type(result)
+            assert parsed == result or key.isalpha()
+        with pytest.raises(ParsingError):
+            coerce.parse('23/23/2023')
+
+
+def test_format_date_raw_format():
+    coerce = Coerce().format_date('%d.%m.%Y')
+    assert coerce.parse('23.07.2023') == datetime.date(2023, 7, 23)
+    assert coerce.parse(datetime.date(2023, 7, 23)) == '23.07.2023'
+    with pytest.raises(ParsingError):
+        coerce.parse('2023-07-23')
+
+
+def test_date_returns_date():
+    coerce = Coerce().date()
+    assert coerce.parse('2023-07-23') == datetime.date(2023, 7, 23)
+    assert coerce.parse('23.07.2023') == datetime.date(2023, 7, 23)
+    assert coerce.parse(datetime.datetime(2023, 7, 23, 12, 30)) == datetime.date(2023, 7, 23)
+    assert coerce.parse(0) == datetime.date.fromtimestamp(0)
+    with pytest.raises(ParsingError):
+        coerce.parse('2023-07-23 12:34:56')
+
+
+def test_datetime_iso_fast_path():
+    coerce = Coerce().datetime()
+    expected = datetime.datetime(2023, 7, 23, 12, 34, 56)
+    assert coerce.parse('2023-07-23 12:34:56') == expected
+    assert coerce.parse('2023-07-23T12:34:56') == expected
+    assert coerce.parse('2023-07-23T12:34:56.5') == expected.replace(microsecond=500000)
+    assert coerce.parse('2023-07-23') == datetime.datetime(2023, 7, 23)
+    assert coerce.parse(expected) is expected
+    with pytest.raises(ParsingError):
+        coerce.parse('2023-07-23 25:00:00')
+
+
+def test_datetime_formats_with_time():
+    parser = DateTimeParser()
+    assert parser.parse('23.07.2023 12:34') == datetime.datetime(2023, 7, 23, 12, 34)
+    assert parser.parse('Jul/23/2023 12:34:56 PM') == datetime.datetime(2023, 7, 23, 12, 34, 56)
+    assert parser.parse('23.07.2023 12:34 AM') == datetime.datetime(2023, 7, 23, 0, 34)
+    assert parser.parse('23.07.2023 noon') is None
+    assert parser.parse('not_a_datetime_value') is None
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('00:00', datetime.time(0, 0)),
+    ('7:05:09', datetime.time(7, 5, 9)),
+    ('23:59:59.123', datetime.time(23, 59, 59, 123000)),
+    ('12:00 pm', datetime.time(12, 0)),
+    ('11:15PM', datetime.time(23, 15)),
+    ('24:00', None),
+    ('13:00 PM', None),
+    ('12:60', None),
+])
+def test_parse_time(text, expected):
+    assert parse_time(text) == expected
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize('text', [
+    '2023-07-23T12:34:56+03:00',
+    '2023-07-23 12:34:56+0300',
+    '2023-07-23T10:34:56+01',
+    '2023-07-23T09:34:56Z',
+    '2023-07-23 04:34:56 -0500',
+    '23.07.2023 09:34:56 Z',
+    '23.07.2023 12:34:56 PM +03:00',
+])
+def test_datetime_tz_normalizes_offsets(text):
+    assert Coerce().datetime(tz='UTC').parse(text) == datetime.datetime(
+        2023, 7, 23, 9, 34, 56, tzinfo=UTC)
+
+
+def test_datetime_tz_target_zone():
+    tz = datetime.timezone(datetime.timedelta(hours=-3))
+    coerce = Coerce().datetime(tz=tz)
+    result = coerce.parse('2023-07-23T12:00:00Z')
+    assert result.tzinfo is tz
+    assert result.hour == 9
+    # Values without offset are taken to be in the target timezone already.
+    assert coerce.parse('2023-07-23 12:00').hour == 12
+    assert coerce.parse(datetime.datetime(2023, 7, 23, 12)).tzinfo is tz
+    assert coerce.parse(datetime.datetime(2023, 7, 23, 12, tzinfo=UTC)).hour == 9
+    assert coerce.parse(0) == datetime.datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def test_datetime_tz_rejects_bad_offsets():
+    coerce = Coerce().datetime(tz='UTC')
+    for text in ('2023-07-23T12:00:00+25:00', '2023-07-23T12:00:00+03:7', '23.07.2023 12:00 +0x00'):
+        with pytest.raises(ParsingError):
+            coerce.parse(text)
+    with pytest.raises(ValueError):
+        Coerce().datetime(tz='Nowhere/Atlantis')
+
+
+def test_offsets_are_cached():
+    assert parse_offset('+03:00') is parse_offset('+03:00')
+    assert parse_offset('-0500').utcoffset(None) == datetime.timedelta(hours=-5)
+    assert parse_offset('+00:00') is UTC
+    assert parse_offset('+2400') is None
+    assert Coerce().datetime(tz='UTC').parse('2023-07-23T12:00:00+03:00').tzinfo is UTC
+
+
+def test_split_offset_needs_a_time():
+    assert split_offset('2023-07-23') == ('2023-07-23', None)
+    assert split_offset('12:00 +03') == ('12:00', parse_offset('+03'))
+
+
+def test_datetime_prefix_cache():
+    parser = DateTimeParser(prefix_cache=2)
+    assert parser.parse('23.07.2023 12:34:56') == datetime.datetime(2023, 7, 23, 12, 34, 56)
+    assert parser.parse('23.07.2023 23:59:59') == datetime.datetime(2023, 7, 23, 23, 59, 59)
+    assert parser.parse('23.07.2023 9:05 PM') == datetime.datetime(2023, 7, 23, 21, 5)
+    assert parser.parse('23.07.2023 24:00:00') is None
+    assert list(parser.prefixes) == ['23.07.2023']
+
+    parser.parse('24.07.2023 00:00:00')
+    parser.parse('25.07.2023')
+    assert list(parser.prefixes) == ['24.07.2023', '25.07.2023']
+    # ISO-8601 strings go through fromisoformat and are not cached.
+    parser.parse('2023-07-26 00:00:00')
+    assert '2023-07-26' not in parser.prefixes
+
+
+def test_datetime_prefix_cache_disabled():
+    parser = DateTimeParser(prefix_cache=0)
+    assert parser.parse('23.07.2023 12:34:56') == datetime.datetime(2023, 7, 23, 12, 34, 56)
+    assert parser.prefixes == {}
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('2023-07-23', datetime.datetime(2023, 7, 23)),
+    ('2023-07-23T12', datetime.datetime(2023, 7, 23, 12)),
+    ('2023-07-23t12:34', datetime.datetime(2023, 7, 23, 12, 34)),
+    ('2023-07-23 12:34:56.5', datetime.datetime(2023, 7, 23, 12, 34, 56, 500000)),
+    ('2023-07-23T12:34:56,123', datetime.datetime(2023, 7, 23, 12, 34, 56, 123000)),
+    ('2023-07-23T12:34:56.123456789', datetime.datetime(2023, 7, 23, 12, 34, 56, 123456)),
+    ('20230723T123456', datetime.datetime(2023, 7, 23, 12, 34, 56)),
+    ('20230723T1234', datetime.datetime(2023, 7, 23, 12, 34)),
+    ('2023-07-23T12:34:56Z', datetime.datetime(2023, 7, 23, 12, 34, 56, tzinfo=UTC)),
+    ('2023-07-23T12:34:56.5-0300', datetime.datetime(
+        2023, 7, 23, 12, 34, 56, 500000, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)))),
+    ('2023-07-23T12:34:56.12Z', datetime.datetime(2023, 7, 23, 12, 34, 56, 120000, tzinfo=UTC)),
+    ('2023-07-23T12:34:56.1234', datetime.datetime(2023, 7, 23, 12, 34, 56, 123400)),
+    ('2023-07-23T12:34:56.123-03:00', datetime.datetime(
+        2023, 7, 23, 12, 34, 56, 123000, tzinfo=datetime.timezone(datetime.timedelta(hours=-3)))),
+    ('2023-07-23T12+02', datetime.datetime(
+        2023, 7, 23, 12, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))),
+    ('20230723', None),
+    ('2023-W29-7', None),
+    ('2023-07-23X12:34', None),
+    ('2023-07-23T12:3', None),
+    ('2023-07-23T12:34.5', None),
+    ('2023-07-23T12:34:56.', None),
+    ('2023-07-23T12:34:56+25:00', None),
+    ('2023-07-23T24:00:00', None),
+    ('2023-02-30T00:00', None),
+    ('2023-07-23T１２:34', None),
+    ('2023-07-23T１２:34:56', None),
+    ('２０２３-07-23', None),
+])
+def test_parse_iso_datetime_forms(text, expected):
+    # The same forms are accepted on every supported Python version, whatever
+    # `fromisoformat` accepts.
+    assert parse_iso_datetime(text) == expected
+
+
+@pytest.mark.parametrize('text', ['20230723', '2023-W29-7', '2023-07-23T00', '2023-7-23'])
+def test_parse_iso_date_rejects(text):
+    assert parse_iso_date(text) is None
@@ -0,0 +1,68 @@
+from booze import Coerce, ParsingError
+from array import array
+import pytest
+
+
+def test_each_list():
+    coerce = Coerce().list().each(Coerce().integer().min(0).max(10))
+    assert coerce.parse([1, '2', 3.0]) == [1, 2, 3]
+    assert coerce.parse([]) == []
+
+
+@pytest.mark.parametrize('values, validation', [
+    ([1, -1, 2], 'Min'),
+    ([1, 11], 'Max'),
+    ([1, 'x'], 'Integer'),
+])
+def test_each_reports_element_error(values, validation):
+    element = Coerce('n').integer().min(0).max(10)
+    coerce = Coerce().list().each(element)
+    with pytest.raises(ParsingError) as info:
+        coerce.parse(values)
+    assert info.value.validation_func == validation
+    assert info.value.coercer is element
+    assert coerce.try_parse(values).error.validation_func == validation
+
+
+@pytest.mark.parametrize('value', ['abc', {'a': 1}, 5, None])
+def test_each_rejects_non_collections(value):
+    with pytest.raises(ParsingError) as info:
+        Coerce().each(Coerce().string()).parse(value)
+    assert info.value.validation_func == 'Each'
+
+
+def test_each_array_storage():
+    floats = Coerce().list().each(Coerce().float().min(0), storage='array')
+    assert floats.parse([1, 2.5]) == array('d', [1.0, 2.5])
+    ints = Coerce().list().each(Coerce().integer(), storage='array')
+    assert ints.parse(['1', 2]) == array('q', [1, 2])
+    with pytest.raises(ParsingError):
+        ints.parse([2 ** 70])
+
+
+def test_each_numpy_storage():
+    numpy = pytest.importorskip('numpy')
+    result = Coerce().list().each(Coerce().float().min(0), storage='numpy').parse([1, 2.5])
+    assert result.dtype == numpy.float64
+    assert result.tolist() == [1.0, 2.5]
+
+
+def test_each_storage_errors():
+    with pytest.raises(ValueError):
+        Coerce().each(Coerce().string(), storage='array')
+    with pytest.raises(ValueError):
+        Coerce().each(Coerce().float(), storage='tuple')
+
+
+def test_each_cached_element():
+    element = Coerce().string().lowercase().cached(maxsize=8)
+    assert Coerce().each(element).parse(['A', 'B', 'A']) == ['a', 'b', 'a']
+    assert element.parse_cache.info().hits == 1
+
+
+@pytest.mark.parametrize('storage', ['array', 'numpy'])
+def test_each_storage_keeps_non_numeric_elements_in_a_list(storage):
+    if storage == 'numpy':
+        pytest.importorskip('numpy')
+    each = Coerce().each(Coerce().integer().string(), storage=storage)
+    assert each.parse(['1', '2']) == ['1', '2']
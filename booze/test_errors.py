@@ -1,6 +1,7 @@
 from booze.errors import ParsingError
 from booze.base import Base
 from booze.coercer import Coerce
+import pytest
 
 
 
@@ -63,3 +64,41 @@ def test_parsing_error_different_validations():
             'ValidationFunction': 'validator: Strict',
             'Coercer': 'Coercer Coerce(num=30)'
         }
+
+
+def test_parsing_error_message_is_lazy():
+    coerce = Coerce('age').integer()
+    error = coerce.try_parse('abc').error
+    assert error._msg is None
+    assert error.value == 'abc'
+    assert error.msg == 'Error in validating data for value abc'
+    assert error.dict()['Error'] == error.msg
+
+
+def test_parsing_error_truncates_value():
+    big = 'x' * 5_000_000
+    with pytest.raises(ParsingError) as info:
+        Coerce('name').string().length(1, 10).parse(big)
+    assert info.value.value is big
+    assert len(info.value.msg) < 200
+    assert info.value.msg.endswith('x...')
+
+    error = ParsingError(value=list(range(1_000_000)))
+    assert error.msg == 'Error in validating data for value [0, 1, 2, 3, 4, 5, ...]'
+
+
+def test_parsing_error_max_value_length():
+    class ShortError(ParsingError):
+        max_value_length = 5
+        template = 'bad: {value}'
+
+    assert ShortError(value='abcdefgh').msg == 'bad: ab...'
+    assert ShortError(value=12).msg == 'bad: 12'
+    assert ShortError('explicit', value='abcdefgh').msg == 'explicit'
+
+
+def test_parsing_error_pickle_renders_message():
+    import pickle
+    error = pickle.loads(pickle.dumps(ParsingError(value=[1, 2], validation_func='List')))
+    assert error.msg == 'Error in validating data for value [1, 2]'
+    assert error.value is None
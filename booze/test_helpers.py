@@ -0,0 +1,62 @@
+from booze import Coerce, ParsingError
+from booze.helpers import check_numeric, to_number
+from decimal import Decimal
+from fractions import Fraction
+import pytest
+
+
+def reference_check_numeric(value):
+    for convert in (float, int):
+        try:
+            convert(value)
+            return True
+        except Exception:
+            pass
+    return False
+
+
+VALUES = [
+    0, -7, 2 ** 80, 1.5, float('nan'), float('inf'), True, False,
+    Decimal('1.25'), Decimal('NaN'), Decimal('sNaN'), Fraction(1, 3),
+    '42', '-42', '+3', '1.5', '-.5', '5.', '1e3', ' 7 ', 'inf', '1_000', '٣',
+    '', '-', '.', '1.2.3', 'abc', '0x10', '9' * 5000,
+    b'12', None, [], {}, object(),
+]
+
+
+@pytest.mark.parametrize('value', VALUES, ids=repr)
+def test_to_number_matches_check_numeric(value):
+    assert check_numeric(value) is reference_check_numeric(value)
+    number = to_number(value)
+    if number is not None and number == number:
+        assert number == float(value) or number == int(value)
+
+
+def test_to_number_types():
+    assert to_number('42') == 42 and type(to_number('42')) is int
+    assert to_number('-1.5') == -1.5
+    assert to_number(Decimal('2.5')) == 2.5
+    assert to_number(True) is True
+
+
+def test_min_max_on_numbers():
+    coerce = Coerce().min(0).max(10)
+    for value in (1, '10', 2.5, Decimal('3'), True, '1e1'):
+        assert coerce.parse(value) == value
+    for value in (0, '-1', 10.5, 'abc', None, Decimal('sNaN')):
+        with pytest.raises(ParsingError):
+            coerce.parse(value)
+
+
+def test_min_max_bad_bounds():
+    for coerce in (Coerce().min(None), Coerce().min('abc'), Coerce().max('abc')):
+        with pytest.raises(ParsingError):
+            coerce.parse(5)
+
+
+def test_min_max_compare_the_raw_value():
+    assert Coerce().integer().min(5).parse(5.2) == 5
+    with pytest.raises(ParsingError):
+        Coerce().integer().max(5).parse(5.7)
+    with pytest.raises(ParsingError):
+        Coerce().boolean().min(0).parse('True')
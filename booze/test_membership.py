@@ -0,0 +1,89 @@
+from booze import Coerce, ParsingError
+from booze.optimizer import optimize
+import pytest
+
+
+SKUS = [f'SKU-{number:05d}' for number in range(20_000)]
+
+
+def test_one_of():
+    coerce = Coerce().string().one_of(SKUS)
+    assert coerce.parse('SKU-01234') == 'SKU-01234'
+    assert isinstance(coerce.validations[-1].values, frozenset)
+    for value in ('sku-01234', 'SKU-99999', None, ['SKU-00001']):
+        with pytest.raises(ParsingError):
+            coerce.parse(value)
+
+
+def test_one_of_case_insensitive():
+    coerce = Coerce().one_of(['BR', 'PT', 'Straße', 1], case_sensitive=False)
+    for value in ('br', 'Pt', 'STRASSE', 1):
+        assert coerce.parse(value) == value
+    with pytest.raises(ParsingError):
+        coerce.parse('es')
+
+
+def test_one_of_file(tmp_path):
+    path = tmp_path / 'regions.txt'
+    path.write_text('# regions\nBR\n  PT  \n\nAO\n', encoding='utf-8')
+    coerce = Coerce().one_of(['MZ'], file=path)
+    assert coerce.validations[-1].values == {'BR', 'PT', 'AO', 'MZ'}
+    assert coerce.parse('PT') == 'PT'
+    with pytest.raises(ParsingError):
+        coerce.parse('# regions')
+
+
+def test_one_of_is_a_cheap_check():
+    coerce = Coerce().string().one_of(['a', 'b']).length(1, 1)
+    assert [type(v).__name__ for v in optimize(coerce)] == ['OneOf', 'Length', 'String']
+
+
+TAGS = [f'tag{number}' for number in range(500)]
+
+
+def test_contains_all():
+    coerce = Coerce().list().contains_all(['tag1', 'tag499', 'tag250'])
+    assert coerce.parse(TAGS) == TAGS
+    assert Coerce().contains_all([]).parse([]) == []
+    for value in (TAGS[:100], [], 5):
+        with pytest.raises(ParsingError):
+            coerce.parse(value)
+
+
+def test_contains_any():
+    coerce = Coerce().contains_any(['tag1', 'missing'])
+    assert coerce.parse(TAGS) == TAGS
+    assert coerce.parse({'tag1'}) == {'tag1'}
+    for value in (TAGS[2:], [], None):
+        with pytest.raises(ParsingError):
+            coerce.parse(value)
+
+
+def test_contains_unhashable_items():
+    value = [{'a': 1}, 'tag1', ['x']]
+    assert Coerce().contains_all(['tag1']).parse(value) is value
+    assert Coerce().contains_any(['tag1', 'tag2']).parse(value) is value
+    with pytest.raises(ParsingError):
+        Coerce().contains_all(['tag1', 'tag2']).parse(value)
+
+
+@pytest.mark.parametrize('elements', [['ab'], ['ab', 'cd'], ['ab', 'cd', 'ef'], ['ab', 'cd', 'ef', 'a']])
+def test_contains_all_strings_match_substrings(elements):
+    assert Coerce().contains_all(elements).parse('abcdef') == 'abcdef'
+    with pytest.raises(ParsingError):
+        Coerce().contains_all(elements + ['xy']).parse('abcdef')
+
+
+def test_contains_any_strings_match_substrings():
+    assert Coerce().contains_any(['xy', 'zz', 'cde']).parse('abcdef') == 'abcdef'
+    with pytest.raises(ParsingError):
+        Coerce().contains_any(['xy', 'zz', 'ace']).parse('abcdef')
+
+
+def test_contains_string_argument_is_one_element():
+    assert Coerce().contains_all('tag1').parse(TAGS) == TAGS
+    assert Coerce().contains_any('tag1').parse(TAGS) == TAGS
+    with pytest.raises(ParsingError):
+        Coerce().contains_all('abc').parse(['a', 'b', 'c'])
+    with pytest.raises(ParsingError):
+        Coerce().contains_any('abc').parse(['a'])
@@ -0,0 +1,49 @@
+from booze import Coerce, ParseResult, ParsingError
+import pytest
+
+
+def test_try_parse_ok():
+    result = Coerce().integer().min(0).try_parse('42')
+    assert result.ok and result
+    assert result.value == 42
+    assert result.error is None
+    assert result.unwrap() == 42
+
+
+def test_try_parse_error_is_lazy():
+    coerce = Coerce().integer().min(0, message='too small')
+    result = coerce.try_parse(-5)
+    assert not result.ok and not result
+    assert result.value is None
+    assert result._error is None
+
+    error = result.error
+    assert isinstance(error, ParsingError)
+    assert error.msg == 'too small'
+    assert error.validation_func == 'Min'
+    assert error.coercer is coerce
+    assert result.error is error
+    with pytest.raises(ParsingError):
+        result.unwrap()
+
+
+def test_try_parse_matches_parse():
+    coerce = Coerce().string().length(3, 5)
+    for value in ('abc', 'ab', 'abcdef', 12345):
+        result = coerce.try_parse(value)
+        try:
+            assert result.value == coerce.parse(value)
+        except ParsingError as error:
+            assert result.error.dict() == error.dict()
+            assert str(result.error) == str(error)
+
+
+def test_try_parse_cached():
+    coerce = Coerce().integer().cached(maxsize=4)
+    assert coerce.try_parse('7').value == 7
+    assert not coerce.try_parse('x')
+    assert coerce.try_parse('x').error.validation_func == 'Integer'
+
+
+def test_result_slots():
+    assert not hasattr(ParseResult(True, 1), '__dict__')
@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+from booze import Coerce, Base, ParsingError
+import sys
+import pytest
+
+
+THREADS = 8
+ITERATIONS = 2000
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    # Force the interpreter to switch threads as often as possible, so shared
+    # parse state would be interleaved between threads.
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_shared_coerce_across_threads():
+    coerce = Coerce('number').integer().min(-1).max(10 ** 9)
+
+    def work(thread: int) -> list:
+        return [
+            (str(thread * ITERATIONS + i), coerce.parse(str(thread * ITERATIONS + i)))
+            for i in range(ITERATIONS)
+        ]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        for results in pool.map(work, range(THREADS)):
+            for raw, parsed in results:
+                assert parsed == int(raw)
+
+
+def test_shared_boolean_coerce_across_threads():
+    coerce = Coerce('flag').boolean()
+
+    def work(thread: int) -> list:
+        flag = thread % 2 == 0
+        return [(flag, coerce.parse(str(flag))) for _ in range(ITERATIONS)]
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        for results in pool.map(work, range(THREADS)):
+            for flag, parsed in results:
+                assert parsed is flag
+
+
+@pytest.mark.parametrize('codegen', [True, False])
+def test_shared_model_across_threads(codegen):
+    class Reading(Base, codegen=codegen):
+        sensor = Coerce('sensor').string().length(1, 20)
+        value = Coerce('value').float().min(-1).max(10 ** 9)
+        count = Coerce('count').integer()
+
+    def work(thread: int) -> list:
+        readings = []
+        for i in range(ITERATIONS):
+            number = thread * ITERATIONS + i
+            readings.append((number, Reading(
+                sensor=f'sensor-{thread}', value=str(number), count=str(number)
+            )))
+        return readings
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        for thread, readings in enumerate(pool.map(work, range(THREADS))):
+            for number, reading in readings:
+                assert reading.to_dict() == {
+                    'sensor': f'sensor-{thread}',
+                    'value': float(number),
+                    'count': number,
+                }
+
+
+def test_errors_across_threads():
+    coerce = Coerce('number').integer()
+
+    def work(thread: int) -> int:
+        errors = 0
+        for i in range(ITERATIONS):
+            try:
+                assert coerce.parse(str(i) if thread % 2 else 'x') == i
+            except ParsingError:
+                errors += 1
+        return errors
+
+    with ThreadPoolExecutor(THREADS) as pool:
+        assert list(pool.map(work, range(THREADS))) == [
+            ITERATIONS if thread % 2 == 0 else 0 for thread in range(THREADS)
+        ]
@@ -1,25 +1,60 @@
+import inspect
 import re
 from abc import ABC, abstractmethod
 from booze.errors import *
-from booze.helpers import check_numeric
+from booze.helpers import to_number
+from booze.dates import DateParser, DateTimeParser, parse_iso_date
+from booze.nested import build, build_list
 from contextlib import suppress
 import datetime
+from array import array
 with suppress(ImportError):
     from booze.coercer import Coerce
 
-from typing import Optional
+from typing import Awaitable, Callable, Iterable, Mapping, Optional, Union
 import datetime
 import re
 
 
+class ParseContext:
+    """
+    The state of a single `Coerce.parse` call, passed to every validator of the chain.
+    Validators that coerce the value store the result in `value`, so the Coerce and its
+    validators hold no per-call state and can be shared between threads.
+
+    Args:
+        value (Any): The value being parsed.
+
+    Attributes:
+        value (Any): The coerced value so far.
+        first_value (Any): The value provided before parsing and validation.
+    """
+
+    __slots__ = ('value', 'first_value')
+
+    def __init__(self, value: any = None) -> None:
+        self.value = value
+        self.first_value = value
+
+
 class Validator:
     """
     Base class for Validators. Subclasses of Validator are registered in the Coercer class and are called
-    via the method `__call__(self, value)` to validate a value according to specific validation rules.
+    via the method `__call__(self, value, context)` to validate a value according to specific validation rules.
+    `context` is the ParseContext of the current parse call, where coercing validators store the coerced value.
     If the value does not pass the validation, a negative value is returned so that the Coercer class
     raises a ParsingError during the analysis process.
+
+    Validators with `is_async = True` are only run by `Coerce.parse_async`, which awaits
+    their `acall(value, context)` coroutine method instead.
+
+    Validators with `nested = True` build nested models; objects containing them are
+    built by `booze.nested`, which walks the nesting without recursion.
     """
 
+    is_async = False
+    nested = False
+
     def __str__(self):
         """
         Return a string representation of the Validator object.
@@ -35,7 +70,7 @@ class Integer(Validator):
     A Validator class for validating integer values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is successfully converted to an integer, False otherwise.
@@ -44,9 +79,9 @@ class Integer(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         try:
-            self.coercer.value = int(value)
+            context.value = int(value)
             return True
         except (TypeError, ValueError):
             return False
@@ -57,7 +92,7 @@ class Float(Validator):
     A Validator class for validating float values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is successfully converted to a float, False otherwise.
@@ -66,9 +101,9 @@ class Float(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         try:
-            self.coercer.value = float(value)
+            context.value = float(value)
             return True
         except (TypeError, ValueError):
             return False
@@ -76,53 +111,44 @@ class Float(Validator):
 
 class Date(Validator):
     """
-    A Validator class for validating date values.
+    A Validator class for validating and coercing date values. ISO-8601 strings are parsed
+    with `date.fromisoformat`; other strings by a DateParser built from
+    `booze.consts.date_formats`. Numbers are taken as timestamps.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
-        bool (bool): True if the value is successfully validated as a date, False otherwise.
+        bool (bool): True if the value is successfully converted to a `datetime.date`, False otherwise.
     """
 
     def __init__(self, coercer: 'Coerce'):
         from booze.consts import date_formats
         self.coercer = coercer
         self.handler = date_formats
+        self.parser = DateParser(date_formats)
 
-    def __call__(self, value: any) -> bool:
-        if isinstance(value, datetime.date):
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if isinstance(value, str):
+            date_obj = parse_iso_date(value) or self.parser.parse(value)
+            if date_obj is None:
+                return False
+            context.value = date_obj
             return True
 
-        try:
-            if isinstance(value, str):
-                datetime.datetime.strptime(value, "%Y-%m-%d")
-                return True
-        except:
-            pass
-
-        try:
-            if isinstance(value, str):
-                datetime.datetime.strptime(value, "%d-%m-%Y")
-                return True
-        except:
-            pass
+        if isinstance(value, datetime.datetime):
+            context.value = value.date()
+            return True
 
-        try:
-            if isinstance(value, str):
-                result = value.split('/')
-                if len(result) == 3:
-                    f, s, t = result
-                    if len(f) <= 4 and len(s) <= 4 and len(t) <= 4:
-                        return True
-        except:
-            pass
+        if isinstance(value, datetime.date):
+            context.value = value
+            return True
 
         try:
             if isinstance(value, (int, float)):
-                datetime.date.fromtimestamp(value)
+                context.value = datetime.date.fromtimestamp(value)
                 return True
-        except:
+        except (OverflowError, OSError, ValueError):
             pass
 
         return False
@@ -130,37 +156,46 @@ class Date(Validator):
 
 class DateTime(Validator):
     """
-    A Validator class for validating datetime values.
+    A Validator class for validating and coercing datetime values. Strings are parsed by a
+    DateTimeParser: ISO-8601 first, with `datetime.fromisoformat`, then any format of
+    `booze.consts.date_formats` optionally followed by a time of day. Numbers are taken
+    as timestamps.
+
+    With a timezone, UTC offsets ('Z', '+03:00', '-0500') are parsed and every value is
+    converted to that timezone; naive values are taken to be in it already.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
+        tz (Optional[Union[str, datetime.tzinfo]]): The timezone to normalize to, if any.
 
     Returns:
-        bool (bool): True if the value is successfully validated as a datetime, False otherwise.
+        bool (bool): True if the value is successfully converted to a `datetime.datetime`, False otherwise.
     """
 
-    def __init__(self, coercer: 'Coerce'):
+    def __init__(self, coercer: 'Coerce', tz: Optional[Union[str, datetime.tzinfo]] = None):
         from booze.consts import date_formats
         self.coercer = coercer
         self.handler = date_formats
+        self.parser = DateTimeParser(date_formats, tz)
+        self.tz = self.parser.tz
 
-    def __call__(self, value: any) -> bool:
-        if isinstance(value, datetime.datetime):
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if isinstance(value, str):
+            datetime_obj = self.parser.parse(value)
+            if datetime_obj is None:
+                return False
+            context.value = datetime_obj
             return True
 
-        try:
-            if isinstance(value, str):
-                for fmt in self.handler.values():
-                    datetime.datetime.strptime(value, fmt)
-                    return True
-        except:
-            pass
+        if isinstance(value, datetime.datetime):
+            context.value = value if self.tz is None else self.parser.localize(value)
+            return True
 
         try:
             if isinstance(value, (int, float)):
-                datetime.datetime.fromtimestamp(value)
+                context.value = datetime.datetime.fromtimestamp(value, self.tz)
                 return True
-        except:
+        except (OverflowError, OSError, ValueError):
             pass
 
         return False
@@ -171,8 +206,9 @@ class FormatDate(Validator):
     A Validator class for validating date values with a specific format.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
-        format_string (str): The format string for the date.
+        coercer (Coerce): The Coerce object the validator belongs to.
+        format_string (str): The name of a format in `booze.consts.date_formats`
+            (e.g. 'MM/DD/YYYY'), or a strptime format made of %Y, %y, %m, %d and %b.
 
     Returns:
         bool (bool): True if the value is successfully validated as a date with the specified format, False otherwise.
@@ -183,25 +219,26 @@ class FormatDate(Validator):
         self.coercer = coercer
         self.format_string = format_string
         self.handler = date_formats
+        self.format = date_formats.get(format_string, format_string)
+        self.parser = DateParser({format_string: self.format})
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         if isinstance(value, datetime.date):
-            self.coercer.value = value.strftime(self.format_string)
+            context.value = value.strftime(self.format)
+            return True
+
+        if isinstance(value, str):
+            date_obj = self.parser.parse(value)
+            if date_obj is None:
+                return False
+            context.value = date_obj
             return True
-        try:
-            if isinstance(value, str):
-                format = self.handler[self.format_string]
-                date_obj = datetime.datetime.strptime(value, format).date()
-                self.coercer.value = date_obj
-                return True
-        except (TypeError, ValueError):
-            pass
 
         try:
             if isinstance(value, (int, float)):
                 # Consider numeric values as timestamps and try to convert them to date
                 date_obj = datetime.date.fromtimestamp(value)
-                self.coercer.value = date_obj
+                context.value = date_obj
                 return True
         except (TypeError, ValueError):
             pass
@@ -214,7 +251,7 @@ class Boolean(Validator):
     A Validator class for validating boolean values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is successfully validated as a boolean, False otherwise.
@@ -223,22 +260,22 @@ class Boolean(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
-        if self.coercer.value is None:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if context.value is None:
             return False
         if isinstance(value, bool):
             return True
         elif value == 1:
-            self.coercer.value = True
+            context.value = True
             return True
         elif value == 0:
-            self.coercer.value = False
+            context.value = False
             return True
         if value == "True":
-            self.coercer.value = True
+            context.value = True
             return True
         if value == "False":
-            self.coercer.value = False
+            context.value = False
             return True
         return False
 
@@ -248,7 +285,7 @@ class String(Validator):
     A Validator class for validating string values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is successfully converted to a string, False otherwise.
@@ -257,8 +294,8 @@ class String(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
-        self.coercer.value = str(value)
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        context.value = str(value)
         return isinstance(value, str)
 
 
@@ -267,7 +304,7 @@ class Strict(Validator):
     A Validator class for strict value checking.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is strictly equal to the expected value, False otherwise.
@@ -276,8 +313,8 @@ class Strict(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
-        return self.coercer.value == value
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        return context.value == value
 
 
 class List(Validator):
@@ -285,7 +322,7 @@ class List(Validator):
     A Validator class for validating list values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is a list, False otherwise.
@@ -294,7 +331,7 @@ class List(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         return isinstance(value, list)
 
 
@@ -303,7 +340,7 @@ class Dictionary(Validator):
     A Validator class for validating dictionary values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         required_keys (Optional[list]): A list of required keys in the dictionary.
         optional_keys (Optional[list]): A list of optional keys in the dictionary.
 
@@ -316,7 +353,7 @@ class Dictionary(Validator):
         self.required_keys = required_keys
         self.optional_keys = optional_keys
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         if not isinstance(value, dict):
             return False
         items = []
@@ -335,7 +372,7 @@ class RequiredKeys(Validator):
     A Validator class for validating the presence of required keys in a dictionary.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         required_keys (list): A list of required keys in the dictionary.
 
     Returns:
@@ -346,7 +383,7 @@ class RequiredKeys(Validator):
         self.coercer = coercer
         self.required_keys = required_keys
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         if not isinstance(value, dict):
             return False
         items = []
@@ -366,8 +403,12 @@ class Min(Validator):
     """
     A Validator class for validating numeric values with a minimum value.
 
+    The raw value is compared, not the value coerced by earlier validators: with
+    `integer().min(5)`, 5.2 is accepted although it is coerced to 5. This keeps
+    the check independent of its position, so the optimizer can run it first.
+
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         value (float or int): The minimum value allowed.
 
     Returns:
@@ -377,30 +418,24 @@ class Min(Validator):
     def __init__(self, coercer: 'Coerce', value: float or int):
         self.coercer = coercer
         self.min = value
+        self.bound = None if value is None else to_number(value)
 
-    def __call__(self, value: any) -> bool:
-        try:
-            if self.min is None:
-                return False
-
-            if not check_numeric(value):
-                return False
-
-            if float(self.min) < float(value):
-                return True
-            else:
-                return False
-
-        except (TypeError, ValueError) as e:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        number = to_number(value)
+        if number is None or self.bound is None:
             return False
+        return self.bound < number
 
 
 class Max(Validator):
     """
     A Validator class for validating numeric values with a maximum value.
 
+    Like Min, it compares the raw value: with `integer().max(5)`, 5.7 is rejected
+    although it is coerced to 5.
+
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         value (float or int): The maximum value allowed.
 
     Returns:
@@ -410,17 +445,13 @@ class Max(Validator):
     def __init__(self, coercer: 'Coerce', value: float or int):
         self.coercer = coercer
         self.max = value
+        self.bound = to_number(value)
 
-    def __call__(self, value: any) -> bool:
-        try:
-            if not check_numeric(value):
-                return False
-            if float(value) > float(self.max):
-                return False
-            else:
-                return True
-        except (TypeError, ValueError):
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        number = to_number(value)
+        if number is None or self.bound is None:
             return False
+        return not number > self.bound
 
 
 class Length(Validator):
@@ -428,7 +459,7 @@ class Length(Validator):
     A Validator class for validating the length of a value.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         length_min (int): The minimum length allowed.
         length_max (int): The maximum length allowed.
 
@@ -441,7 +472,7 @@ class Length(Validator):
         self.length_min = length_min
         self.length_max = length_max
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         test = self.length_min <= len(value) <= self.length_max
         return test
 
@@ -451,7 +482,7 @@ class MinLength(Validator):
     A Validator class for validating the minimum length of a value.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         length_min (int): The minimum length allowed.
 
     Returns:
@@ -462,7 +493,7 @@ class MinLength(Validator):
         self.coercer = coercer
         self.length_min = length_min
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         test = self.length_min <= len(value)
         return test
 
@@ -472,7 +503,7 @@ class MaxLength(Validator):
     A Validator class for validating the maximum length of a value.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         length_max (int): The maximum length allowed.
 
     Returns:
@@ -483,7 +514,7 @@ class MaxLength(Validator):
         self.coercer = coercer
         self.length_max = length_max
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         test = len(value) <= self.length_max
         return test
 
@@ -493,7 +524,7 @@ class Contains(Validator):
     A Validator class for validating the presence of a value in a list.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
         value: The value to be checked for existence in the list.
 
     Returns:
@@ -504,16 +535,147 @@ class Contains(Validator):
         self.coercer = coercer
         self.value = value
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         return self.value in value
 
 
+def _element_set(elements: Iterable) -> frozenset:
+    # A single string is one element, not the set of its characters.
+    if isinstance(elements, (str, bytes)):
+        return frozenset((elements,))
+    return frozenset(elements)
+
+
+class ContainsAll(Validator):
+    """
+    A Validator class for validating that a collection contains every one of the
+    given elements. The collection is turned into a set once and checked against
+    all the elements together, instead of one scan per element (except for one or
+    two elements, where scanning is cheaper).
+
+    Strings follow the rule of Contains: a string value contains an element if
+    the element is a substring of it, and a string passed as `elements` is a
+    single element, not a collection of characters.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        elements (Iterable): The elements the collection must contain.
+
+    Returns:
+        bool (bool): True if every element is in the collection, False otherwise.
+    """
+
+    def __init__(self, coercer: 'Coerce', elements: Iterable):
+        self.coercer = coercer
+        self.elements = _element_set(elements)
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        # For one or two elements, scanning is cheaper than building the set;
+        # strings are always scanned, for substrings.
+        if len(self.elements) > 2 and not isinstance(value, (str, bytes)):
+            try:
+                return self.elements.issubset(value)
+            except TypeError:
+                # Unhashable items: fall back to one scan per element.
+                pass
+        try:
+            return all(element in value for element in self.elements)
+        except TypeError:
+            return False
+
+
+class ContainsAny(Validator):
+    """
+    A Validator class for validating that a collection contains at least one of the
+    given elements, stopping at the first item of the collection that is one of them.
+    Strings follow the same rule as in ContainsAll: substrings of a string value,
+    and a string passed as `elements` is a single element.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        elements (Iterable): The elements the collection must contain one of.
+
+    Returns:
+        bool (bool): True if any element is in the collection, False otherwise.
+    """
+
+    def __init__(self, coercer: 'Coerce', elements: Iterable):
+        self.coercer = coercer
+        self.elements = _element_set(elements)
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if not isinstance(value, (str, bytes)):
+            try:
+                return not self.elements.isdisjoint(value)
+            except TypeError:
+                pass
+        # Strings and unhashable items: one scan per element.
+        try:
+            return any(element in value for element in self.elements)
+        except TypeError:
+            return False
+
+
+class OneOf(Validator):
+    """
+    A Validator class for validating that a value is one of a set of allowed values.
+    The allowed values are frozen into a frozenset once, so each check is a single
+    hash lookup however many values are allowed.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        values (Iterable): The allowed values.
+        case_sensitive (bool): If False, strings are compared casefolded, both the
+            allowed values and the checked ones.
+
+    Returns:
+        bool (bool): True if the value is one of the allowed values, False otherwise.
+    """
+
+    def __init__(self, coercer: 'Coerce', values: Iterable, case_sensitive: bool = True):
+        self.coercer = coercer
+        self.case_sensitive = case_sensitive
+        if case_sensitive:
+            self.values = frozenset(values)
+        else:
+            self.values = frozenset(
+                value.casefold() if isinstance(value, str) else value for value in values
+            )
+
+    @staticmethod
+    def load(path: Union[str, 'os.PathLike']) -> list:
+        """
+        Read allowed values from a text file: one value per line, with surrounding
+        whitespace stripped; blank lines and lines starting with '#' are skipped.
+
+        Args:
+            path (Union[str, os.PathLike]): The path of the file.
+
+        Returns:
+            list[str]: The values.
+        """
+        with open(path, encoding='utf-8') as file:
+            return [
+                line for line in map(str.strip, file)
+                if line and not line.startswith('#')
+            ]
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if not self.case_sensitive and isinstance(value, str):
+            value = value.casefold()
+        try:
+            return value in self.values
+        except TypeError:
+            # Unhashable values cannot be in the set.
+            return False
+
+
 class Email(Validator):
     """
     A Validator class for validating email addresses.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is a valid email address, False otherwise.
@@ -522,7 +684,7 @@ class Email(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         email_regex = r'^[\w\.-]+@[\w\.-]+\.\w+$'
         return re.match(email_regex, value) is not None
 
@@ -532,7 +694,7 @@ class Lowercase(Validator):
     A Validator class for converting a value to lowercase.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is successfully converted to lowercase, False otherwise.
@@ -541,9 +703,9 @@ class Lowercase(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
         try:
-            self.coercer.value = value.lower()
+            context.value = value.lower()
             return True
         except:
             return False
@@ -554,7 +716,7 @@ class Numeric(Validator):
     A Validator class for validating numeric values.
 
     Args:
-        coercer (Coerce): The Coerce object to store the coerced value.
+        coercer (Coerce): The Coerce object the validator belongs to.
 
     Returns:
         bool (bool): True if the value is numeric, False otherwise.
@@ -563,5 +725,255 @@ class Numeric(Validator):
     def __init__(self, coercer: 'Coerce'):
         self.coercer = coercer
 
-    def __call__(self, value: any) -> bool:
-        return check_numeric(value)
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        return to_number(value) is not None
+
+
+class Each(Validator):
+    """
+    A Validator class for validating and coercing every element of a collection with
+    another Coerce. The element chain runs in a tight loop: it is optimized once (see
+    `booze.optimizer`) and a single ParseContext is reused for every element; the
+    first invalid element raises the element Coerce's ParsingError.
+
+    With `storage`, the coerced elements of an `integer()` or `float()` chain are stored
+    compactly instead of as a list of boxed numbers: in an `array.array` ('array') or a
+    NumPy array ('numpy'), of 64-bit integers or floats. If the coerced elements are
+    not all numbers, they are kept in a list.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        element (Coerce): The Coerce validating each element.
+        storage (Optional[str]): None for a list, 'array' or 'numpy'.
+
+    Returns:
+        bool (bool): True if the value is iterable and every element is valid, False otherwise.
+
+    Raises:
+        ParsingError: If an element fails validation.
+    """
+
+    STORAGES = (None, 'array', 'numpy')
+
+    def __init__(self, coercer: 'Coerce', element: 'Coerce', storage: Optional[str] = None):
+        from booze.optimizer import optimize
+        if storage not in self.STORAGES:
+            raise ValueError(f'Unknown storage {storage!r}; use one of {self.STORAGES}.')
+        self.coercer = coercer
+        self.element = element
+        self.storage = storage
+        self.chain = tuple(optimize(element) or element.validations)
+        self.optimized = self.chain != tuple(element.validations)
+
+        self.typecode = None
+        if storage is not None:
+            kinds = {type(validation) for validation in element.validations}
+            if Float in kinds:
+                self.typecode = 'd'
+            elif Integer in kinds:
+                self.typecode = 'q'
+            else:
+                raise ValueError('Compact storage needs an integer() or float() element chain.')
+            if storage == 'numpy':
+                from booze.columnar import numpy
+                if numpy is None:
+                    raise ImportError("storage='numpy' requires NumPy to be installed.")
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if isinstance(value, (str, bytes, Mapping)):
+            return False
+        try:
+            items = iter(value)
+        except TypeError:
+            return False
+
+        element = self.element
+        if element.parse_cache is not None:
+            result = [element.parse(item) for item in items]
+        else:
+            result = self._parse_all(items)
+        context.value = self._store(result) if self.storage else result
+        return True
+
+    def _parse_all(self, items) -> list:
+        element = self.element
+        chain = self.chain
+        optimized = self.optimized
+        result = []
+        append = result.append
+        item_context = ParseContext()
+        for item in items:
+            item_context.value = item_context.first_value = item
+            try:
+                for validation in chain:
+                    if validation(item, item_context) == False:
+                        break
+                else:
+                    append(item_context.value)
+                    continue
+            except Exception:
+                if not optimized:
+                    raise
+            # Rejected: the original chain raises the exact error.
+            append(element.parse(item))
+        return result
+
+    def _store(self, result: list):
+        try:
+            if self.storage == 'numpy':
+                from booze.columnar import numpy
+                # NumPy would also convert numeric strings, which `array` refuses.
+                if not all(type(item) in (int, float, bool) for item in result):
+                    return result
+                dtype = numpy.float64 if self.typecode == 'd' else numpy.int64
+                return numpy.array(result, dtype=dtype)
+            return array(self.typecode, result)
+        except OverflowError:
+            raise self.coercer._error(self, result) from None
+        except (TypeError, ValueError):
+            # Elements that are not numbers (e.g. coerced by a later validator of
+            # the element chain): keep the list.
+            return result
+
+
+class Model(Validator):
+    """
+    A Validator class for validating and coercing a nested model: a mapping of field
+    values is built into an instance of a Base subclass, without recursion however
+    deep the nesting (see `booze.nested`). Instances of the model are kept as they
+    are, without being validated again.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        model (type): The Base subclass.
+
+    Returns:
+        bool (bool): True if the value is an instance of the model or a mapping, False otherwise.
+
+    Raises:
+        ParsingError: If a field of the mapping, at any depth, fails validation.
+    """
+
+    nested = True
+    many = False
+
+    def __init__(self, coercer: 'Coerce', model: type):
+        self.coercer = coercer
+        self.model = model
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if isinstance(value, self.model):
+            context.value = value
+            return True
+        if not isinstance(value, Mapping):
+            return False
+        context.value = build(self.model, value)
+        return True
+
+
+class ListOf(Validator):
+    """
+    A Validator class for validating and coercing a list of nested models: every item,
+    a mapping of field values or an instance of the model, is built like with `Model`.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        model (type): The Base subclass.
+
+    Returns:
+        bool (bool): True if the value is a list, False otherwise.
+
+    Raises:
+        ParsingError: If an item is neither a mapping nor an instance of the model, or
+            if a field of an item, at any depth, fails validation.
+    """
+
+    nested = True
+    many = True
+
+    def __init__(self, coercer: 'Coerce', model: type):
+        self.coercer = coercer
+        self.model = model
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        if not isinstance(value, list):
+            return False
+        context.value = build_list(self.model, value, self.coercer, self)
+        return True
+
+
+class Custom(Validator):
+    """
+    A Validator class that delegates the validation to a user-defined function.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        function (Callable[[Any], bool]): The function called with the value.
+
+    Returns:
+        bool (bool): The result of the function.
+    """
+
+    def __init__(self, coercer: 'Coerce', function: Callable[[any], bool]):
+        self.coercer = coercer
+        self.function = function
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        result = self.function(value)
+        if result is True or result is False:
+            return result
+        if inspect.isawaitable(result):
+            # An async callable `is_async_callable` could not detect: an
+            # un-awaited coroutine is truthy, so it must not pass as valid.
+            if hasattr(result, 'close'):
+                result.close()
+            raise TypeError(
+                f'The custom validator of {self.coercer} returned an awaitable; '
+                'use `Coerce.parse_async` or `Base.parse_async` to parse it.'
+            )
+        return result
+
+
+def is_async_callable(function: Callable) -> bool:
+    """
+    Whether calling `function` returns a coroutine: `async def` functions, and
+    objects whose `__call__` is `async def`.
+
+    Args:
+        function (Callable): The callable to inspect.
+
+    Returns:
+        bool: True if the callable is async, False otherwise.
+    """
+    return (inspect.iscoroutinefunction(function)
+            or inspect.iscoroutinefunction(getattr(function, '__call__', None)))
+
+
+class AsyncCustom(Validator):
+    """
+    A Validator class that delegates the validation to a user-defined `async def`
+    function, for I/O-bound checks. It is awaited by `Coerce.parse_async`; the
+    synchronous parsing path refuses it.
+
+    Args:
+        coercer (Coerce): The Coerce object the validator belongs to.
+        function (Callable[[Any], Awaitable[bool]]): The coroutine function awaited with the value.
+
+    Returns:
+        bool (bool): The awaited result of the function.
+    """
+
+    is_async = True
+
+    def __init__(self, coercer: 'Coerce', function: Callable[[any], Awaitable[bool]]):
+        self.coercer = coercer
+        self.function = function
+
+    def __call__(self, value: any, context: 'ParseContext') -> bool:
+        raise TypeError(
+            f'{self.coercer} has async validators; '
+            'use `Coerce.parse_async` or `Base.parse_async` to parse it.'
+        )
+
+    async def acall(self, value: any, context: 'ParseContext') -> bool:
+        return await self.function(value)
@@ -0,0 +1,80 @@
+from booze import Coerce, Base, ParsingError
+import asyncio
+import pytest
+
+
+class Tracker:
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    def check(self, allowed):
+        async def validator(value):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            await asyncio.sleep(0.01)
+            self.running -= 1
+            return value in allowed
+        return validator
+
+
+def make_model(tracker):
+    class Order(Base):
+        sku = Coerce('sku').string().custom(tracker.check({'A1', 'B2'}))
+        region = Coerce('region').string().custom(tracker.check({'EU', 'US'}))
+        warehouse = Coerce('warehouse').string().custom(tracker.check({'W1'}))
+        quantity = Coerce('quantity').integer().min(0)
+    return Order
+
+
+ORDER = {'sku': 'A1', 'region': 'EU', 'warehouse': 'W1', 'quantity': '3'}
+
+
+def test_parse_async():
+    Order = make_model(Tracker())
+    order = asyncio.run(Order.parse_async(ORDER))
+    assert order.to_dict() == {'sku': 'A1', 'region': 'EU', 'warehouse': 'W1', 'quantity': 3}
+
+
+def test_parse_async_concurrent_fields():
+    tracker = Tracker()
+    asyncio.run(make_model(tracker).parse_async(ORDER))
+    assert tracker.peak == 3
+
+
+def test_parse_async_concurrency_limit():
+    tracker = Tracker()
+    asyncio.run(make_model(tracker).parse_async(ORDER, concurrency=2))
+    assert tracker.peak == 2
+
+    tracker = Tracker()
+    asyncio.run(make_model(tracker).parse_async(ORDER, concurrency=1))
+    assert tracker.peak == 1
+
+
+@pytest.mark.parametrize('changes', [
+    {'sku': 'ZZ'},
+    {'quantity': 'many'},
+    {'coupon': 'FREE'},
+])
+def test_parse_async_errors(changes):
+    Order = make_model(Tracker())
+    with pytest.raises(ParsingError):
+        asyncio.run(Order.parse_async({**ORDER, **changes}))
+
+
+def test_parse_async_sync_model():
+    class Person(Base):
+        name = Coerce('name').string()
+        age = Coerce('age').integer()
+
+    assert Person.__booze_schema__.async_fields == frozenset()
+    person = asyncio.run(Person.parse_async({'name': 'John', 'age': '30'}))
+    assert person.to_dict() == {'name': 'John', 'age': 30}
+
+
+def test_sync_constructor_rejects_async_model():
+    Order = make_model(Tracker())
+    assert Order.__booze_schema__.async_fields == {'sku', 'region', 'warehouse'}
+    with pytest.raises(TypeError):
+        Order(**ORDER)
@@ -0,0 +1,94 @@
+from booze import Coerce, Base, ParsingError
+import pytest
+
+
+def make_models():
+    fields = dict(
+        name=Coerce('name').string().length(3, 10),
+        age=Coerce('age').integer().min(18).max(100),
+        is_active=Coerce('active').boolean(),
+        tags=Coerce('tags').list().contains('python'),
+    )
+    Generated = type('Generated', (Base,), dict(fields))
+    Interpreted = type('Interpreted', (Base,), dict(fields), codegen=False)
+    return Generated, Interpreted
+
+
+def test_codegen_switch():
+    Generated, Interpreted = make_models()
+    assert Generated.__booze_codegen__ is True
+    assert Interpreted.__booze_codegen__ is False
+    assert hasattr(Generated.__new__, '__booze_source__')
+    assert not hasattr(Interpreted.__new__, '__booze_source__')
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(name='John', age=30, is_active=True, tags=['python']),
+    dict(name='John', age='30', is_active=1, tags=['python', 'rust']),
+    dict(age=50.0),
+    dict(is_active='False'),
+    dict(),
+])
+def test_codegen_matches_interpreted(kwargs):
+    Generated, Interpreted = make_models()
+    generated, interpreted = Generated(**kwargs), Interpreted(**kwargs)
+    assert generated.to_dict() == interpreted.to_dict()
+    assert generated.__dict__ == interpreted.__dict__
+
+
+@pytest.mark.parametrize('kwargs', [
+    dict(name='Jo'),
+    dict(age=15),
+    dict(age='abc'),
+    dict(is_active='yes'),
+    dict(tags=['rust']),
+    dict(unknown=1),
+])
+def test_codegen_errors_match_interpreted(kwargs):
+    Generated, Interpreted = make_models()
+    with pytest.raises(ParsingError) as generated:
+        Generated(**kwargs)
+    with pytest.raises(ParsingError) as interpreted:
+        Interpreted(**kwargs)
+    assert generated.value.dict() == interpreted.value.dict()
+
+
+def test_codegen_subclass_gets_own_constructor():
+    Generated, _ = make_models()
+
+    class Child(Generated, codegen=False):
+        email = Coerce('email').string().email()
+
+    class GrandChild(Child):
+        pass
+
+    assert Child.__booze_codegen__ is False
+    assert GrandChild.__booze_codegen__ is True
+    obj = GrandChild(name='John', email='john@example.com')
+    assert obj.to_dict()['email'] == 'john@example.com'
+    with pytest.raises(ParsingError):
+        Generated(email='john@example.com')
+
+
+def test_codegen_skips_keyword_fields():
+    Model = type('Model', (Base,), {'class': Coerce().string(), 'name': Coerce().string()})
+    assert Model.__booze_codegen__ is False
+    obj = Model(**{'class': 'A', 'name': 'B'})
+    assert getattr(obj, 'class') == 'A'
+
+
+@pytest.mark.parametrize('codegen', [True, False])
+def test_validator_added_after_class_creation(codegen):
+    class Late(Base, codegen=codegen):
+        age = Coerce('age').integer()
+
+    class Child(Late):
+        pass
+
+    assert Late(age=150).age == 150
+    Late.age.max(100)
+    for model in (Late, Child):
+        with pytest.raises(ParsingError):
+            model(age=150)
+        assert not model.try_create(age=150).ok
+        assert model.parse_many([{'age': 150}], errors=[]) == []
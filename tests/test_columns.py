@@ -0,0 +1,90 @@
+from array import array
+from booze import Coerce, Base, ParsingError
+from booze import columnar
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(17).max(100)
+    score = Coerce('score').float().min(0).max(10)
+    is_active = Coerce('active').boolean()
+
+
+COLUMNS = {
+    'name': ['John', 'Jo', 'Mary', 'Alice', 'Bob'],
+    'age': [30, 40, 15, 101, 18],
+    'score': [1.5, 2.0, 9.5, 3.0, float('nan')],
+    'is_active': [True, False, True, 'yes', 1],
+}
+
+
+@pytest.fixture(params=['array', 'numpy'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(columnar, 'numpy', None)
+    return request.param
+
+
+def test_validate_columns(backend):
+    mask, failures = Person.validate_columns(COLUMNS)
+    assert [bool(flag) for flag in mask] == [True, False, False, False, False]
+    assert failures == {
+        'name': [1],
+        'age': [2, 3],
+        'score': [4],
+        'is_active': [3],
+    }
+
+
+def test_validate_columns_matches_rows(backend):
+    mask, _ = Person.validate_columns(COLUMNS)
+    rows = [dict(zip(COLUMNS, values)) for values in zip(*COLUMNS.values())]
+    for flag, row in zip(mask, rows):
+        try:
+            Person(**row)
+            assert flag
+        except ParsingError:
+            assert not flag
+
+
+def test_validate_columns_array_input(backend):
+    mask, failures = Person.validate_columns({
+        'age': array('q', [18, 50, 5]),
+        'score': array('d', [0.5, 11.0, 5.0]),
+    })
+    assert [bool(flag) for flag in mask] == [True, False, False]
+    assert failures == {'age': [2], 'score': [1]}
+
+
+def test_validate_columns_string_numbers_fall_back(backend):
+    mask, failures = Person.validate_columns({'age': ['30', 'abc', '10']})
+    assert [bool(flag) for flag in mask] == [True, False, False]
+    assert failures == {'age': [1, 2]}
+
+
+def test_validate_columns_non_finite_integer(backend):
+    _, failures = Person.validate_columns({'age': [30.0, float('nan'), float('inf')]})
+    assert failures == {'age': [1, 2]}
+
+
+def test_validate_columns_errors(backend):
+    with pytest.raises(ParsingError):
+        Person.validate_columns({'email': ['a@b.com']})
+
+    with pytest.raises(ValueError):
+        Person.validate_columns({'name': ['John'], 'age': [30, 40]})
+
+
+def test_validate_columns_empty(backend):
+    mask, failures = Person.validate_columns({})
+    assert len(mask) == 0
+    assert failures == {}
+
+
+def test_validate_columns_huge_integers(backend):
+    mask, failures = Person.validate_columns({'age': [30, 10**400, 2**70]})
+    assert [bool(flag) for flag in mask] == [True, False, False]
+    assert failures == {'age': [1, 2]}
@@ -0,0 +1,250 @@
+from booze import Coerce, Base, IngestStats, ParsingError
+from booze.ingest import line_index
+import io
+import mmap
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(18).max(100)
+
+
+class InterpretedPerson(Person, codegen=False):
+    pass
+
+
+LINES = [
+    '{"name": "John", "age": 30}',
+    '{"name": "Jo", "age": 30}',
+    '',
+    '{"name": "Mary", "age": "45"',
+    '[1, 2]',
+    '{"name": "Alice", "age": 45}',
+]
+JSONL = '\n'.join(LINES) + '\n'
+
+
+@pytest.fixture(params=[Person, InterpretedPerson])
+def model(request):
+    return request.param
+
+
+def test_iter_parse_jsonl_is_lazy(model):
+    people = model.iter_parse_jsonl(io.BytesIO(b'{"name": "John", "age": 30}\n'))
+    assert not isinstance(people, list)
+    assert [person.name for person in people] == ['John']
+
+
+def test_iter_parse_jsonl_reports_line_numbers(model):
+    errors = []
+    people = list(model.iter_parse_jsonl(
+        io.BytesIO(JSONL.encode()), on_error=lambda line, error: errors.append((line, error))
+    ))
+    assert [person.name for person in people] == ['John', 'Alice']
+    assert [line for line, _ in errors] == [2, 4, 5]
+    assert all(isinstance(error, ParsingError) for _, error in errors)
+    assert errors[1][1].validation_func == 'JSON'
+
+
+def test_iter_parse_jsonl_writes_rejects(model, tmp_path):
+    source = tmp_path / 'people.jsonl'
+    source.write_text(JSONL)
+    rejects = tmp_path / 'rejects.jsonl'
+    people = list(model.iter_parse_jsonl(source, rejects=rejects))
+    assert len(people) == 2
+    assert rejects.read_text().splitlines() == [LINES[1], LINES[3], LINES[4]]
+
+
+def test_iter_parse_jsonl_text_streams(model):
+    rejects = io.StringIO()
+    people = list(model.iter_parse_jsonl(io.StringIO(JSONL), rejects=rejects))
+    assert len(people) == 2
+    assert rejects.getvalue().splitlines() == [LINES[1], LINES[3], LINES[4]]
+
+
+def test_iter_parse_jsonl_raises_without_sink(model):
+    people = model.iter_parse_jsonl(io.BytesIO(JSONL.encode()))
+    assert next(people).name == 'John'
+    with pytest.raises(ParsingError):
+        next(people)
+
+
+def test_iter_parse_jsonl_stats(model):
+    stats = IngestStats()
+    list(model.iter_parse_jsonl(io.BytesIO(JSONL.encode()), on_error=lambda *_: None, stats=stats))
+    assert (stats.records, stats.valid, stats.invalid) == (5, 2, 3)
+    assert stats.elapsed > 0
+    assert stats.records_per_second > 0
+
+
+def test_iter_parse_jsonl_rejects_undecodable_lines(model):
+    rejects = io.BytesIO()
+    source = io.BytesIO(b'{"name": "John", "age": 30}\n{"name": "\xff"}\n')
+    people = list(model.iter_parse_jsonl(source, rejects=rejects))
+    assert len(people) == 1
+    assert rejects.getvalue() == b'{"name": "\xff"}\n'
+
+
+def test_iter_parse_jsonl_rejects_deeply_nested_lines(model):
+    errors = []
+    source = io.StringIO('[' * 100_000 + '\n{"name": "John", "age": 30}\n')
+    people = list(model.iter_parse_jsonl(source, on_error=lambda *args: errors.append(args)))
+    assert [person.name for person in people] == ['John']
+    assert len(errors) == 1
+    assert errors[0][0] == 1
+    assert 'Invalid JSON on line 1' in errors[0][-1].msg
+
+
+class Employee(Base):
+    name = Coerce('nome').string().length(3, 10)
+    age = Coerce('idade').integer().min(18).max(100)
+    admission = Coerce().format_date('%Y-%m-%d')
+
+
+CSV = (
+    'idade,nome,extra,admission\n'
+    '30,John,x,2020-01-31\n'
+    '30,Jo,x,2020-01-31\n'
+    '\n'
+    '45,Mary,x\n'
+    'old,Alice,x,2020-01-31\n'
+    '"45","Bob, Jr",x,2021-06-01\n'
+)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 1000])
+def test_iter_parse_csv_maps_columns_by_name(chunk_size):
+    errors = []
+    people = list(Employee.iter_parse_csv(
+        io.StringIO(CSV, newline=''), chunk_size=chunk_size,
+        on_error=lambda row, error: errors.append((row, error)),
+    ))
+    assert [(person.name, person.age) for person in people] == [('John', 30), ('Bob, Jr', 45)]
+    assert people[0].admission.year == 2020
+    assert [row for row, _ in errors] == [2, 4, 5]
+    assert errors[1][1].validation_func == 'CSV'
+
+
+def test_iter_parse_csv_writes_rejects(tmp_path):
+    source = tmp_path / 'people.csv'
+    source.write_text(CSV)
+    rejects = tmp_path / 'rejects.csv'
+    stats = IngestStats()
+    people = list(Employee.iter_parse_csv(source, rejects=rejects, stats=stats))
+    assert len(people) == 2
+    assert rejects.read_text().splitlines() == [
+        'idade,nome,extra,admission', '30,Jo,x,2020-01-31', '45,Mary,x', 'old,Alice,x,2020-01-31',
+    ]
+    assert (stats.records, stats.valid, stats.invalid) == (5, 2, 3)
+
+
+def test_iter_parse_csv_rejects_invalid_utf8(tmp_path):
+    source = tmp_path / 'people.csv'
+    source.write_bytes(b'idade,nome\n30,Jo\xffn\n45,Mary\n')
+    rejects = tmp_path / 'rejects.csv'
+    errors = []
+    people = list(Employee.iter_parse_csv(
+        source, rejects=rejects, on_error=lambda row, error: errors.append((row, error)),
+    ))
+    assert [person.name for person in people] == ['Mary']
+    assert [(row, error.msg) for row, error in errors] == [(1, 'Row 1 is not valid UTF-8')]
+    assert rejects.read_bytes() == b'idade,nome\r\n30,Jo\xffn\r\n'
+
+    with pytest.raises(ParsingError):
+        list(Employee.iter_parse_csv(source))
+
+
+def test_iter_parse_csv_raises_without_sink():
+    people = Employee.iter_parse_csv(io.StringIO(CSV, newline=''))
+    assert next(people).name == 'John'
+    with pytest.raises(ParsingError):
+        next(people)
+
+
+def test_iter_parse_csv_delimiter_and_field_names(model):
+    people = list(model.iter_parse_csv(io.StringIO('name;age\nJohn;30\n'), delimiter=';'))
+    assert [(person.name, person.age) for person in people] == [('John', 30)]
+
+
+def test_iter_parse_csv_rejects_duplicate_columns():
+    with pytest.raises(ValueError):
+        list(Employee.iter_parse_csv(io.StringIO('nome,name\nJohn,John\n')))
+
+
+def write_events(path, n):
+    with open(path, 'w') as file:
+        for i in range(n):
+            age = 10 if i % 7 == 0 else 30
+            file.write(f'{{"name": "user{i % 1000}", "age": {age}}}\n' if i % 11 else 'not json\n')
+
+
+def test_line_index_splits_on_line_boundaries(tmp_path):
+    path = tmp_path / 'events.jsonl'
+    write_events(path, 100)
+    data = path.read_bytes()
+    with open(path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        ranges = list(line_index(mapped, 200))
+    assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+    for (_, end, _), (start, _, first_line) in zip(ranges, ranges[1:]):
+        assert end == start and data[end - 1:end] == b'\n'
+        assert first_line == data[:start].count(b'\n') + 1
+
+
+@pytest.mark.parametrize('chunk_bytes', [64, 1000, 2**20])
+def test_validate_jsonl_parallel_matches_streaming(tmp_path, chunk_bytes):
+    path = tmp_path / 'events.jsonl'
+    write_events(path, 300)
+    expected_errors, expected_rejects = [], io.BytesIO()
+    valid = sum(1 for _ in Person.iter_parse_jsonl(
+        path, on_error=lambda line, error: expected_errors.append((line, str(error))),
+        rejects=expected_rejects,
+    ))
+
+    errors, rejects, stats = [], io.BytesIO(), IngestStats()
+    reports = list(Person.validate_jsonl_parallel(
+        path, workers=2, chunk_bytes=chunk_bytes, rejects=rejects, stats=stats,
+        on_error=lambda line, error: errors.append((line, str(error))),
+    ))
+    assert sum(report.valid for report in reports) == stats.valid == valid
+    assert sum(report.lines for report in reports) == 300
+    assert errors == expected_errors
+    assert rejects.getvalue() == expected_rejects.getvalue()
+
+
+def test_validate_jsonl_parallel_empty_file(tmp_path):
+    path = tmp_path / 'empty.jsonl'
+    path.write_bytes(b'')
+    assert list(Person.validate_jsonl_parallel(path, workers=1)) == []
+
+
+def test_iter_parse_jsonl_path_with_invalid_utf8(tmp_path):
+    source = tmp_path / 'people.jsonl'
+    source.write_bytes(b'{"name": "\xff"}\n{"name": "John", "age": 30}\n')
+    errors = []
+    people = list(Person.iter_parse_jsonl(source, on_error=lambda line, error: errors.append(line)))
+    assert [person.name for person in people] == ['John']
+    assert errors == [1]
+
+
+def test_iter_parse_jsonl_rejects_keep_invalid_bytes(tmp_path):
+    source = tmp_path / 'people.jsonl'
+    source.write_bytes(b'{"name": "\xff"}\n')
+    rejects = tmp_path / 'rejects.jsonl'
+    assert list(Person.iter_parse_jsonl(source, rejects=rejects)) == []
+    assert rejects.read_bytes() == b'{"name": "\xff"}\n'
+
+
+class Flag(Base):
+    name = Coerce('name').string()
+    active = Coerce('active').boolean()
+
+
+def test_iter_parse_csv_booleans():
+    source = io.StringIO('name,active\na,true\nb,FALSE\nc,1\nd,0\ne,True\nf,yes\n')
+    errors = []
+    flags = list(Flag.iter_parse_csv(source, on_error=lambda row, error: errors.append(row)))
+    assert [(flag.name, flag.active) for flag in flags] == [
+        ('a', True), ('b', False), ('c', True), ('d', False), ('e', True),
+    ]
+    assert errors == [6]
@@ -0,0 +1,131 @@
+from booze import Coerce, Base, ParsingError, ParsingErrors
+import pytest
+
+
+class Address(Base):
+    street = Coerce('street').string().min_length(3)
+    zip = Coerce('zip').string().length(5, 5)
+
+
+class Item(Base):
+    sku = Coerce('sku').string()
+    quantity = Coerce('quantity').integer().min(0)
+
+
+class Customer(Base):
+    name = Coerce('name').string()
+    address = Coerce('address').model(Address)
+
+
+class Order(Base):
+    customer = Coerce('customer').model(Customer)
+    items = Coerce('items').list().list_of(Item)
+
+
+class SlottedOrder(Base, slots=True):
+    customer = Coerce('customer').model(Customer)
+    items = Coerce('items').list_of(Item)
+
+
+PAYLOAD = {
+    'customer': {'name': 'John', 'address': {'street': 'Main St', 'zip': '12345'}},
+    'items': [{'sku': 'A1', 'quantity': '2'}, {'sku': 'B2', 'quantity': 1}],
+}
+
+
+@pytest.mark.parametrize('model', [Order, SlottedOrder])
+def test_nested_models(model):
+    order = model(**PAYLOAD)
+    assert isinstance(order.customer, Customer)
+    assert isinstance(order.customer.address, Address)
+    assert order.customer.address.zip == '12345'
+    assert [item.quantity for item in order.items] == [2, 1]
+
+
+def test_nested_instances_are_not_revalidated():
+    address = Address(street='Main St', zip='12345')
+    # Invalidate the instance behind the validators' back: it must be kept as is.
+    address.zip = 'bad'
+    customer = Customer(name='John', address=address)
+    assert customer.address is address
+
+    item = Item(sku='A1', quantity=1)
+    order = Order(customer=customer, items=[item, {'sku': 'B2', 'quantity': 3}])
+    assert order.customer is customer
+    assert order.items[0] is item
+
+
+@pytest.mark.parametrize('payload, validation', [
+    ({'customer': {'name': 'John', 'address': {'street': 'Main St', 'zip': '1'}}}, 'Length'),
+    ({'customer': {'name': 'John', 'address': 'Main St'}}, 'Model'),
+    ({'customer': {'name': 'John', 'phone': '555'}}, 'Initializing'),
+    ({'items': [{'sku': 'A1', 'quantity': -1}]}, 'Min'),
+    ({'items': [{'sku': 'A1', 'quantity': 1}, 'B2']}, 'ListOf'),
+    ({'items': 'A1'}, 'List'),
+])
+def test_nested_errors(payload, validation):
+    with pytest.raises(ParsingError) as info:
+        Order(**payload)
+    assert info.value.validation_func == validation
+    result = Order.try_create(**payload)
+    assert not result
+    assert result.error.validation_func == validation
+
+
+def test_deep_nesting_without_recursion():
+    depth = 1500
+    model = Address
+    for level in range(depth):
+        model = type(Base)(f'Level{level}', (Base,), {
+            'level': Coerce().integer(),
+            'child': Coerce().model(model),
+        })
+
+    data = {'street': 'Main St', 'zip': '12345'}
+    for level in range(depth):
+        data = {'level': level, 'child': data}
+
+    obj = model(**data)
+    for level in reversed(range(depth)):
+        assert obj.level == level
+        obj = obj.child
+    assert obj.zip == '12345'
+
+
+def test_large_list_of_nested_objects():
+    items = [
+        {'customer': {'name': f'c{i}', 'address': {'street': 'Main St', 'zip': '12345'}}}
+        for i in range(10_000)
+    ]
+
+    class Batch(Base):
+        orders = Coerce().list_of(Order)
+
+    batch = Batch(orders=items)
+    assert len(batch.orders) == 10_000
+    assert batch.orders[-1].customer.name == 'c9999'
+
+
+@pytest.mark.parametrize('model', [Order, SlottedOrder])
+def test_validate_all_reports_nested_paths(model):
+    payload = {
+        'customer': {'name': 'John', 'address': {'street': 'St', 'zip': '123'}},
+        'items': [{'sku': 'A1', 'quantity': 2}, {'sku': 'B2', 'quantity': -1}, 'C3'],
+    }
+    with pytest.raises(ParsingErrors) as info:
+        model.validate_all(**payload)
+    assert [(error.field, error.validator) for error in info.value] == [
+        ('customer.address.street', 'MinLength'),
+        ('customer.address.zip', 'Length'),
+        ('items[1].quantity', 'Min'),
+        ('items[2]', 'ListOf'),
+    ]
+    assert repr(model.validate_all(**PAYLOAD)) == repr(model(**PAYLOAD))
+
+
+def test_validate_all_nested_type_errors():
+    with pytest.raises(ParsingErrors) as info:
+        Order.validate_all(customer='John', items={'sku': 'A1'}, extra=1)
+    assert [(error.field, error.validator) for error in info.value] == [
+        ('customer', 'Model'), ('items', 'List'), ('extra', 'Initializing'),
+    ]
@@ -0,0 +1,72 @@
+from booze import Coerce, Base, ParsingError
+from booze import validators
+from booze.optimizer import optimize, Range, LengthRange
+import pytest
+
+
+def test_optimize_fuses_min_max():
+    coerce = Coerce().integer().strict().min(18).max(100)
+    chain = optimize(coerce)
+    assert [type(v) for v in chain] == [Range, validators.Integer, validators.Strict]
+    assert (chain[0].lower, chain[0].upper) == (18.0, 100.0)
+
+
+def test_optimize_fuses_lengths():
+    coerce = Coerce().string().min_length(2).max_length(10).length(3, 12)
+    chain = optimize(coerce)
+    assert [type(v) for v in chain] == [LengthRange, validators.String]
+    assert (chain[0].length_min, chain[0].length_max) == (3, 10)
+
+
+def test_optimize_cheap_checks_first():
+    coerce = Coerce().string().email().lowercase().length(5, 50)
+    assert [type(v) for v in optimize(coerce)] == [
+        validators.Length, validators.String, validators.Lowercase, validators.Email,
+    ]
+
+
+def test_optimize_drops_redundant_conversions():
+    coerce = Coerce().float().float().numeric()
+    assert [type(v) for v in optimize(coerce)] == [validators.Float]
+
+
+def test_optimize_keeps_unchanged_and_unknown_chains():
+    assert optimize(Coerce().integer().strict()) is None
+    assert optimize(Coerce().integer().min(1).max(2).custom(lambda v: True)) is None
+    assert not any(type(v) is Range for v in optimize(Coerce().integer().min(None)))
+
+
+CHAINS = {
+    'age': Coerce('age').integer().strict().min(18).max(100),
+    'score': Coerce('score').numeric().float().min(0).max(10).min(1),
+    'name': Coerce('name').string().email().lowercase().min_length(6).max_length(30),
+    'tags': Coerce('tags').list().contains('python').length(1, 3).min_length(2),
+    'flag': Coerce('flag').boolean().max(1).strict(),
+    'count': Coerce('count').integer().integer().numeric().max(10),
+}
+
+VALUES = [
+    None, True, False, 0, 1, 17, 18, 19, 50, 100, 101, 10 ** 400, -1.5, 0.5, 5.0, 10.0,
+    float('nan'), float('inf'), '0', '18', '30', 'abc', '', 'John@Example.com',
+    'a@b.co', 'not an email', [], ['python'], ['python', 'go'], ['go', 'rust'],
+    ['python', 'go', 'rust', 'c'], {'a': 1}, (1, 2),
+]
+
+
+def outcome(model, field, value):
+    try:
+        return 'ok', getattr(model(**{field: value}), field)
+    except ParsingError as error:
+        return 'error', error.dict()
+    except Exception as error:
+        return 'exception', type(error)
+
+
+@pytest.mark.parametrize('field', CHAINS)
+def test_optimized_chains_match_original(field):
+    Optimized = type('Optimized', (Base,), {field: CHAINS[field]})
+    Interpreted = type('Interpreted', (Base,), {field: CHAINS[field]}, codegen=False)
+    assert '_v0_0(value, context) == False or' in Optimized.__new__.__booze_source__
+
+    for value in VALUES:
+        assert outcome(Optimized, field, value) == outcome(Interpreted, field, value), value
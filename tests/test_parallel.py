@@ -0,0 +1,80 @@
+from booze import Coerce, Base, ParsingError
+from booze.parallel import chunked
+import pickle
+import pytest
+
+
+class Reading(Base):
+    sensor = Coerce('sensor').string().length(1, 20)
+    value = Coerce('value').float().min(-1).max(100)
+
+
+class SlottedReading(Base, slots=True):
+    sensor = Coerce('sensor').string().length(1, 20)
+    value = Coerce('value').float().min(-1).max(100)
+
+
+class CachedReading(Base):
+    sensor = Coerce('sensor').string().length(1, 20).cached()
+    value = Coerce('value').float().min(-1).max(100).cached()
+
+
+def make_records(n):
+    return [{'sensor': f's{i}', 'value': i % 150} for i in range(n)]
+
+
+def test_chunked():
+    assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+    assert list(chunked([], 3)) == []
+    with pytest.raises(ValueError):
+        list(chunked(range(3), 0))
+
+
+def test_parsing_error_pickle():
+    with pytest.raises(ParsingError) as info:
+        Reading(value=1000)
+    error = pickle.loads(pickle.dumps(info.value))
+    assert error.dict() == info.value.dict()
+
+
+@pytest.mark.parametrize('model', [Reading, SlottedReading])
+def test_parse_many_workers_keeps_order(model):
+    records = [{'sensor': f's{i}', 'value': i % 100} for i in range(250)]
+    readings = model.parse_many(records, workers=2, chunksize=16)
+    assert [r.to_dict() for r in readings] == [
+        model(**record).to_dict() for record in records
+    ]
+
+
+def test_parse_many_workers_collect_errors():
+    records = make_records(400)
+    errors = []
+    readings = Reading.parse_many(records, workers=2, chunksize=32, errors=errors)
+
+    expected_errors = [i for i, r in enumerate(records) if r['value'] > 100]
+    assert [index for index, _ in errors] == expected_errors
+    assert all(error.validation_func == 'Max' for _, error in errors)
+    assert len(readings) == len(records) - len(expected_errors)
+    assert [r.sensor for r in readings] == [
+        r['sensor'] for r in records if r['value'] <= 100
+    ]
+
+
+def test_parse_many_workers_fail_fast():
+    with pytest.raises(ParsingError):
+        Reading.parse_many(make_records(400), workers=2, chunksize=32)
+
+
+def test_parse_many_workers_lazy():
+    readings = Reading.parse_many(iter(make_records(100)), workers=2, chunksize=10, lazy=True)
+    assert next(readings).sensor == 's0'
+    assert len(list(readings)) == 99
+
+
+def test_parse_many_workers_cached_field_errors():
+    records = [{'sensor': 's', 'value': i % 150} for i in range(300)]
+    errors = []
+    readings = CachedReading.parse_many(records, errors=errors, workers=2, chunksize=32)
+    assert len(readings) == 202
+    assert [index for index, _ in errors] == [i for i in range(300) if i % 150 > 100]
+    assert errors[0][1].dict()['Field'] == 'value'
@@ -0,0 +1,79 @@
+from booze import Coerce, Base, ParsingError
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(18).max(100)
+
+
+class InterpretedPerson(Person, codegen=False):
+    pass
+
+
+RECORDS = [
+    {'name': 'John', 'age': 30},
+    {'name': 'Jo', 'age': 30},
+    {'name': 'Mary', 'age': '45'},
+    {'name': 'Alice', 'age': 15},
+    {'name': 'Bob', 'age': 99},
+]
+
+
+@pytest.fixture(params=[Person, InterpretedPerson])
+def model(request):
+    return request.param
+
+
+def test_parse_many_valid(model):
+    people = model.parse_many([RECORDS[0], RECORDS[2]])
+    assert isinstance(people, list)
+    assert [p.to_dict() for p in people] == [
+        {'name': 'John', 'age': 30},
+        {'name': 'Mary', 'age': 45},
+    ]
+
+
+def test_parse_many_fail_fast(model):
+    with pytest.raises(ParsingError):
+        model.parse_many(RECORDS)
+
+
+def test_parse_many_collect_errors(model):
+    errors = []
+    people = model.parse_many(RECORDS, errors=errors)
+    assert [p.name for p in people] == ['John', 'Mary', 'Bob']
+    assert [index for index, _ in errors] == [1, 3]
+    assert all(isinstance(error, ParsingError) for _, error in errors)
+    assert errors[0][1].validation_func == 'Length'
+    assert errors[1][1].validation_func == 'Min'
+
+
+def test_parse_many_lazy(model):
+    consumed = []
+
+    def records():
+        for record in RECORDS:
+            consumed.append(record)
+            yield record
+
+    errors = []
+    people = model.parse_many(records(), lazy=True, errors=errors)
+    assert consumed == []
+    assert next(people).name == 'John'
+    assert len(consumed) == 1
+    assert [p.name for p in people] == ['Mary', 'Bob']
+    assert len(errors) == 2
+
+
+def test_parse_many_lazy_fail_fast(model):
+    people = model.parse_many(RECORDS, lazy=True)
+    assert next(people).name == 'John'
+    with pytest.raises(ParsingError):
+        next(people)
+
+
+def test_parse_many_unknown_field(model):
+    errors = []
+    assert model.parse_many([{'name': 'John', 'email': 'x'}], errors=errors) == []
+    assert len(errors) == 1
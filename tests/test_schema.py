@@ -0,0 +1,56 @@
+from booze import Coerce, Base, ParsingError
+from booze.schema import Schema
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 30)
+    age = Coerce().integer().min(0).max(130)
+
+    def greeting(self):
+        return f'Hello, {self.name}'
+
+
+class Employee(Person):
+    company = Coerce('company').string()
+
+
+def test_schema_compiled_at_class_creation():
+    schema = Person.__booze_schema__
+    assert isinstance(schema, Schema)
+    assert schema.fields == ('name', 'age')
+    assert schema.keys == frozenset({'name', 'age'})
+    assert schema.coercers == (Person.__dict__['name'], Person.__dict__['age'])
+
+
+def test_schema_reused_between_instances():
+    schema = Person.__booze_schema__
+    Person(name='John', age=30)
+    Person(name='Mary', age=40)
+    assert Person.__booze_schema__ is schema
+    assert 'to_dict' not in Person.__dict__
+
+
+def test_schema_names_unnamed_coercers():
+    assert Person.__booze_schema__.parsers['age'].name == 'age'
+
+
+def test_schema_ignores_methods():
+    obj = Person(name='John', age=30)
+    assert obj.greeting() == 'Hello, John'
+    assert obj.to_dict() == {'name': 'John', 'age': 30}
+
+
+def test_schema_inherits_parent_fields():
+    assert Employee.__booze_schema__.fields == ('name', 'age', 'company')
+
+    obj = Employee(name='John', age=30, company='ACME')
+    assert obj.to_dict() == {'name': 'John', 'age': 30, 'company': 'ACME'}
+
+    with pytest.raises(ParsingError):
+        Person(name='John', age=30, company='ACME')
+
+
+def test_repeated_construction():
+    for age in range(1, 100):
+        assert Person(name='John', age=age).age == age
@@ -0,0 +1,67 @@
+from booze import Coerce, Base, ParsingError
+import pickle
+import pytest
+
+
+class Point(Base, slots=True):
+    x = Coerce('x').float().min(-100).max(100)
+    y = Coerce('y').float().min(-100).max(100)
+
+
+class Point3D(Point, slots=True):
+    z = Coerce('z').float()
+
+
+class Measure(Base, slots=True, codegen=False):
+    label = Coerce('label').string().length(1, 10)
+    value = Coerce('value').integer()
+
+
+def test_slots_instances_have_no_dict():
+    point = Point(x=1.5, y=2)
+    assert not hasattr(point, '__dict__')
+    assert Point.__slots__ == ('x', 'y')
+    assert point.x == 1.5
+    assert point.y == 2.0
+
+
+def test_slots_schema():
+    assert Point.__booze_schema__.fields == ('x', 'y')
+    assert Point3D.__booze_schema__.fields == ('x', 'y', 'z')
+    assert Point3D.__slots__ == ('z',)
+    assert not hasattr(Point3D(x=1, y=2, z=3), '__dict__')
+
+
+def test_slots_repr_and_to_dict():
+    point = Point3D(x=1.5, y=2.5, z=3.5)
+    assert repr(point) == '<Point3D(x=1.5, y=2.5, z=3.5)>'
+    assert str(point) == repr(point)
+    assert point.to_dict() == {'x': 1.5, 'y': 2.5, 'z': 3.5}
+
+
+def test_slots_unset_fields_are_skipped():
+    point = Point(x=1.5)
+    assert point.to_dict() == {'x': 1.5}
+    assert repr(point) == '<Point(x=1.5)>'
+
+
+def test_slots_interpreted_constructor():
+    measure = Measure(label='temp', value='21')
+    assert measure.to_dict() == {'label': 'temp', 'value': 21}
+    assert not hasattr(measure, '__dict__')
+
+    with pytest.raises(ParsingError):
+        Measure(label='', value=1)
+
+
+def test_slots_validation():
+    with pytest.raises(ParsingError):
+        Point(x=1000, y=0)
+
+    with pytest.raises(ParsingError):
+        Point(x=1, y=2, z=3)
+
+
+def test_slots_pickle():
+    point = pickle.loads(pickle.dumps(Point3D(x=1, y=2, z=3)))
+    assert point.to_dict() == {'x': 1.0, 'y': 2.0, 'z': 3.0}
@@ -0,0 +1,55 @@
+from booze import Coerce, Base, ParsingError
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(18).max(100)
+
+
+class SlottedPerson(Base, slots=True):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(18).max(100)
+
+
+class InterpretedPerson(Person, codegen=False):
+    pass
+
+
+class CachedPerson(Base):
+    name = Coerce('name').string().length(3, 10).cached()
+    age = Coerce('age').integer().min(18).max(100)
+
+
+MODELS = [Person, SlottedPerson, InterpretedPerson, CachedPerson]
+
+
+@pytest.mark.parametrize('model', MODELS)
+def test_try_create_ok(model):
+    result = model.try_create(name='John', age='30')
+    assert result.ok
+    assert isinstance(result.value, model)
+    assert result.value.to_dict() == model(name='John', age='30').to_dict()
+
+
+@pytest.mark.parametrize('model', MODELS)
+@pytest.mark.parametrize('kwargs', [
+    {'name': 'John', 'age': 15},
+    {'name': 'Jo', 'age': 30},
+    {'name': 'John', 'age': 'abc'},
+    {'name': None, 'age': 30},
+])
+def test_try_create_error(model, kwargs):
+    result = model.try_create(**kwargs)
+    assert not result
+    with pytest.raises(ParsingError) as info:
+        model(**kwargs)
+    assert result.error.dict() == info.value.dict()
+    assert result.error.validation_func == info.value.validation_func
+
+
+@pytest.mark.parametrize('model', MODELS)
+def test_try_create_unknown_field(model):
+    result = model.try_create(name='John', height=1.8)
+    assert not result
+    assert 'Coercer' in result.error.msg
@@ -0,0 +1,55 @@
+from booze import Coerce, Base, ParsingError, ParsingErrors
+from booze.errors import FieldError
+import pickle
+import pytest
+
+
+class Person(Base):
+    name = Coerce('name').string().length(3, 10)
+    age = Coerce('age').integer().min(18).max(100)
+    email = Coerce('email').email()
+
+
+def test_validate_all_valid():
+    person = Person.validate_all(name='John', age='30', email='john@example.com')
+    assert person.to_dict() == {'name': 'John', 'age': 30, 'email': 'john@example.com'}
+
+
+def test_validate_all_collects_every_field():
+    with pytest.raises(ParsingErrors) as info:
+        Person.validate_all(name='Jo', age=15, email='john@example.com', height=1.8)
+    errors = info.value
+    assert len(errors) == 3
+    assert [error.field for error in errors] == ['name', 'age', 'height']
+    assert [error.validator for error in errors] == ['Length', 'Min', 'Initializing']
+    assert errors.dict()['Errors'][1] == {
+        'Field': 'age',
+        'ValidationFunction': 'Min',
+        'Error': 'Error in validating data for value 15',
+    }
+    assert 'name (Length)' in str(errors)
+
+
+def test_validate_all_is_a_parsing_error():
+    with pytest.raises(ParsingError):
+        Person.validate_all(name='Jo')
+
+
+def test_field_error_matches_constructor_error():
+    with pytest.raises(ParsingErrors) as info:
+        Person.validate_all(age='abc')
+    with pytest.raises(ParsingError) as single:
+        Person(age='abc')
+    assert info.value.errors[0].error.dict() == single.value.dict()
+
+
+def test_field_error_paths():
+    assert FieldError(('items', 0, 'price'), None).field == 'items[0].price'
+    assert FieldError(('address', 'zip'), None).field == 'address.zip'
+
+
+def test_parsing_errors_pickle():
+    with pytest.raises(ParsingErrors) as info:
+        Person.validate_all(name='Jo', age=15)
+    copy = pickle.loads(pickle.dumps(info.value))
+    assert copy.dict() == info.value.dict()